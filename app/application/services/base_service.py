@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Hashable, Iterable, Optional, Sequence
 import asyncio
-import json
+import contextvars
+import functools
+import threading
+from time import perf_counter
+from concurrent.futures import Future
 import requests
 
+from app.domain.fields.field_selection import URL_FIELDS, FieldSelection
+from app.domain.keys.resource_key import ResourceKey, ResourceRef, SwapiResource, as_key, cache_key, key_for, parse_ids, resource_of, to_url
+from app.infrastructure.cache.co_access import CoAccessTracker
+from app.infrastructure.cache.hot_keys import HotKeyTracker
+from app.infrastructure.cache.interning import intern_payload
+from app.domain.numeric.numeric_projection import numeric_projection
 from app.infrastructure.cache.memory_cache import MemoryCache
+from app.infrastructure.columnar.columnar_table import ColumnarTable, MatchFilter, RangeFilter, SortKey
+from app.infrastructure.graph.relationship_graph import RELATIONS
+from app.infrastructure.metrics.swapi_metrics import record_upstream, watch_cache, watch_inflight
+from app.infrastructure.profiling.request_profile import profile_stage, record_lookup
+from app.infrastructure.tracing.tracer import SpanKind, tracer
+
+
+def _linked_values(value: object) -> Iterable[object]:
+    if isinstance(value, list):
+        return value
+    return (value,) if value else ()
+
+
+class PageRows(list):
+    """`results` of a SWAPI page held in the payload cache: the same list object while the page stays cached."""
+
+    __slots__ = ()
 
 
 class BaseSwapiService:
@@ -17,37 +44,124 @@ class BaseSwapiService:
     cache_ttl_seconds = 300.0
     _cache = MemoryCache(ttl_seconds=cache_ttl_seconds)
 
-    def _build_cache_key(self, url: str, params: Dict[str, Any] | None) -> str:
-        if not params:
-            return url
+    # Nome do recurso na SWAPI (ex.: "planets"), usado pela projeção numérica
+    resource_name: str = ""
+    # Campo textual ordenado pelo parâmetro `order` (asc/desc)
+    sort_field: str = "name"
+    # Colunas categóricas (codificadas por dicionário) disponíveis para ordenação
+    categorical_fields: tuple[str, ...] = ()
+    # Sufixo dos filtros `min_<sufixo>`/`max_<sufixo>` -> campo numérico projetado
+    range_filters: Dict[str, str] = {}
+    # Filtros de igualdade sobre colunas categóricas (parâmetro com o mesmo nome do campo)
+    match_filters: tuple[str, ...] = ()
+    # Parâmetro `<relação>_id` -> campo de relacionamento usado nos filtros por junção
+    join_filters: Dict[str, str] = {}
+    # Campos comparados com o termo de busca quando a consulta é respondida pelo grafo
+    search_fields: tuple[str, ...] = ("name",)
+    _table_cache = MemoryCache(ttl_seconds=cache_ttl_seconds)
+    # Requisições à SWAPI em andamento: chamadas concorrentes para a mesma chave aguardam a primeira
+    _inflight: Dict[Hashable, Future] = {}
+    _inflight_lock = threading.Lock()
+    # Frequência de acesso por chave, usada para reaquecer o cache antes de expirar
+    _hot_keys = HotKeyTracker()
+    # Coacesso entre recursos (ex.: pessoa -> planeta natal), usado na pré-busca após a resposta
+    _co_access = CoAccessTracker()
+    # Probabilidade mínima de acesso seguinte para pré-buscar um item relacionado
+    prefetch_threshold = 0.3
+    # Observações por relação antes de generalizar a taxa para itens ainda sem histórico
+    prefetch_min_samples = 5
+    # Máximo de itens pré-buscados por resposta e de requisições simultâneas
+    prefetch_limit = 16
+    prefetch_concurrency = 4
 
-        serialized = json.dumps(params, sort_keys=True, default=str)
-        return f"{url}?{serialized}"
+    @classmethod
+    def configure_cache(cls, ttl_seconds: float, max_entries: int, table_max_entries: int) -> None:
+        """Applies the TTL and LRU limits (0 = unbounded) to the shared payload and table caches."""
 
-    def _resolve_payload(self, url: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        BaseSwapiService.cache_ttl_seconds = ttl_seconds
+        BaseSwapiService._cache.configure(ttl_seconds, max_entries)
+        BaseSwapiService._table_cache.configure(ttl_seconds, table_max_entries)
+
+    def _build_cache_key(self, url: ResourceRef, params: Dict[str, Any] | None) -> Hashable:
+        # http/https, barra final e query string embutida resultam na mesma chave
+        return cache_key(url, params)
+
+    def _resolve_payload(self, url: ResourceRef, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Fetches and validates a SWAPI resource payload."""
 
         if not url:
             raise ValueError("A SWAPI URL must be provided to resolve the entity")
 
-        cache_key = self._build_cache_key(url, params)
-        cached = self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+        with tracer.start_span("swapi.resolve_payload") as span:
+            cache_key = self._build_cache_key(url, params)
+            if span.recording:
+                span.set_attribute("swapi.url", to_url(url))
+            self._hot_keys.record(cache_key, url, params)
+            cached = self._cache.get(cache_key)
+            record_lookup(cached is not None)
+            span.set_attribute("swapi.cache_hit", cached is not None)
+            if cached is not None:
+                span.set_attribute("swapi.source", "cache")
+                return cached
 
-        response = requests.get(
-            url,
-            params=params,
-            timeout=self.request_timeout_seconds,
-        )
-        response.raise_for_status()
+            with self._inflight_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    span.set_attribute("swapi.source", "cache")
+                    return cached
+                inflight = self._inflight.get(cache_key)
+                if inflight is None:
+                    leader = self._inflight[cache_key] = Future()
+
+            if inflight is not None:
+                # Outra thread já busca a mesma chave: espera o resultado dela
+                span.set_attribute("swapi.source", "inflight")
+                return inflight.result()
+
+            span.set_attribute("swapi.source", "upstream")
+            try:
+                payload = self._fetch_payload(url, params)
+                self._cache.set(cache_key, payload)
+                leader.set_result(payload)
+                return payload
+            except BaseException as exc:
+                leader.set_exception(exc)
+                raise
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(cache_key, None)
+
+    def _fetch_payload(self, url: ResourceRef, params: Dict[str, Any] | None) -> Dict[str, Any]:
+        resource = resource_of(url)
+        status = "error"
+        started = perf_counter()
+        with tracer.start_span("GET swapi", kind=SpanKind.CLIENT) as span:
+            if span.recording:
+                span.set_attribute("http.request.method", "GET")
+                span.set_attribute("url.full", to_url(url))
+                span.set_attribute("swapi.resource", resource.value if resource else "other")
+            try:
+                response = requests.get(
+                    to_url(url),
+                    params=params,
+                    timeout=self.request_timeout_seconds,
+                )
+                code = getattr(response, "status_code", None)
+                status = str(code) if isinstance(code, int) else "unknown"
+                if isinstance(code, int):
+                    span.set_attribute("http.response.status_code", code)
+                response.raise_for_status()
+            finally:
+                record_upstream(resource.value if resource else "other", status, perf_counter() - started)
 
         payload = response.json()
         if not isinstance(payload, dict):
             raise ValueError("SWAPI returned a payload that cannot be mapped to an entity")
 
-        self._cache.set(cache_key, payload)
-
+        payload = intern_payload(payload)
+        results = payload.get("results")
+        if isinstance(results, list):
+            payload["results"] = PageRows(results)
         return payload
     
     # def _resolve_related(
@@ -57,14 +171,294 @@ class BaseSwapiService:
     # ) -> list[object]:
     #     return [service.resolve_url(item_url) for item_url in urls]
 
+    def _in_executor(self, call: Any, *args: Any) -> asyncio.Future:
+        """`run_in_executor` that carries the request context (metrics) into the worker thread."""
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None, functools.partial(contextvars.copy_context().run, call, *args))
+
     async def _resolve_related_async(
         self,
         service: BaseSwapiService,
-        urls: Iterable[str],
+        urls: Iterable[ResourceRef],
+        fields: Optional[FieldSelection] = None,
     ) -> list[object]:
         if not urls:
             return []
 
-        loop = asyncio.get_running_loop()
-        tasks = [loop.run_in_executor(None, service.resolve_url, url) for url in urls]
+        tasks = [self._in_executor(functools.partial(service.resolve_url, url, fields=fields)) for url in urls]
         return await asyncio.gather(*tasks)
+
+    async def _resolve_relation(
+        self,
+        service: BaseSwapiService,
+        urls: list[ResourceRef],
+        relation: str,
+        requested: Optional[bool],
+        fields: Optional[FieldSelection],
+    ) -> list[object]:
+        """Hydrates `relation` when requested (flag or nested `fields=`) and the URL alone is not enough."""
+
+        if fields is not None:
+            if not fields.includes(relation):
+                return urls
+            requested = requested or relation in fields.nested
+        if not requested or not urls:
+            return urls
+
+        child = fields.child(relation) if fields is not None else None
+        if child is not None and child.url_only():
+            # Só a URL foi pedida: a chave já a fornece, sem buscar o recurso
+            return [service._instance_payload({"url": url}, child) for url in urls]
+        with tracer.start_span(f"hydrate {relation}") as span:
+            if span.recording:
+                span.set_attribute("swapi.resource", self.resource_name)
+                span.set_attribute("swapi.relation", relation)
+                span.set_attribute("swapi.related_count", len(urls))
+            return await self._resolve_related_async(service, urls, child)
+
+    async def _expand_entities(self, entities: list[Any], query_params: object) -> list[Any]:
+        """Applies multi-level `expand=` on top of the one-level relationship flags."""
+
+        value = getattr(query_params, "expand", None)
+        if not value or not entities:
+            return entities
+
+        # Import local para evitar ciclo: expansion_service -> dataset_service -> base_service
+        from app.application.services.expansion.expansion_service import ExpansionService
+
+        service = ExpansionService()
+        with profile_stage("expand"):
+            return await service.expand(self.resource_name, entities, service.plan(self.resource_name, value))
+
+    async def prefetch_related(self, entities: Iterable[Any]) -> int:
+        """Records the links served in a response and prefetches those likely to be requested next.
+
+        Meant to run after the response is sent (FastAPI `BackgroundTasks`);
+        returns how many payloads were fetched into the cache.
+        """
+
+        candidates: dict[ResourceKey, None] = {}
+        for entity in entities:
+            source = as_key(getattr(entity, "url", None))
+            if source is None:
+                continue
+            self._co_access.served(source)
+            for relation in RELATIONS.get(source.resource.value, {}):
+                edge = (source.resource.value, relation)
+                for value in _linked_values(getattr(entity, relation, None)):
+                    target = as_key(value)
+                    if target is None:
+                        # Relação já hidratada nesta requisição: o coacesso aconteceu
+                        hydrated = as_key(getattr(value, "url", None))
+                        if hydrated is not None:
+                            self._co_access.accessed(source, edge, hydrated)
+                        continue
+                    self._co_access.expose(source, edge, target)
+                    if self._co_access.probability(source, edge, target, self.prefetch_min_samples) >= self.prefetch_threshold:
+                        candidates[target] = None
+
+        keys = [key for key in candidates if self._cache.get(cache_key(key, None)) is None][: self.prefetch_limit]
+        if not keys:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.prefetch_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def _prefetch(key: ResourceKey) -> bool:
+            async with semaphore:
+                return await loop.run_in_executor(None, self._prefetch_payload, key)
+
+        return sum(await asyncio.gather(*[_prefetch(key) for key in keys]))
+
+    def _prefetch_payload(self, key: ResourceKey) -> bool:
+        # Não passa por `_resolve_payload`: a pré-busca não conta como acesso
+        entry_key = cache_key(key, None)
+        if self._cache.get(entry_key) is not None:
+            return False
+        try:
+            self._cache.set(entry_key, self._fetch_payload(key, None))
+        except Exception:
+            # Pré-busca é só uma otimização: a requisição real refaz a busca e reporta o erro
+            return False
+        return True
+
+    def _sparse_payload(
+        self,
+        payload: dict[str, object],
+        fields: Optional[FieldSelection],
+    ) -> dict[str, object]:
+        """Keeps only the selected attributes (plus `url`); the others stay at their DTO defaults."""
+
+        if fields is None:
+            return payload
+        # `url` identifica o item para `expand=` e pré-busca; a serialização com `fields=` o omite se não pedido
+        return {name: value for name, value in payload.items() if name in fields.names or name in URL_FIELDS}
+
+    async def _gather_payloads(self, url: str, query_params: Any) -> list[dict[str, object]]:
+        """Collects payloads from SWAPI, by id list, or from the relationship graph for join filters."""
+
+        ids = parse_ids(getattr(query_params, "ids", None))
+        constraints = [
+            (relation, value)
+            for param, relation in self.join_filters.items()
+            if (value := getattr(query_params, param, None)) is not None
+        ]
+        if not constraints:
+            # Só buscas pedidas pelo cliente contam como coacesso (hidratação, expand e pré-busca não)
+            if ids is None:
+                self._co_access.observe(self._build_cache_key(url, self._build_search_params(query_params)))
+                return self._collect_payloads(url, query_params)
+            resource = SwapiResource(self.resource_name)
+            for item_id in ids:
+                self._co_access.observe(key_for(resource, item_id))
+            return self._filter_by_search(await self._payloads_by_id(ids), query_params)
+
+        # Import local para evitar ciclo: graph_service -> dataset_service -> base_service
+        from app.application.services.graph.graph_service import GraphService
+
+        graph, index = await GraphService().snapshot()
+        by_id = index.get(self.resource_name, {})
+        item_id = getattr(query_params, "id", None)
+        allowed = set(ids) if ids is not None else ({item_id} if item_id is not None else None)
+        payloads = [
+            by_id[node_id]
+            for node_id in graph.join(self.resource_name, constraints).tolist()
+            if node_id in by_id and (allowed is None or node_id in allowed)
+        ]
+        return self._filter_by_search(payloads, query_params)
+
+    async def _payloads_by_id(self, ids: list[int]) -> list[dict[str, object]]:
+        """Resolves `ids=1,2,3` concurrently, in the requested order; unknown ids are skipped."""
+
+        resource = SwapiResource(self.resource_name)
+        results = await asyncio.gather(
+            *[self._in_executor(self._resolve_payload, key_for(resource, item_id)) for item_id in ids],
+            return_exceptions=True,
+        )
+
+        payloads = []
+        for result in results:
+            if isinstance(result, requests.HTTPError) and getattr(result.response, "status_code", None) == 404:
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            payloads.append(result)
+        return payloads
+
+    def _filter_by_search(self, payloads: list[dict[str, object]], query_params: Any) -> list[dict[str, object]]:
+        search = self._build_search_params(query_params)
+        if not search:
+            return payloads
+
+        term = str(search["search"]).lower()
+        return [
+            payload for payload in payloads
+            if any(term in str(payload.get(name) or "").lower() for name in self.search_fields)
+        ]
+
+    def _table_filters(self, query_params: object) -> list[RangeFilter | MatchFilter]:
+        """Translates `min_*`/`max_*` and categorical query params into table filters."""
+
+        parsers = numeric_projection.fields(self.resource_name)
+        filters: list[RangeFilter | MatchFilter] = []
+        for suffix, field_name in self.range_filters.items():
+            low = getattr(query_params, f"min_{suffix}", None)
+            high = getattr(query_params, f"max_{suffix}", None)
+            if low is None and high is None:
+                continue
+            parser = parsers[field_name]
+            filters.append(RangeFilter(
+                field_name,
+                parser(low) if low is not None else None,
+                parser(high) if high is not None else None,
+            ))
+
+        for field_name in self.match_filters:
+            value = getattr(query_params, field_name, None)
+            if value:
+                filters.append(MatchFilter(field_name, value))
+        return filters
+
+    def _sort_keys(self, order_by: Optional[str], order: Optional[str]) -> list[SortKey]:
+        """Parses `order_by=-population,name`; `order` sets the default direction."""
+
+        normalized = order.strip().lower() if isinstance(order, str) else ""
+        descending = normalized == "desc"
+        if not order_by or not isinstance(order_by, str):
+            if normalized in {"asc", "desc"}:
+                return [SortKey(self.sort_field, descending)]
+            return []
+
+        keys = []
+        for token in order_by.split(","):
+            token = token.strip()
+            if token.startswith("-"):
+                keys.append(SortKey(token[1:].strip(), True))
+            elif token:
+                keys.append(SortKey(token, descending))
+        return keys
+
+    def _build_table(self, rows: Sequence[Any]) -> ColumnarTable:
+        projections = [numeric_projection.project(self.resource_name, row) for row in rows]
+        numeric = {
+            name: [projection[name] for projection in projections]
+            for name in numeric_projection.fields(self.resource_name)
+        }
+        categorical = {
+            name: [row.get(name) if isinstance(row, dict) else getattr(row, name, None) for row in rows]
+            for name in (self.sort_field, *self.categorical_fields)
+        }
+        return ColumnarTable(len(rows), numeric, categorical)
+
+    def _table_for(self, payloads: list[dict[str, object]]) -> ColumnarTable:
+        """Reuses the table built for a cached SWAPI result list."""
+
+        if type(payloads) is not PageRows:
+            # Listas montadas na requisição (id único, ids=, junções, busca local) não se repetem: tabela descartável
+            return self._build_table(payloads)
+
+        # A lista fica referenciada na entrada, então o id não é reaproveitado enquanto ela existir
+        entry = self._table_cache.get(("table", id(payloads)))
+        if entry is not None and entry[0] is payloads:
+            return entry[1]
+
+        table = self._build_table(payloads)
+        self._table_cache.set(("table", id(payloads)), (payloads, table))
+        return table
+
+    def _query_rows(
+        self,
+        rows: list[Any],
+        filters: Sequence[RangeFilter | MatchFilter],
+        sort: Sequence[SortKey],
+        limit: Optional[int],
+        table: Optional[ColumnarTable] = None,
+    ) -> list[Any]:
+        if not rows or (not filters and not sort and limit is None):
+            return rows
+
+        table = table or self._build_table(rows)
+        # Campos de ordenação desconhecidos são ignorados, como valores inválidos de `order`
+        sort = [key for key in sort if table.has_column(key.column)]
+        return [rows[index] for index in table.query(filters, sort, limit)]
+
+    def _select_payloads(
+        self,
+        payloads: list[dict[str, object]],
+        query_params: object,
+    ) -> list[dict[str, object]]:
+        """Filters, sorts and truncates payloads before any relationship is hydrated."""
+
+        filters = self._table_filters(query_params)
+        sort = self._sort_keys(getattr(query_params, "order_by", None), getattr(query_params, "order", None))
+        limit = getattr(query_params, "limit", None)
+        if not filters and not sort and limit is None:
+            return payloads
+
+        return self._query_rows(payloads, filters, sort, limit, self._table_for(payloads))
+
+
+watch_cache("payloads", BaseSwapiService._cache)
+watch_cache("tables", BaseSwapiService._table_cache)
+watch_inflight("swapi", BaseSwapiService._inflight)
@@ -0,0 +1,104 @@
+"""Service that materializes whole SWAPI resources (every page) in-process."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+from typing import Any, Optional
+
+from app.application.services.base_service import BaseSwapiService
+from app.domain.keys.resource_key import api_root
+
+RESOURCES = ("films", "people", "planets", "species", "starships", "vehicles")
+
+
+def service_for(resource: str) -> BaseSwapiService:
+    """Returns the resource service that knows its columns and filters."""
+
+    # Imports locais para evitar ciclos entre services
+    from app.application.services.films.films_service import FilmsService
+    from app.application.services.people.people_service import PeopleService
+    from app.application.services.planets.planets_service import PlanetsService
+    from app.application.services.species.species_service import SpeciesService
+    from app.application.services.starships.starships_service import StarshipsService
+    from app.application.services.vehicles.vehicles_service import VehiclesService
+
+    services = {
+        "films": FilmsService,
+        "people": PeopleService,
+        "planets": PlanetsService,
+        "species": SpeciesService,
+        "starships": StarshipsService,
+        "vehicles": VehiclesService,
+    }
+    if resource not in services:
+        raise KeyError(resource)
+    return services[resource]()
+
+
+def page_results(pages: list[dict[str, object]]) -> list[dict[str, object]]:
+    """Items of every page, in page order."""
+
+    results: list[dict[str, object]] = []
+    for page in pages:
+        results.extend(page.get("results") or [])
+    return results
+
+
+class DatasetService(BaseSwapiService):
+    """Collects every page of a SWAPI resource through the shared payload cache."""
+
+    async def collect_all(self, resource: str, limiter: Optional[asyncio.Semaphore] = None) -> list[dict[str, object]]:
+        return page_results(await self.collect_pages(resource, limiter))
+
+    async def collect_pages(self, resource: str, limiter: Optional[asyncio.Semaphore] = None) -> list[dict[str, object]]:
+        """Every page payload of `resource`, as held by the payload cache (same objects on a hit).
+
+        With `limiter`, each page fetch holds one of its slots, so callers can
+        cap the upstream requests of several collections at once.
+        """
+
+        if resource not in RESOURCES:
+            raise KeyError(resource)
+
+        # A primeira página também sai do event loop: uma SWAPI lenta não bloqueia outras requisições
+        first_page = await self._limited(limiter, self._resolve_payload, f"{api_root()}{resource}/")
+        results = first_page.get("results") or []
+        count = first_page.get("count")
+        if not first_page.get("next") or not results:
+            return [first_page]
+
+        if not isinstance(count, int):
+            return [first_page, *await self._limited(limiter, self._follow_pages, first_page.get("next"))]
+
+        # Com o total conhecido, as páginas restantes são buscadas em paralelo
+        total_pages = math.ceil(count / len(results))
+        pages = await asyncio.gather(*[
+            self._limited(limiter, self._resolve_payload, f"{api_root()}{resource}/", {"page": page})
+            for page in range(2, total_pages + 1)
+        ])
+        return [first_page, *pages]
+
+    async def _limited(self, limiter: Optional[asyncio.Semaphore], call: Any, *args: Any) -> Any:
+        if limiter is None:
+            return await self._in_executor(call, *args)
+        async with limiter:
+            return await self._in_executor(call, *args)
+
+    def _follow_pages(self, next_url: object) -> list[dict[str, object]]:
+        pages: list[dict[str, object]] = []
+        while isinstance(next_url, str) and next_url:
+            page = self._resolve_payload(next_url)
+            pages.append(page)
+            next_url = page.get("next")
+        return pages
+
+    @staticmethod
+    def version_of(payloads: list[dict[str, object]]) -> str:
+        """Fingerprint of a resource snapshot; changes whenever any item is edited."""
+
+        digest = hashlib.sha1()
+        for payload in payloads:
+            digest.update(f"{payload.get('url')}|{payload.get('edited')}\n".encode())
+        return digest.hexdigest()
@@ -0,0 +1,177 @@
+"""Service that expands relationships several levels deep with one fetch per level."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from typing import Any, Optional
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import service_for
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceKey, as_key
+from app.infrastructure.graph.relationship_graph import RELATIONS
+
+MAX_EXPAND_DEPTH = 3
+
+# Nó do plano: recurso alvo, chave do item e subárvore que ainda será expandida nele
+PlanNode = tuple[str, ResourceKey, FieldSelection]
+
+
+def _reference_key(value: object) -> Optional[ResourceKey]:
+    """Key of a relationship value: a key, a URL or an already hydrated DTO."""
+
+    key = as_key(value)
+    if key is None and value is not None:
+        key = as_key(getattr(value, "url", None))
+    return key
+
+
+def _references(value: object) -> list[object]:
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+class ExpansionService(BaseSwapiService):
+    """Expands `expand=characters.homeworld,planets.residents` trees.
+
+    Every level is planned before it is fetched: the keys needed by all nodes
+    at that depth are deduplicated and resolved in one concurrent batch. Each
+    resource is materialized once per request and shared wherever it appears;
+    a node that is already an ancestor on the current path stays a reference,
+    so cycles such as `films.characters.films` terminate.
+    """
+
+    max_depth = MAX_EXPAND_DEPTH
+
+    ################### Funções Públicas ###################
+
+    def plan(self, resource: str, value: Optional[str]) -> Optional[FieldSelection]:
+        """Parses `expand=`; raises ValueError for unknown relations or excessive depth."""
+
+        tree = parse_fields(value)
+        if tree is None:
+            return None
+        if tree.depth() > self.max_depth:
+            raise ValueError(f"A expansão aceita no máximo {self.max_depth} níveis de relacionamento")
+        self._validate(resource, tree)
+        return tree
+
+    async def expand(
+        self,
+        resource: str,
+        entities: list[Any],
+        tree: Optional[FieldSelection],
+    ) -> list[Any]:
+        """Replaces the relationships named in `tree` on each entity with expanded DTOs."""
+
+        if tree is None or not entities:
+            return entities
+
+        fetched = await self._fetch_levels(resource, entities, tree)
+        built: dict[tuple[ResourceKey, int], Any] = {}
+        for entity in entities:
+            root = _reference_key(getattr(entity, "url", None))
+            ancestors = frozenset((root,)) if root is not None else frozenset()
+            for relation in tree.names:
+                value = getattr(entity, relation)
+                setattr(entity, relation, self._assemble(value, tree.child(relation), fetched, built, ancestors))
+        return entities
+
+    ################### Funções Internas ###################
+
+    def _validate(self, resource: str, tree: FieldSelection, path: str = "") -> None:
+        relations = RELATIONS.get(resource, {})
+        for name in sorted(tree.names):
+            if name not in relations:
+                raise ValueError(f"Relacionamento inválido para expansão: {path}{name}")
+            child = tree.child(name)
+            if child is not None:
+                self._validate(relations[name], child, f"{path}{name}.")
+
+    async def _fetch_levels(
+        self,
+        resource: str,
+        entities: list[Any],
+        tree: FieldSelection,
+    ) -> dict[ResourceKey, Any]:
+        fetched: dict[ResourceKey, Any] = {}
+        planned: set[tuple[ResourceKey, int]] = set()
+        frontier: list[tuple[str, Any, FieldSelection]] = [(resource, entity, tree) for entity in entities]
+
+        while frontier:
+            wanted: dict[ResourceKey, str] = {}
+            next_level: list[PlanNode] = []
+            for holder_resource, holder, subtree in frontier:
+                for relation in subtree.names:
+                    target = RELATIONS[holder_resource][relation]
+                    child = subtree.child(relation)
+                    for reference in _references(getattr(holder, relation, None)):
+                        key = _reference_key(reference)
+                        if key is None:
+                            continue
+                        if key not in fetched:
+                            wanted[key] = target
+                        # O mesmo nó com a mesma subárvore é planejado uma única vez
+                        if child is not None and (key, id(child)) not in planned:
+                            planned.add((key, id(child)))
+                            next_level.append((target, key, child))
+
+            await self._fetch_batch(wanted, fetched)
+            frontier = [(target, fetched[key], child) for target, key, child in next_level if key in fetched]
+        return fetched
+
+    async def _fetch_batch(self, wanted: dict[ResourceKey, str], fetched: dict[ResourceKey, Any]) -> None:
+        if not wanted:
+            return
+
+        services = {target: service_for(target) for target in set(wanted.values())}
+        keys = list(wanted)
+        dtos = await asyncio.gather(*[
+            self._in_executor(services[wanted[key]].resolve_url, key)
+            for key in keys
+        ])
+        fetched.update(zip(keys, dtos))
+
+    def _assemble(
+        self,
+        value: object,
+        subtree: Optional[FieldSelection],
+        fetched: dict[ResourceKey, Any],
+        built: dict[tuple[ResourceKey, int], Any],
+        ancestors: frozenset[ResourceKey],
+    ) -> object:
+        if isinstance(value, list):
+            return [self._assemble_node(item, subtree, fetched, built, ancestors) for item in value]
+        if not value:
+            return value
+        return self._assemble_node(value, subtree, fetched, built, ancestors)
+
+    def _assemble_node(
+        self,
+        reference: object,
+        subtree: Optional[FieldSelection],
+        fetched: dict[ResourceKey, Any],
+        built: dict[tuple[ResourceKey, int], Any],
+        ancestors: frozenset[ResourceKey],
+    ) -> object:
+        key = _reference_key(reference)
+        if key is None or key not in fetched:
+            return reference
+        if key in ancestors:
+            # Ciclo: o nó já está sendo expandido neste caminho, então fica como referência
+            return key
+
+        memo = (key, id(subtree))
+        node = built.get(memo)
+        if node is None:
+            node = fetched[key]
+            if subtree is not None:
+                inner = ancestors | {key}
+                node = dataclasses.replace(node, **{
+                    relation: self._assemble(getattr(node, relation), subtree.child(relation), fetched, built, inner)
+                    for relation in subtree.names
+                })
+            built[memo] = node
+        return node
@@ -0,0 +1,106 @@
+"""Service producing bulk exports of the SWAPI dataset, once per data version."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import Iterator, NamedTuple
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import RESOURCES, DatasetService, service_for
+from app.domain.entities.serialization import serialize
+from app.infrastructure.export.export_formats import columnar_npz, ndjson_gzip
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/gzip", "ndjson.gz"),
+    "npz": ("application/octet-stream", "npz"),
+}
+
+
+class ExportArtifact(NamedTuple):
+    version: str
+    etag: str
+    content: bytes
+    media_type: str
+    filename: str
+
+
+class ExportService(BaseSwapiService):
+    """Builds `/export/{resource}` artifacts and reuses them until the data changes.
+
+    Each SWAPI item appears exactly once, with relationships as URLs, so a
+    full dump costs one dataset collection plus one encoding per version,
+    however many times it is downloaded.
+    """
+
+    # (recurso, formato) -> artefato da versão atual
+    _artifacts: dict[tuple[str, str], ExportArtifact] = {}
+    _locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    ################### Funções Públicas ###################
+
+    async def export(self, resource: str, export_format: str) -> ExportArtifact:
+        """Returns the artifact for `resource` (or `all`); raises KeyError/ValueError for bad input."""
+
+        if resource != "all" and resource not in RESOURCES:
+            raise KeyError(resource)
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação inválido: {export_format} (disponíveis: {', '.join(EXPORT_FORMATS)})")
+
+        resources = RESOURCES if resource == "all" else (resource,)
+        dataset_service = DatasetService()
+        collected = await asyncio.gather(*[dataset_service.collect_all(name) for name in resources])
+        dataset = dict(zip(resources, collected))
+        version = self._version(dataset)
+
+        cache_key = (resource, export_format)
+        artifact = self._artifacts.get(cache_key)
+        if artifact is not None and artifact.version == version:
+            return artifact
+
+        lock = self._locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # Outra requisição pode ter gerado o artefato enquanto esta aguardava
+            artifact = self._artifacts.get(cache_key)
+            if artifact is not None and artifact.version == version:
+                return artifact
+
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(None, self._encode, dataset, export_format)
+            media_type, extension = EXPORT_FORMATS[export_format]
+            artifact = ExportArtifact(
+                version=version,
+                etag=f'"{resource}-{export_format}-{version[:20]}"',
+                content=content,
+                media_type=media_type,
+                filename=f"swapi-{resource}.{extension}",
+            )
+            self._artifacts[cache_key] = artifact
+            return artifact
+
+    ################### Funções Internas ###################
+
+    def _version(self, dataset: dict[str, list[dict[str, object]]]) -> str:
+        digest = hashlib.sha1()
+        for resource, payloads in dataset.items():
+            digest.update(f"{resource}:{DatasetService.version_of(payloads)}\n".encode())
+        return digest.hexdigest()
+
+    def _rows(self, dataset: dict[str, list[dict[str, object]]]) -> Iterator[dict[str, object]]:
+        tagged = len(dataset) > 1
+        for resource, payloads in dataset.items():
+            service = service_for(resource)
+            for payload in payloads:
+                row = serialize(service._instance_payload(payload))
+                yield {"resource": resource, **row} if tagged else row
+
+    def _encode(self, dataset: dict[str, list[dict[str, object]]], export_format: str) -> bytes:
+        if export_format == "ndjson":
+            return ndjson_gzip(self._rows(dataset))
+
+        tables = {}
+        for resource, payloads in dataset.items():
+            service = service_for(resource)
+            rows = [serialize(service._instance_payload(payload)) for payload in payloads]
+            tables[resource] = (rows, service._build_table(payloads))
+        return columnar_npz(tables)
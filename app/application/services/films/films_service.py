@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.films.films_entity import FilmEntity
 from app.interfaces.dtos.films.films_dto import FilmDTO
 from app.interfaces.query_params.films.films_query_params import FilmsQueryParams
@@ -12,6 +14,22 @@ from app.interfaces.query_params.films.films_query_params import FilmsQueryParam
 class FilmsService(BaseSwapiService):
     """Entry point for fetching `FilmEntity` objects from SWAPI."""
 
+    resource_name = "films"
+    sort_field = "title"
+    categorical_fields = ("director", "producer")
+    range_filters = {
+        "release_date": "release_date",
+    }
+    match_filters = ("director",)
+    join_filters = {
+        "character_id": "characters",
+        "planet_id": "planets",
+        "starship_id": "starships",
+        "vehicle_id": "vehicles",
+        "species_id": "species",
+    }
+    search_fields = ("title",)
+
     # def __init__(self) -> None:
     #     self._planetsService = PlanetsService()
     #     self._speciesService = SpeciesService()
@@ -20,6 +38,7 @@ class FilmsService(BaseSwapiService):
 
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
@@ -27,19 +46,21 @@ class FilmsService(BaseSwapiService):
     ) -> list[FilmEntity]:
         """Busca um ou mais filmes na SWAPI e resolve os relacionamentos solicitados."""
 
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[FilmEntity] = []
         for payload in payloads:
-            film = self._instance_payload(payload)
-            entity = await self._hydrate_film_entity(film, query_params)
+            with profile_stage("build"):
+                film = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_film_entity(film, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -52,15 +73,15 @@ class FilmsService(BaseSwapiService):
         return films[0] if films else None
 
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> FilmDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> FilmDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhum filme corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     
 
@@ -78,7 +99,8 @@ class FilmsService(BaseSwapiService):
     resolveUrl = resolve_url
 
 
-    def _instance_payload(self, payload: dict[str, object]) -> FilmDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> FilmDTO:
+        payload = self._sparse_payload(payload, fields)
         return FilmDTO(
             title=payload.get("title", ""),
             episode_id=payload.get("episode_id"),
@@ -105,29 +127,12 @@ class FilmsService(BaseSwapiService):
         return [payload]
     
 
-    def _order_entities(
-        self,
-        entities: list[FilmEntity],
-        order: Optional[str],
-    ) -> list[FilmEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda film: (film.title or "").lower(),
-            reverse=normalized == "desc",
-        )
-
-
+    @traced()
     async def _hydrate_film_entity(
         self,
         film: FilmDTO,
         query_params: FilmsQueryParams,
+        fields: FieldSelection | None = None,
     ) -> FilmEntity:
         
         # Imports locais para evitar ciclos entre services
@@ -137,25 +142,15 @@ class FilmsService(BaseSwapiService):
         from app.application.services.starships.starships_service import StarshipsService
         from app.application.services.vehicles.vehicles_service import VehiclesService
 
-        planets = film.planets
-        if query_params.planets:
-            planets = await self._resolve_related_async(PlanetsService(), film.planets)
+        planets = await self._resolve_relation(PlanetsService(), film.planets, "planets", query_params.planets, fields)
 
-        starships = film.starships
-        if query_params.starships:
-            starships = await self._resolve_related_async(StarshipsService(), film.starships)
+        starships = await self._resolve_relation(StarshipsService(), film.starships, "starships", query_params.starships, fields)
 
-        vehicles = film.vehicles
-        if query_params.vehicles:
-            vehicles = await self._resolve_related_async(VehiclesService(), film.vehicles)
+        vehicles = await self._resolve_relation(VehiclesService(), film.vehicles, "vehicles", query_params.vehicles, fields)
 
-        species = film.species
-        if query_params.species:
-            species = await self._resolve_related_async(SpeciesService(), film.species)
+        species = await self._resolve_relation(SpeciesService(), film.species, "species", query_params.species, fields)
 
-        characters = film.characters
-        if query_params.characters:
-            characters = await self._resolve_related_async(PeopleService(), film.characters)
+        characters = await self._resolve_relation(PeopleService(), film.characters, "characters", query_params.characters, fields)
 
         return FilmEntity(
             title=film.title,
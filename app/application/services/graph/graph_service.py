@@ -0,0 +1,68 @@
+"""Service that keeps the SWAPI relationship graph in sync with the cached dataset."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import RESOURCES, DatasetService, page_results
+from app.domain.keys.resource_key import as_key
+from app.infrastructure.graph.relationship_graph import RelationshipGraph
+
+PayloadIndex = dict[str, dict[int, dict[str, object]]]
+# recurso -> (páginas usadas na construção, versão do conteúdo)
+PageSources = dict[str, tuple[list[dict[str, object]], str]]
+
+
+def _same_pages(left: list[dict[str, object]], right: list[dict[str, object]]) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
+class GraphService(BaseSwapiService):
+    """Builds the relationship graph once per dataset version.
+
+    The page payloads are compared by identity with the ones the graph was
+    built from, so a request served from the payload cache costs one lookup
+    per page. Only a resource whose pages were fetched again is fingerprinted,
+    and the graph is rebuilt only when that content actually changed.
+    """
+
+    _snapshot: Optional[tuple[PageSources, RelationshipGraph, PayloadIndex]] = None
+
+    async def snapshot(self) -> tuple[RelationshipGraph, PayloadIndex]:
+        """Returns the graph plus an `id -> payload` index for every resource."""
+
+        dataset_service = DatasetService()
+        collected = await asyncio.gather(*[dataset_service.collect_pages(resource) for resource in RESOURCES])
+
+        snapshot = GraphService._snapshot
+        previous: PageSources = snapshot[0] if snapshot is not None else {}
+        sources: PageSources = {}
+        changed = snapshot is None
+        for resource, pages in zip(RESOURCES, collected):
+            known = previous.get(resource)
+            if known is not None and _same_pages(known[0], pages):
+                sources[resource] = known
+                continue
+            version = DatasetService.version_of(page_results(pages))
+            changed = changed or known is None or known[1] != version
+            sources[resource] = (pages, version)
+
+        if not changed:
+            # Páginas buscadas de novo com o mesmo conteúdo: o grafo continua valendo
+            GraphService._snapshot = (sources, snapshot[1], snapshot[2])
+            return snapshot[1], snapshot[2]
+
+        dataset = {resource: page_results(pages) for resource, (pages, _) in sources.items()}
+        index: PayloadIndex = {}
+        for resource, payloads in dataset.items():
+            by_id = index.setdefault(resource, {})
+            for payload in payloads:
+                key = as_key(payload.get("url"))
+                if key is not None:
+                    by_id[key[1]] = payload
+
+        graph = RelationshipGraph.build(dataset)
+        GraphService._snapshot = (sources, graph, index)
+        return graph, index
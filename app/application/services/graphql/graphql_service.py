@@ -0,0 +1,163 @@
+"""Service executing GraphQL operations over the SWAPI resources."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+from collections import OrderedDict
+from inspect import isawaitable
+from typing import Any, Mapping, Optional
+
+from graphql import DocumentNode, GraphQLError, execute, parse, validate
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import DatasetService, service_for
+from app.domain.keys.resource_key import ResourceKey, as_key
+from app.infrastructure.loading.batch_loader import BatchLoader
+from app.interfaces.graphql.query_cost import InvalidLimitError, query_cost
+from app.interfaces.graphql.swapi_schema import swapi_schema
+
+MAX_QUERY_COST = 5000
+MAX_CACHED_DOCUMENTS = 1000
+
+# Mensagem e código definidos pelo protocolo de persisted queries do Apollo (os clientes comparam o texto)
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+class GraphQLService(BaseSwapiService):
+    """Parses, validates, prices and executes GraphQL operations.
+
+    Validated documents are kept by the SHA-256 of their text, so hot queries
+    and Apollo-style persisted queries skip parsing and validation. Each
+    execution gets its own `BatchLoader`: sibling and nested selections that
+    reference the same resource resolve it with a single fetch.
+    """
+
+    max_query_cost = MAX_QUERY_COST
+    max_cached_documents = MAX_CACHED_DOCUMENTS
+    _documents: OrderedDict[str, DocumentNode] = OrderedDict()
+
+    ################### Funções Públicas ###################
+
+    async def execute(
+        self,
+        query: Optional[str],
+        variables: Optional[Mapping[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        extensions: Optional[Mapping[str, Any]] = None,
+    ) -> dict[str, Any]:
+        try:
+            document = self._document(query, extensions)
+        except GraphQLError as error:
+            return {"data": None, "errors": [error.formatted]}
+        except _ValidationErrors as errors:
+            return {"data": None, "errors": [error.formatted for error in errors.errors]}
+
+        try:
+            cost = query_cost(swapi_schema, document, variables, operation_name)
+        except InvalidLimitError as exc:
+            error = GraphQLError(str(exc), extensions={"code": "BAD_USER_INPUT"})
+            return {"data": None, "errors": [error.formatted]}
+        if cost > self.max_query_cost:
+            error = GraphQLError(
+                f"Custo da consulta ({cost}) excede o limite de {self.max_query_cost}",
+                extensions={"code": "QUERY_TOO_COSTLY", "cost": cost, "maxCost": self.max_query_cost},
+            )
+            return {"data": None, "errors": [error.formatted]}
+
+        loader: BatchLoader[ResourceKey, Any] = BatchLoader(self._load_batch)
+        result = execute(
+            swapi_schema,
+            document,
+            context_value={
+                "loader": loader,
+                "list_resource": functools.partial(self._list_resource, loader),
+            },
+            variable_values=variables,
+            operation_name=operation_name,
+        )
+        if isawaitable(result):
+            result = await result
+        return result.formatted
+
+    ################### Funções Internas ###################
+
+    def _document(self, query: Optional[str], extensions: Optional[Mapping[str, Any]]) -> DocumentNode:
+        persisted = (extensions or {}).get("persistedQuery") or {}
+        digest = persisted.get("sha256Hash") if isinstance(persisted, Mapping) else None
+
+        if not query:
+            if not digest:
+                raise GraphQLError("Nenhuma consulta GraphQL foi informada")
+            document = self._documents.get(digest)
+            if document is None:
+                raise GraphQLError(PERSISTED_QUERY_NOT_FOUND, extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+            self._documents.move_to_end(digest)
+            return document
+
+        computed = hashlib.sha256(query.encode()).hexdigest()
+        if digest and digest != computed:
+            raise GraphQLError(
+                "O hash informado não corresponde à consulta",
+                extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+            )
+
+        document = self._documents.get(computed)
+        if document is not None:
+            self._documents.move_to_end(computed)
+            return document
+
+        document = parse(query)
+        errors = validate(swapi_schema, document)
+        if errors:
+            raise _ValidationErrors(errors)
+
+        self._documents[computed] = document
+        if len(self._documents) > self.max_cached_documents:
+            self._documents.popitem(last=False)
+        return document
+
+    async def _load_batch(self, keys: list[ResourceKey]) -> list[object]:
+        services: dict[str, BaseSwapiService] = {}
+        tasks = []
+        for key in keys:
+            service = services.get(key.resource.value)
+            if service is None:
+                service = services[key.resource.value] = service_for(key.resource.value)
+            tasks.append(self._in_executor(service.resolve_url, key))
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _list_resource(
+        self,
+        loader: BatchLoader[ResourceKey, Any],
+        resource: str,
+        search: Optional[str],
+        limit: Optional[int],
+        order_by: Optional[str],
+    ) -> list[object]:
+        if limit is not None and limit < 1:
+            raise GraphQLError(f"O argumento limit deve ser maior ou igual a 1 (recebido {limit})")
+
+        service = service_for(resource)
+        payloads = await DatasetService().collect_all(resource)
+        if search:
+            term = search.lower()
+            payloads = [
+                payload for payload in payloads
+                if any(term in str(payload.get(name) or "").lower() for name in service.search_fields)
+            ]
+
+        rows = service._query_rows(payloads, (), service._sort_keys(order_by, None), limit)
+        dtos = [service._instance_payload(payload) for payload in rows]
+        for dto in dtos:
+            key = as_key(dto.url)
+            if key is not None:
+                loader.prime(key, dto)
+        return dtos
+
+
+class _ValidationErrors(Exception):
+    def __init__(self, errors: list[GraphQLError]) -> None:
+        super().__init__(errors[0].message)
+        self.errors = errors
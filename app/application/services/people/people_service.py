@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.people.people_entity import PeopleEntity
 from app.interfaces.dtos.people.people_dto import PeopleDTO
 from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
@@ -13,26 +15,44 @@ from app.interfaces.query_params.people.people_query_params import PeopleQueryPa
 class PeopleService(BaseSwapiService):
     """Entry point for fetching `PeopleEntity` objects from SWAPI."""
 
+    resource_name = "people"
+    categorical_fields = ("gender", "eye_color", "hair_color", "skin_color")
+    range_filters = {
+        "height": "height",
+        "mass": "mass",
+    }
+    match_filters = ("gender",)
+    join_filters = {
+        "homeworld_id": "homeworld",
+        "film_id": "films",
+        "species_id": "species",
+        "starship_id": "starships",
+        "vehicle_id": "vehicles",
+    }
+
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
         query_params: PeopleQueryParams,
     ) -> list[PeopleEntity]:
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[PeopleEntity] = []
         for payload in payloads:
-            person = self._instance_payload(payload)
-            entity = await self._hydrate_person_entity(person, query_params)
+            with profile_stage("build"):
+                person = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_person_entity(person, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -43,15 +63,15 @@ class PeopleService(BaseSwapiService):
         return people[0] if people else None
 
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> PeopleDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> PeopleDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhuma pessoa corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     resolveUrl = resolve_url
 
@@ -70,7 +90,8 @@ class PeopleService(BaseSwapiService):
             return results
         return [payload]
 
-    def _instance_payload(self, payload: dict[str, object]) -> PeopleDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> PeopleDTO:
+        payload = self._sparse_payload(payload, fields)
         return PeopleDTO(
             name=payload.get("name", ""),
             birth_year=payload.get("birth_year"),
@@ -90,28 +111,12 @@ class PeopleService(BaseSwapiService):
             edited=payload.get("edited"),
         )
 
-    def _order_entities(
-        self,
-        entities: list[PeopleEntity],
-        order: Optional[str],
-    ) -> list[PeopleEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda person: (person.name or "").lower(),
-            reverse=normalized == "desc",
-        )
-
+    @traced()
     async def _hydrate_person_entity(
         self,
         person: PeopleDTO,
         query_params: PeopleQueryParams,
+        fields: FieldSelection | None = None,
     ) -> PeopleEntity:
         # Imports locais para evitar ciclos entre services
         from app.application.services.planets.planets_service import PlanetsService
@@ -120,26 +125,18 @@ class PeopleService(BaseSwapiService):
         from app.application.services.vehicles.vehicles_service import VehiclesService
         from app.application.services.films.films_service import FilmsService
 
-        homeworld = None
+        homeworld = person.homeworld
         if person.homeworld:
-            homeworld = await self._resolve_related_async(PlanetsService(), [person.homeworld])
+            homeworld = await self._resolve_relation(PlanetsService(), [person.homeworld], "homeworld", query_params.homeworld, fields)
             homeworld = homeworld[0] if homeworld else None
 
-        films = person.films
-        if query_params.films:
-            films = await self._resolve_related_async(FilmsService(), person.films)
+        films = await self._resolve_relation(FilmsService(), person.films, "films", query_params.films, fields)
 
-        species = person.species
-        if query_params.species:
-            species = await self._resolve_related_async(SpeciesService(), person.species)
+        species = await self._resolve_relation(SpeciesService(), person.species, "species", query_params.species, fields)
 
-        starships = person.starships
-        if query_params.starships:
-            starships = await self._resolve_related_async(StarshipsService(), person.starships)
+        starships = await self._resolve_relation(StarshipsService(), person.starships, "starships", query_params.starships, fields)
 
-        vehicles = person.vehicles
-        if query_params.vehicles:
-            vehicles = await self._resolve_related_async(VehiclesService(), person.vehicles)
+        vehicles = await self._resolve_relation(VehiclesService(), person.vehicles, "vehicles", query_params.vehicles, fields)
 
         return PeopleEntity(
             name=person.name,
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.planets.planets_entity import PlanetEntity
 from app.interfaces.dtos.planets.planets_dto import PlanetDTO
 from app.interfaces.query_params.planets.planets_query_params import PlanetsQueryParams
@@ -13,26 +15,42 @@ from app.interfaces.query_params.planets.planets_query_params import PlanetsQuer
 class PlanetsService(BaseSwapiService):
     """Entry point for fetching `PlanetEntity` objects from SWAPI."""
 
+    resource_name = "planets"
+    categorical_fields = ("climate", "terrain")
+    range_filters = {
+        "population": "population",
+        "diameter": "diameter",
+    }
+    match_filters = ("climate", "terrain")
+    join_filters = {
+        "resident_id": "residents",
+        "film_id": "films",
+        "species_id": "native_species",
+    }
+
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
         query_params: PlanetsQueryParams,
     ) -> list[PlanetEntity]:
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[PlanetEntity] = []
         for payload in payloads:
-            planet = self._instance_payload(payload)
-            entity = await self._hydrate_planet_entity(planet, query_params)
+            with profile_stage("build"):
+                planet = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_planet_entity(planet, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -42,15 +60,15 @@ class PlanetsService(BaseSwapiService):
         planets = await self.create_entities(url, query_params)
         return planets[0] if planets else None
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> PlanetDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> PlanetDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhum planeta corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     resolveUrl = resolve_url
 
@@ -68,7 +86,8 @@ class PlanetsService(BaseSwapiService):
             return results
         return [payload]
 
-    def _instance_payload(self, payload: dict[str, object]) -> PlanetDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> PlanetDTO:
+        payload = self._sparse_payload(payload, fields)
         return PlanetDTO(
             name=payload.get("name", ""),
             rotation_period=payload.get("rotation_period"),
@@ -86,40 +105,20 @@ class PlanetsService(BaseSwapiService):
             edited=payload.get("edited"),
         )
 
-    def _order_entities(
-        self,
-        entities: list[PlanetEntity],
-        order: Optional[str],
-    ) -> list[PlanetEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda planet: (planet.name or "").lower(),
-            reverse=normalized == "desc",
-        )
-
+    @traced()
     async def _hydrate_planet_entity(
         self,
         planet: PlanetDTO,
         query_params: PlanetsQueryParams,
+        fields: FieldSelection | None = None,
     ) -> PlanetEntity:
         # Imports locais para evitar ciclos entre services
         from app.application.services.people.people_service import PeopleService
         from app.application.services.films.films_service import FilmsService
 
-        residents = planet.residents
-        if query_params.residents:
-            residents = await self._resolve_related_async(PeopleService(), planet.residents)
+        residents = await self._resolve_relation(PeopleService(), planet.residents, "residents", query_params.residents, fields)
 
-        films = planet.films
-        if query_params.films:
-            films = await self._resolve_related_async(FilmsService(), planet.films)
+        films = await self._resolve_relation(FilmsService(), planet.films, "films", query_params.films, fields)
 
         return PlanetEntity(
             name=planet.name,
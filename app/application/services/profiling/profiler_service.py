@@ -0,0 +1,58 @@
+"""Service running on-demand CPU and allocation profiles of the live process."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+from app.infrastructure.metrics.swapi_metrics import watched_caches
+from app.infrastructure.profiling.allocation_profiler import allocation_growth
+from app.infrastructure.profiling.sampling_profiler import SamplingProfiler, StackSamples
+
+MAX_PROFILE_SECONDS = 60.0
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is still running."""
+
+
+class ProfilerService:
+    """Runs one profile at a time in a worker thread, so the loop keeps serving the traffic being observed."""
+
+    _lock = threading.Lock()
+
+    ################### Funções Públicas ###################
+
+    async def cpu_profile(self, seconds: float, interval: float = 0.005, include_idle: bool = False) -> StackSamples:
+        """Samples every thread's stack for `seconds`; idle waits are dropped unless `include_idle`."""
+
+        profiler = SamplingProfiler(interval=interval, include_idle=include_idle)
+        return await self._exclusive(profiler.run, self._bounded(seconds))
+
+    async def allocation_profile(self, seconds: float, limit: int = 25) -> dict[str, Any]:
+        """Allocation sites that grew during the window, plus the entry counts of each `MemoryCache`."""
+
+        before = {name: len(cache) for name, cache in watched_caches().items()}
+        report = await self._exclusive(allocation_growth, self._bounded(seconds), limit)
+        report["caches"] = {
+            name: {"entries_before": before.get(name, 0), "entries_after": len(cache)}
+            for name, cache in watched_caches().items()
+        }
+        return report
+
+    ################### Funções Internas ###################
+
+    def _bounded(self, seconds: float) -> float:
+        if seconds <= 0:
+            raise ValueError("A duração do perfil deve ser positiva")
+        return min(seconds, MAX_PROFILE_SECONDS)
+
+    async def _exclusive(self, call: Any, *args: Any) -> Any:
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("Já existe um perfil em andamento nesta instância")
+        try:
+            # Sem copiar o contexto: o perfil não deve aparecer nas métricas nem no trace da requisição
+            return await asyncio.get_running_loop().run_in_executor(None, call, *args)
+        finally:
+            self._lock.release()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.species.species_entity import SpeciesEntity
 from app.interfaces.dtos.species.species_dto import SpeciesDTO
 from app.interfaces.query_params.species.species_query_params import SpeciesQueryParams
@@ -13,26 +15,42 @@ from app.interfaces.query_params.species.species_query_params import SpeciesQuer
 class SpeciesService(BaseSwapiService):
     """Entry point for fetching `SpeciesEntity` objects from SWAPI."""
 
+    resource_name = "species"
+    categorical_fields = ("classification", "designation", "language")
+    range_filters = {
+        "height": "average_height",
+        "lifespan": "average_lifespan",
+    }
+    match_filters = ("classification", "designation")
+    join_filters = {
+        "homeworld_id": "homeworld",
+        "person_id": "people",
+        "film_id": "films",
+    }
+
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
         query_params: SpeciesQueryParams,
     ) -> list[SpeciesEntity]:
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[SpeciesEntity] = []
         for payload in payloads:
-            specie = self._instance_payload(payload)
-            entity = await self._hydrate_species_entity(specie, query_params)
+            with profile_stage("build"):
+                specie = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_species_entity(specie, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -42,15 +60,15 @@ class SpeciesService(BaseSwapiService):
         species = await self.create_entities(url, query_params)
         return species[0] if species else None
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> SpeciesDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> SpeciesDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhuma espécie corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     resolveUrl = resolve_url
 
@@ -68,7 +86,8 @@ class SpeciesService(BaseSwapiService):
             return results
         return [payload]
 
-    def _instance_payload(self, payload: dict[str, object]) -> SpeciesDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> SpeciesDTO:
+        payload = self._sparse_payload(payload, fields)
         return SpeciesDTO(
             name=payload.get("name", ""),
             classification=payload.get("classification"),
@@ -87,46 +106,26 @@ class SpeciesService(BaseSwapiService):
             edited=payload.get("edited"),
         )
 
-    def _order_entities(
-        self,
-        entities: list[SpeciesEntity],
-        order: Optional[str],
-    ) -> list[SpeciesEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda specie: (specie.name or "").lower(),
-            reverse=normalized == "desc",
-        )
-
+    @traced()
     async def _hydrate_species_entity(
         self,
         specie: SpeciesDTO,
         query_params: SpeciesQueryParams,
+        fields: FieldSelection | None = None,
     ) -> SpeciesEntity:
         # Imports locais para evitar ciclos entre services
         from app.application.services.planets.planets_service import PlanetsService
         from app.application.services.people.people_service import PeopleService
         from app.application.services.films.films_service import FilmsService
 
-        homeworld = None
+        homeworld = specie.homeworld
         if specie.homeworld:
-            homeworld = await self._resolve_related_async(PlanetsService(), [specie.homeworld])
+            homeworld = await self._resolve_relation(PlanetsService(), [specie.homeworld], "homeworld", query_params.homeworld, fields)
             homeworld = homeworld[0] if homeworld else None
 
-        people = specie.people
-        if query_params.people:
-            people = await self._resolve_related_async(PeopleService(), specie.people)
+        people = await self._resolve_relation(PeopleService(), specie.people, "people", query_params.people, fields)
 
-        films = specie.films
-        if query_params.films:
-            films = await self._resolve_related_async(FilmsService(), specie.films)
+        films = await self._resolve_relation(FilmsService(), specie.films, "films", query_params.films, fields)
 
         return SpeciesEntity(
             name=specie.name,
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.starships.starships_entity import StarshipEntity
 from app.interfaces.dtos.starships.starships_dto import StarshipDTO
 from app.interfaces.query_params.starships.starships_query_params import StarshipsQueryParams
@@ -13,26 +15,43 @@ from app.interfaces.query_params.starships.starships_query_params import Starshi
 class StarshipsService(BaseSwapiService):
     """Entry point for fetching `StarshipEntity` objects from SWAPI."""
 
+    resource_name = "starships"
+    categorical_fields = ("model", "manufacturer", "starship_class")
+    range_filters = {
+        "cost": "cost_in_credits",
+        "crew": "crew",
+        "length": "length",
+    }
+    match_filters = ("starship_class",)
+    join_filters = {
+        "pilot_id": "pilots",
+        "film_id": "films",
+    }
+    search_fields = ("name", "model")
+
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
         query_params: StarshipsQueryParams,
     ) -> list[StarshipEntity]:
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[StarshipEntity] = []
         for payload in payloads:
-            starship = self._instance_payload(payload)
-            entity = await self._hydrate_starship_entity(starship, query_params)
+            with profile_stage("build"):
+                starship = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_starship_entity(starship, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -42,15 +61,15 @@ class StarshipsService(BaseSwapiService):
         starships = await self.create_entities(url, query_params)
         return starships[0] if starships else None
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> StarshipDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> StarshipDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhuma nave corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     resolveUrl = resolve_url
 
@@ -70,7 +89,8 @@ class StarshipsService(BaseSwapiService):
             return results
         return [payload]
 
-    def _instance_payload(self, payload: dict[str, object]) -> StarshipDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> StarshipDTO:
+        payload = self._sparse_payload(payload, fields)
         return StarshipDTO(
             name=payload.get("name", ""),
             model=payload.get("model"),
@@ -92,40 +112,20 @@ class StarshipsService(BaseSwapiService):
             edited=payload.get("edited"),
         )
 
-    def _order_entities(
-        self,
-        entities: list[StarshipEntity],
-        order: Optional[str],
-    ) -> list[StarshipEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda starship: (starship.name or "").lower(),
-            reverse=normalized == "desc",
-        )
-
+    @traced()
     async def _hydrate_starship_entity(
         self,
         starship: StarshipDTO,
         query_params: StarshipsQueryParams,
+        fields: FieldSelection | None = None,
     ) -> StarshipEntity:
         # Imports locais para evitar ciclos entre services
         from app.application.services.people.people_service import PeopleService
         from app.application.services.films.films_service import FilmsService
 
-        films = starship.films
-        if query_params.films:
-            films = await self._resolve_related_async(FilmsService(), starship.films)
+        films = await self._resolve_relation(FilmsService(), starship.films, "films", query_params.films, fields)
 
-        pilots = starship.pilots
-        if query_params.pilots:
-            pilots = await self._resolve_related_async(PeopleService(), starship.pilots)
+        pilots = await self._resolve_relation(PeopleService(), starship.pilots, "pilots", query_params.pilots, fields)
 
         return StarshipEntity(
             name=starship.name,
@@ -0,0 +1,133 @@
+"""Service computing aggregate statistics over whole SWAPI resources."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Optional
+
+import numpy as np
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import DatasetService, service_for
+from app.domain.numeric.numeric_projection import numeric_projection
+from app.infrastructure.cache.memory_cache import MemoryCache
+from app.infrastructure.columnar.aggregation import METRICS, aggregate, group_codes
+from app.infrastructure.columnar.columnar_table import ColumnarTable
+from app.interfaces.query_params.stats.stats_query_params import StatsQueryParams
+
+
+def _split(value: Optional[str]) -> list[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _json_number(value: Any) -> Optional[float | int]:
+    number = float(value)
+    if math.isnan(number):
+        return None
+    return int(number) if number.is_integer() and abs(number) < 2**53 else number
+
+
+class StatsService(BaseSwapiService):
+    """Group-by aggregations computed with vectorized kernels on a columnar snapshot."""
+
+    # recurso -> (versão dos dados, tabela colunar, resultados já calculados)
+    _snapshots: dict[str, tuple[str, ColumnarTable, MemoryCache]] = {}
+    # Combinações de fields/metrics/percentiles vêm do cliente: resultados guardados por LRU
+    max_cached_results = 128
+
+    ################### Funções Públicas ###################
+
+    async def compute(self, resource: str, query_params: StatsQueryParams) -> dict[str, object]:
+        """Aggregates `resource`; results are reused until the data version changes."""
+
+        resource_service = service_for(resource)
+        dataset = DatasetService()
+        payloads = await dataset.collect_all(resource)
+        version = dataset.version_of(payloads)
+
+        snapshot = self._snapshots.get(resource)
+        if snapshot is None or snapshot[0] != version:
+            snapshot = (version, resource_service._build_table(payloads), MemoryCache(ttl_seconds=0, max_entries=self.max_cached_results))
+            self._snapshots[resource] = snapshot
+        _, table, results = snapshot
+
+        fields, group_by, metrics, percentiles = self._validate(resource, table, query_params)
+        cache_key = (tuple(fields), group_by, tuple(metrics), tuple(percentiles))
+        cached = results.get(cache_key)
+        if cached is None:
+            cached = self._aggregate(resource, version, table, fields, group_by, metrics, percentiles)
+            results.set(cache_key, cached)
+        return cached
+
+    ################### Funções Internas ###################
+
+    def _validate(
+        self,
+        resource: str,
+        table: ColumnarTable,
+        query_params: StatsQueryParams,
+    ) -> tuple[list[str], Optional[str], list[str], list[float]]:
+        numeric_fields = list(numeric_projection.fields(resource))
+        fields = _split(query_params.fields) or numeric_fields
+        unknown = [name for name in fields if name not in numeric_fields]
+        if unknown:
+            raise ValueError(f"Campos numéricos inválidos para {resource}: {', '.join(unknown)}")
+
+        group_by = query_params.group_by.strip() if query_params.group_by else None
+        if group_by and group_by not in table.categorical:
+            raise ValueError(
+                f"Campo de agrupamento inválido para {resource}: {group_by} "
+                f"(disponíveis: {', '.join(sorted(table.categorical))})"
+            )
+
+        metrics = _split(query_params.metrics) or list(METRICS)
+        invalid_metrics = [name for name in metrics if name not in METRICS]
+        if invalid_metrics:
+            raise ValueError(f"Métricas inválidas: {', '.join(invalid_metrics)}")
+
+        try:
+            percentiles = [float(item) for item in _split(query_params.percentiles)]
+        except ValueError as exc:
+            raise ValueError("Percentis devem ser números entre 0 e 100") from exc
+        if any(not 0 <= item <= 100 for item in percentiles):
+            raise ValueError("Percentis devem ser números entre 0 e 100")
+
+        return fields, group_by or None, metrics, percentiles
+
+    def _aggregate(
+        self,
+        resource: str,
+        version: str,
+        table: ColumnarTable,
+        fields: list[str],
+        group_by: Optional[str],
+        metrics: list[str],
+        percentiles: list[float],
+    ) -> dict[str, object]:
+        codes, labels = group_codes(table, group_by)
+        rows = np.bincount(codes, minlength=len(labels))
+
+        per_field = {
+            name: aggregate(codes, len(labels), table.numeric[name], metrics, percentiles)
+            for name in fields
+        }
+
+        groups = []
+        for index, label in enumerate(labels):
+            groups.append({
+                "key": label,
+                "rows": int(rows[index]),
+                "fields": {
+                    name: {metric: _json_number(values[index]) for metric, values in computed.items()}
+                    for name, computed in per_field.items()
+                },
+            })
+
+        return {
+            "resource": resource,
+            "version": version,
+            "group_by": group_by,
+            "groups": groups,
+        }
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 from app.application.services.base_service import BaseSwapiService
+from app.infrastructure.profiling.request_profile import profile_stage
+from app.infrastructure.tracing.tracer import traced
+from app.domain.fields.field_selection import FieldSelection, parse_fields
+from app.domain.keys.resource_key import ResourceRef
 from app.domain.entities.vehicles.vehicles_entity import VehicleEntity
 from app.interfaces.dtos.vehicles.vehicles_dto import VehicleDTO
 from app.interfaces.query_params.vehicles.vehicles_query_params import VehiclesQueryParams
@@ -13,26 +15,43 @@ from app.interfaces.query_params.vehicles.vehicles_query_params import VehiclesQ
 class VehiclesService(BaseSwapiService):
     """Entry point for fetching `VehicleEntity` objects from SWAPI."""
 
+    resource_name = "vehicles"
+    categorical_fields = ("model", "manufacturer", "vehicle_class")
+    range_filters = {
+        "cost": "cost_in_credits",
+        "crew": "crew",
+        "length": "length",
+    }
+    match_filters = ("vehicle_class",)
+    join_filters = {
+        "pilot_id": "pilots",
+        "film_id": "films",
+    }
+    search_fields = ("name", "model")
+
     ################### Funções Públicas ###################
 
+    @traced()
     async def create_entities(
         self,
         url: str,
         query_params: VehiclesQueryParams,
     ) -> list[VehicleEntity]:
-        payloads = self._collect_payloads(url, query_params)
+        payloads = self._select_payloads(await self._gather_payloads(url, query_params), query_params)
         if not payloads:
             return []
 
+        fields = parse_fields(query_params.fields)
+
         entities: list[VehicleEntity] = []
         for payload in payloads:
-            vehicle = self._instance_payload(payload)
-            entity = await self._hydrate_vehicle_entity(vehicle, query_params)
+            with profile_stage("build"):
+                vehicle = self._instance_payload(payload, fields)
+            with profile_stage("hydrate"):
+                entity = await self._hydrate_vehicle_entity(vehicle, query_params, fields)
             entities.append(entity)
 
-        if query_params.order:
-            return self._order_entities(entities, query_params.order)
-        return entities
+        return await self._expand_entities(entities, query_params)
 
     async def create_entity(
         self,
@@ -42,15 +61,15 @@ class VehiclesService(BaseSwapiService):
         vehicles = await self.create_entities(url, query_params)
         return vehicles[0] if vehicles else None
 
-    def resolve_url(self, url: str, search_params: dict[str, object] | None = None) -> VehicleDTO:
+    def resolve_url(self, url: ResourceRef, search_params: dict[str, object] | None = None, fields: FieldSelection | None = None) -> VehicleDTO:
         payload = self._resolve_payload(url, params=search_params)
         results = payload.get("results")
         if isinstance(results, list):
             if not results:
                 raise ValueError("Nenhum veículo corresponde ao filtro solicitado")
-            return self._instance_payload(results[0])
+            return self._instance_payload(results[0], fields)
 
-        return self._instance_payload(payload)
+        return self._instance_payload(payload, fields)
 
     resolveUrl = resolve_url
 
@@ -70,7 +89,8 @@ class VehiclesService(BaseSwapiService):
             return results
         return [payload]
 
-    def _instance_payload(self, payload: dict[str, object]) -> VehicleDTO:
+    def _instance_payload(self, payload: dict[str, object], fields: FieldSelection | None = None) -> VehicleDTO:
+        payload = self._sparse_payload(payload, fields)
         return VehicleDTO(
             name=payload.get("name", ""),
             model=payload.get("model"),
@@ -90,40 +110,20 @@ class VehiclesService(BaseSwapiService):
             edited=payload.get("edited"),
         )
 
-    def _order_entities(
-        self,
-        entities: list[VehicleEntity],
-        order: Optional[str],
-    ) -> list[VehicleEntity]:
-        if not order or not isinstance(order, str):
-            return entities
-
-        normalized = order.strip().lower()
-        if normalized not in {"asc", "desc"}:
-            return entities
-
-        return sorted(
-            entities,
-            key=lambda vehicle: (vehicle.name or "").lower(),
-            reverse=normalized == "desc",
-        )
-
+    @traced()
     async def _hydrate_vehicle_entity(
         self,
         vehicle: VehicleDTO,
         query_params: VehiclesQueryParams,
+        fields: FieldSelection | None = None,
     ) -> VehicleEntity:
         # Imports locais para evitar ciclos entre services
         from app.application.services.people.people_service import PeopleService
         from app.application.services.films.films_service import FilmsService
 
-        films = vehicle.films
-        if query_params.films:
-            films = await self._resolve_related_async(FilmsService(), vehicle.films)
+        films = await self._resolve_relation(FilmsService(), vehicle.films, "films", query_params.films, fields)
 
-        pilots = vehicle.pilots
-        if query_params.pilots:
-            pilots = await self._resolve_related_async(PeopleService(), vehicle.pilots)
+        pilots = await self._resolve_relation(PeopleService(), vehicle.pilots, "pilots", query_params.pilots, fields)
 
         return VehicleEntity(
             name=vehicle.name,
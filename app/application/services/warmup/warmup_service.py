@@ -0,0 +1,150 @@
+"""Service that pre-populates the payload cache at startup and keeps hot keys fresh."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Hashable, Iterable, Optional
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.dataset.dataset_service import RESOURCES, DatasetService
+from app.domain.keys.resource_key import ResourceKey, ResourceRef, as_key, cache_key
+from app.infrastructure.graph.relationship_graph import RELATIONS
+
+logger = logging.getLogger(__name__)
+
+
+def _references(value: object) -> Iterable[object]:
+    if isinstance(value, list):
+        return value
+    return (value,) if value else ()
+
+
+class WarmupService(BaseSwapiService):
+    """Warms configured resources and their relationship closures into `MemoryCache`.
+
+    Items already returned by the list pages are seeded straight into the
+    cache under their detail keys; only related items outside the warmed
+    resources cost an upstream request, at most `concurrency` at a time.
+    """
+
+    ################### Funções Públicas ###################
+
+    def start(self, configuration: dict[str, Any]) -> list[asyncio.Task]:
+        """Schedules the initial warm-up and the periodic re-warm; the first task is the warm-up."""
+
+        if not configuration.get("warmup_enabled"):
+            return []
+
+        concurrency = configuration.get("warmup_concurrency", 8)
+        tasks = [asyncio.create_task(self._safe_warm(
+            configuration.get("warmup_resources", RESOURCES),
+            configuration.get("warmup_relations", True),
+            concurrency,
+        ))]
+
+        interval = configuration.get("rewarm_interval_seconds", 0)
+        if interval and interval > 0:
+            tasks.append(asyncio.create_task(self._schedule_rewarm(
+                interval, configuration.get("rewarm_hot_keys", 200), concurrency,
+            )))
+        return tasks
+
+    async def wait_ready(self, warmup: Optional[asyncio.Task], budget_seconds: float) -> bool:
+        """Waits for the warm-up up to `budget_seconds`; past that it keeps running in the background."""
+
+        if warmup is None:
+            return True
+        done, _ = await asyncio.wait({warmup}, timeout=max(budget_seconds, 0))
+        return warmup in done
+
+    async def warm(self, resources: Iterable[str], include_relations: bool = True, concurrency: int = 8) -> int:
+        """Collects every page of `resources` and caches each item (and related item); returns the count."""
+
+        resources = [resource for resource in resources if resource in RESOURCES]
+        dataset_service = DatasetService()
+        # Um único limite para páginas e itens relacionados: o aquecimento nunca passa de `concurrency`
+        limiter = asyncio.Semaphore(max(concurrency, 1))
+        collected = await asyncio.gather(
+            *[dataset_service.collect_all(resource, limiter) for resource in resources],
+            return_exceptions=True,
+        )
+
+        seeded: set[ResourceKey] = set()
+        related: dict[ResourceKey, None] = {}
+        for resource, payloads in zip(resources, collected):
+            if isinstance(payloads, BaseException):
+                logger.warning("Falha ao aquecer o recurso %s: %s", resource, payloads)
+                continue
+            for payload in payloads:
+                key = as_key(payload.get("url"))
+                if key is None:
+                    continue
+                # Itens da listagem são idênticos ao detalhe: vão direto para o cache
+                self._cache.set(cache_key(key, None), payload)
+                seeded.add(key)
+                if include_relations:
+                    for relation in RELATIONS.get(resource, {}):
+                        for reference in _references(payload.get(relation)):
+                            linked = as_key(reference)
+                            if linked is not None:
+                                related[linked] = None
+
+        missing = [(key,) for key in related if key not in seeded]
+        fetched = await self._run_limited(missing, limiter, self._resolve_payload)
+        return len(seeded) + fetched
+
+    async def rewarm(self, limit: int, concurrency: int = 8, horizon_seconds: float = 0.0) -> int:
+        """Refetches, among the `limit` most requested keys, those expiring within `horizon_seconds`.
+
+        Keys already gone from the cache are left to the next client request.
+        """
+
+        expiring = [
+            (url, params) for url, params in self._hot_keys.top(limit)
+            if self._expires_within(self._build_cache_key(url, params), horizon_seconds)
+        ]
+        self._hot_keys.decay()
+        return await self._run_limited(expiring, asyncio.Semaphore(max(concurrency, 1)), self._refresh)
+
+    ################### Funções Internas ###################
+
+    async def _run_limited(self, calls: list[tuple[Any, ...]], semaphore: asyncio.Semaphore, call: Any) -> int:
+        if not calls:
+            return 0
+
+        loop = asyncio.get_running_loop()
+
+        async def _run(args: tuple[Any, ...]) -> None:
+            async with semaphore:
+                await loop.run_in_executor(None, call, *args)
+
+        results = await asyncio.gather(*[_run(args) for args in calls], return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.warning("Aquecimento do cache: %d de %d requisições falharam", len(failures), len(calls))
+        return len(calls) - len(failures)
+
+    def _expires_within(self, key: Hashable, horizon_seconds: float) -> bool:
+        remaining = self._cache.remaining_ttl(key)
+        return remaining is not None and remaining <= horizon_seconds
+
+    def _refresh(self, url: ResourceRef, params: Optional[dict[str, Any]] = None) -> None:
+        key: Hashable = self._build_cache_key(url, params)
+        self._cache.set(key, self._fetch_payload(url, params))
+
+    async def _safe_warm(self, resources: Iterable[str], include_relations: bool, concurrency: int) -> None:
+        try:
+            count = await self.warm(resources, include_relations, concurrency)
+            logger.info("Cache aquecido com %d itens", count)
+        except Exception:
+            logger.exception("Falha no aquecimento do cache")
+
+    async def _schedule_rewarm(self, interval: float, limit: int, concurrency: int) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Renova o que expiraria antes do próximo ciclo
+                await self.rewarm(limit, concurrency, horizon_seconds=interval)
+            except Exception:
+                logger.exception("Falha no reaquecimento do cache")
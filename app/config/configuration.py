@@ -1,7 +1,64 @@
 """Configurações globais"""
 
+import os
 from typing import Any, Dict
 
+DEFAULT_WARMUP_RESOURCES = ("films", "people", "planets", "species", "starships", "vehicles")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value and value.strip() else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value and value.strip() else default
+
+
+def _env_list(name: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
 
 def load_configuration() -> Dict[str, Any]:
-    return {}
+    return {
+        # Pré-aquecimento do cache na inicialização (lifespan do FastAPI); desligado por padrão
+        "warmup_enabled": _env_bool("SWAPI_WARMUP_ENABLED", False),
+        "warmup_resources": _env_list("SWAPI_WARMUP_RESOURCES", DEFAULT_WARMUP_RESOURCES),
+        "warmup_relations": _env_bool("SWAPI_WARMUP_RELATIONS", True),
+        "warmup_concurrency": max(_env_int("SWAPI_WARMUP_CONCURRENCY", 8), 1),
+        # Tempo máximo que a inicialização espera o aquecimento antes de aceitar tráfego
+        "warmup_budget_seconds": _env_float("SWAPI_WARMUP_BUDGET_SECONDS", 5.0),
+        # Reaquecimento periódico (só com o pré-aquecimento ligado; 0 desativa) das chaves mais
+        # acessadas que expirariam antes do próximo ciclo
+        "rewarm_interval_seconds": _env_float("SWAPI_REWARM_INTERVAL_SECONDS", 240.0),
+        "rewarm_hot_keys": _env_int("SWAPI_REWARM_HOT_KEYS", 200),
+        # Cache de payloads da SWAPI: TTL e limite de entradas (LRU; 0 = sem limite)
+        "cache_ttl_seconds": _env_float("SWAPI_CACHE_TTL_SECONDS", 300.0),
+        "cache_max_entries": max(_env_int("SWAPI_CACHE_MAX_ENTRIES", 10000), 0),
+        # Tabelas colunares guardam a lista de payloads inteira: limite menor
+        "table_cache_max_entries": max(_env_int("SWAPI_TABLE_CACHE_MAX_ENTRIES", 256), 0),
+        # Server-Timing em todas as respostas (sem isso, só quando pedido via X-Debug-Profile)
+        "server_timing": _env_bool("SWAPI_SERVER_TIMING", False),
+        # Exportador de spans: none (desligado), memory, logging ou otlp (OTLP/HTTP JSON)
+        "tracing_exporter": os.getenv("SWAPI_TRACING_EXPORTER", "none"),
+        "tracing_endpoint": os.getenv("SWAPI_TRACING_ENDPOINT", "http://localhost:4318/v1/traces"),
+        # Fração dos traces iniciados aqui que são gravados (traceparent recebido decide por si)
+        "tracing_sample_ratio": _env_float("SWAPI_TRACING_SAMPLE_RATIO", 1.0),
+        # Token (Bearer) exigido por /debug/profile; vazio desativa o endpoint
+        "debug_token": os.getenv("SWAPI_DEBUG_TOKEN", ""),
+        # Log de requisições lentas (/debug/slow): limiar, tamanho do buffer e espelho em log estruturado
+        "slow_request_ms": _env_float("SWAPI_SLOW_REQUEST_MS", 500.0),
+        "slow_log_size": max(_env_int("SWAPI_SLOW_LOG_SIZE", 100), 1),
+        "slow_log_to_logs": _env_bool("SWAPI_SLOW_LOG_TO_LOGS", False),
+    }
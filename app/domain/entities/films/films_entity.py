@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from dataclasses import asdict
 
+from app.domain.entities.serialization import serialize
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceRef
 from app.interfaces.dtos.planets.planets_dto import PlanetDTO
 from app.interfaces.dtos.species.species_dto import SpeciesDTO
 from app.interfaces.dtos.starships.starships_dto import StarshipDTO
@@ -11,6 +13,22 @@ from app.interfaces.dtos.people.people_dto import PeopleDTO
 
 
 class FilmEntity:
+    __slots__ = (
+        "title",
+        "episode_id",
+        "opening_crawl",
+        "director",
+        "producer",
+        "release_date",
+        "species",
+        "starships",
+        "vehicles",
+        "characters",
+        "planets",
+        "url",
+        "created",
+        "edited",
+    )
 
     def __init__(
         self,
@@ -25,7 +43,7 @@ class FilmEntity:
         vehicles: Optional[List[VehicleDTO]] = None,
         characters: Optional[List[PeopleDTO]] = None,
         planets: Optional[List[PlanetDTO]] = None,
-        url: Optional[str] = None,
+        url: Optional[ResourceRef] = None,
         created: Optional[str] = None,
         edited: Optional[str] = None,
     ) -> None:
@@ -35,11 +53,11 @@ class FilmEntity:
         self.director = director
         self.producer = producer
         self.release_date = release_date
-        self.species = list(species) if species is not None else []
-        self.starships = list(starships) if starships is not None else []
-        self.vehicles = list(vehicles) if vehicles is not None else []
-        self.characters = list(characters) if characters is not None else []
-        self.planets = list(planets) if planets is not None else []
+        self.species = species if species is not None else []
+        self.starships = starships if starships is not None else []
+        self.vehicles = vehicles if vehicles is not None else []
+        self.characters = characters if characters is not None else []
+        self.planets = planets if planets is not None else []
         self.url = url
         self.created = created
         self.edited = edited
@@ -63,26 +81,5 @@ class FilmEntity:
             edited=data.get("edited"),
         )
 
-    def to_dict(self) -> dict[str, object]:
-        def _asdict_or_value(value: object) -> object:
-            try:
-                return asdict(value)
-            except Exception:
-                return value
-
-        return {
-            "title": self.title,
-            "episode_id": self.episode_id,
-            "opening_crawl": self.opening_crawl,
-            "director": self.director,
-            "producer": self.producer,
-            "release_date": self.release_date,
-            "species": [_asdict_or_value(species) for species in self.species],
-            "starships": [_asdict_or_value(starship) for starship in self.starships],
-            "vehicles": [_asdict_or_value(vehicle) for vehicle in self.vehicles],
-            "characters": [_asdict_or_value(character) for character in self.characters],
-            "planets": [_asdict_or_value(planet) for planet in self.planets],
-            "url": self.url,
-            "created": self.created,
-            "edited": self.edited,
-        }
\ No newline at end of file
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> dict[str, object]:
+        return serialize(self, fields)
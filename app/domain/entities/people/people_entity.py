@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import List, Optional
 
+from app.domain.entities.serialization import serialize
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceRef
 from app.interfaces.dtos.planets.planets_dto import PlanetDTO
 from app.interfaces.dtos.species.species_dto import SpeciesDTO
 from app.interfaces.dtos.starships.starships_dto import StarshipDTO
@@ -10,6 +13,24 @@ from app.interfaces.dtos.vehicles.vehicles_dto import VehicleDTO
 from app.interfaces.dtos.films.films_dto import FilmDTO
 
 class PeopleEntity:
+    __slots__ = (
+        "name",
+        "birth_year",
+        "eye_color",
+        "gender",
+        "hair_color",
+        "height",
+        "mass",
+        "skin_color",
+        "homeworld",
+        "films",
+        "species",
+        "starships",
+        "vehicles",
+        "url",
+        "created",
+        "edited",
+    )
 
     def __init__(
         self,
@@ -26,7 +47,7 @@ class PeopleEntity:
         species: Optional[List[SpeciesDTO]] = None,
         starships: Optional[List[StarshipDTO]] = None,
         vehicles: Optional[List[VehicleDTO]] = None,
-        url: Optional[str] = None,
+        url: Optional[ResourceRef] = None,
         created: Optional[str] = None,
         edited: Optional[str] = None,
     ) -> None:
@@ -39,10 +60,10 @@ class PeopleEntity:
         self.mass = mass
         self.skin_color = skin_color
         self.homeworld = homeworld
-        self.films = list(films) if films is not None else []
-        self.species = list(species) if species is not None else []
-        self.starships = list(starships) if starships is not None else []
-        self.vehicles = list(vehicles) if vehicles is not None else []
+        self.films = films if films is not None else []
+        self.species = species if species is not None else []
+        self.starships = starships if starships is not None else []
+        self.vehicles = vehicles if vehicles is not None else []
         self.url = url
         self.created = created
         self.edited = edited
@@ -68,28 +89,5 @@ class PeopleEntity:
             edited=data.get("edited"),
         )
 
-    def to_dict(self) -> dict[str, object]:
-        def _asdict_or_value(value: object) -> object:
-            try:
-                return asdict(value)
-            except Exception:
-                return value
-
-        return {
-            "name": self.name,
-            "birth_year": self.birth_year,
-            "eye_color": self.eye_color,
-            "gender": self.gender,
-            "hair_color": self.hair_color,
-            "height": self.height,
-            "mass": self.mass,
-            "skin_color": self.skin_color,
-            "homeworld": _asdict_or_value(self.homeworld) if self.homeworld else None,
-            "films": [_asdict_or_value(film) for film in self.films],
-            "species": [_asdict_or_value(species) for species in self.species],
-            "starships": [_asdict_or_value(starship) for starship in self.starships],
-            "vehicles": [_asdict_or_value(vehicle) for vehicle in self.vehicles],
-            "url": self.url,
-            "created": self.created,
-            "edited": self.edited,
-        }
\ No newline at end of file
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> dict[str, object]:
+        return serialize(self, fields)
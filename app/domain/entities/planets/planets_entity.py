@@ -3,12 +3,31 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import List, Optional
 
+from app.domain.entities.serialization import serialize
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceRef
 from app.interfaces.dtos.people.people_dto import PeopleDTO
 from app.interfaces.dtos.films.films_dto import FilmDTO
 
 
 class PlanetEntity:
-    
+    __slots__ = (
+        "name",
+        "rotation_period",
+        "orbital_period",
+        "diameter",
+        "climate",
+        "gravity",
+        "terrain",
+        "surface_water",
+        "population",
+        "residents",
+        "films",
+        "url",
+        "created",
+        "edited",
+    )
+
     def __init__(
         self,
         name: str,
@@ -22,7 +41,7 @@ class PlanetEntity:
         population: Optional[str] = None,
         residents: Optional[List[PeopleDTO]] = None,
         films: Optional[List[FilmDTO]] = None,
-        url: Optional[str] = None,
+        url: Optional[ResourceRef] = None,
         created: Optional[str] = None,
         edited: Optional[str] = None,
     ) -> None:
@@ -35,8 +54,8 @@ class PlanetEntity:
         self.terrain = terrain
         self.surface_water = surface_water
         self.population = population
-        self.residents = list(residents) if residents is not None else []
-        self.films = list(films) if films is not None else []
+        self.residents = residents if residents is not None else []
+        self.films = films if films is not None else []
         self.url = url
         self.created = created
         self.edited = edited
@@ -60,26 +79,5 @@ class PlanetEntity:
             edited=data.get("edited"),
         )
 
-    def to_dict(self) -> dict[str, object]:
-        def _asdict_or_value(value: object) -> object:
-            try:
-                return asdict(value)
-            except Exception:
-                return value
-
-        return {
-            "name": self.name,
-            "rotation_period": self.rotation_period,
-            "orbital_period": self.orbital_period,
-            "diameter": self.diameter,
-            "climate": self.climate,
-            "gravity": self.gravity,
-            "terrain": self.terrain,
-            "surface_water": self.surface_water,
-            "population": self.population,
-            "residents": [_asdict_or_value(resident) for resident in self.residents],
-            "films": [_asdict_or_value(film) for film in self.films],
-            "url": self.url,
-            "created": self.created,
-            "edited": self.edited,
-        }
\ No newline at end of file
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> dict[str, object]:
+        return serialize(self, fields)
@@ -0,0 +1,124 @@
+"""Precompiled, type-dispatched serializers shared by every entity and DTO."""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from functools import cache
+from operator import attrgetter
+from typing import Any, Callable, Optional
+
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceKey, build_url
+
+Serializer = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Tipos primitivos já são serializáveis; não há fallback por exceção
+_SERIALIZERS: dict[type, Serializer] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    # Chaves `(recurso, id)` voltam a ser URLs apenas na borda da resposta
+    ResourceKey: build_url,
+}
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    if is_dataclass(cls):
+        return tuple(item.name for item in fields(cls))
+    return tuple(getattr(cls, "__slots__", ()))
+
+
+def _compile(cls: type) -> Serializer:
+    """Builds the serializer for `cls` once, from its dataclass fields or slots."""
+
+    names = _field_names(cls)
+    if not names:
+        return _identity
+
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        single = getter
+        getter = lambda obj: (single(obj),)  # noqa: E731
+
+    references = getattr(cls, "reference_fields", None) if is_dataclass(cls) else None
+    if references is not None:
+        # DTOs só carregam primitivos e referências: saída rasa, convertendo apenas os campos declarados
+        def serialize_dto(obj: Any) -> dict[str, Any]:
+            result = dict(zip(names, getter(obj)))
+            for name in references:
+                value = result[name]
+                if value:
+                    result[name] = serialize(value)
+            return result
+
+        return serialize_dto
+
+    def serialize_object(obj: Any) -> dict[str, Any]:
+        return {name: serialize(value) for name, value in zip(names, getter(obj))}
+
+    return serialize_object
+
+
+def serializer_for(cls: type) -> Serializer:
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        serializer = _compile(cls)
+        _SERIALIZERS[cls] = serializer
+    return serializer
+
+
+def serialize_list(values: list[Any]) -> list[Any]:
+    # Listas só de URLs saem sem cópia; nas demais, decisão por item (DTOs hidratados ao lado de chaves)
+    result = None
+    for index, value in enumerate(values):
+        if type(value) is str:
+            if result is not None:
+                result.append(value)
+            continue
+        if result is None:
+            result = values[:index]
+        result.append(build_url(value) if type(value) is ResourceKey else serialize(value))
+    return values if result is None else result
+
+
+def serialize_selected(value: Any, selection: FieldSelection) -> Any:
+    """Serializes only the attributes named in `selection`, recursing into relationships."""
+
+    if type(value) is list:
+        return [serialize_selected(item, selection) for item in value]
+
+    names = _field_names(type(value))
+    if not names:
+        return serialize(value)
+
+    result = {}
+    for name in names:
+        if name in selection.names:
+            child = selection.nested.get(name)
+            item = getattr(value, name)
+            result[name] = serialize(item) if child is None else serialize_selected(item, child)
+    return result
+
+
+def serialize(value: Any, fields: Optional[FieldSelection] = None) -> Any:
+    """Serializes an entity, DTO, list or primitive into JSON-ready values."""
+
+    if fields is not None:
+        return serialize_selected(value, fields)
+
+    value_type = type(value)
+    if value_type is list:
+        return serialize_list(value)
+
+    serializer = _SERIALIZERS.get(value_type)
+    if serializer is None:
+        serializer = serializer_for(value_type)
+    return serializer(value)
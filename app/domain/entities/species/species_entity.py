@@ -3,11 +3,31 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import List, Optional
 
+from app.domain.entities.serialization import serialize
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceRef
 from app.interfaces.dtos.films.films_dto import FilmDTO
 from app.interfaces.dtos.people.people_dto import PeopleDTO
 from app.interfaces.dtos.planets.planets_dto import PlanetDTO
 
 class SpeciesEntity:
+    __slots__ = (
+        "name",
+        "classification",
+        "designation",
+        "average_height",
+        "average_lifespan",
+        "eye_colors",
+        "hair_colors",
+        "skin_colors",
+        "language",
+        "homeworld",
+        "people",
+        "films",
+        "url",
+        "created",
+        "edited",
+    )
 
     def __init__(
         self,
@@ -23,7 +43,7 @@ class SpeciesEntity:
         homeworld: Optional[PlanetDTO] = None,
         people: Optional[List[PeopleDTO]] = None,
         films: Optional[List[FilmDTO]] = None,
-        url: Optional[str] = None,
+        url: Optional[ResourceRef] = None,
         created: Optional[str] = None,
         edited: Optional[str] = None,
     ) -> None:
@@ -37,8 +57,8 @@ class SpeciesEntity:
         self.skin_colors = skin_colors
         self.language = language
         self.homeworld = homeworld
-        self.people = list(people) if people is not None else []
-        self.films = list(films) if films is not None else []
+        self.people = people if people is not None else []
+        self.films = films if films is not None else []
         self.url = url
         self.created = created
         self.edited = edited
@@ -63,27 +83,5 @@ class SpeciesEntity:
             edited=data.get("edited"),
         )
 
-    def to_dict(self) -> dict[str, object]:
-        def _asdict_or_value(value: object) -> object:
-            try:
-                return asdict(value)
-            except Exception:
-                return value
-
-        return {
-            "name": self.name,
-            "classification": self.classification,
-            "designation": self.designation,
-            "average_height": self.average_height,
-            "average_lifespan": self.average_lifespan,
-            "eye_colors": self.eye_colors,
-            "hair_colors": self.hair_colors,
-            "skin_colors": self.skin_colors,
-            "language": self.language,
-            "homeworld": _asdict_or_value(self.homeworld) if self.homeworld else None,
-            "people": [_asdict_or_value(person) for person in self.people],
-            "films": [_asdict_or_value(film) for film in self.films],
-            "url": self.url,
-            "created": self.created,
-            "edited": self.edited,
-        }
\ No newline at end of file
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> dict[str, object]:
+        return serialize(self, fields)
@@ -3,10 +3,33 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import List, Optional
 
+from app.domain.entities.serialization import serialize
+from app.domain.fields.field_selection import FieldSelection
+from app.domain.keys.resource_key import ResourceRef
 from app.interfaces.dtos.films.films_dto import FilmDTO
 from app.interfaces.dtos.people.people_dto import PeopleDTO
 
 class StarshipEntity:
+    __slots__ = (
+        "name",
+        "model",
+        "starship_class",
+        "manufacturer",
+        "cost_in_credits",
+        "length",
+        "crew",
+        "passengers",
+        "max_atmosphering_speed",
+        "hyperdrive_rating",
+        "MGLT",
+        "cargo_capacity",
+        "consumables",
+        "films",
+        "pilots",
+        "url",
+        "created",
+        "edited",
+    )
 
     def __init__(
         self,
@@ -25,7 +48,7 @@ class StarshipEntity:
         consumables: Optional[str] = None,
         films: Optional[List[FilmDTO]] = None,
         pilots: Optional[List[PeopleDTO]] = None,
-        url: Optional[str] = None,
+        url: Optional[ResourceRef] = None,
         created: Optional[str] = None,
         edited: Optional[str] = None,
     ) -> None:
@@ -42,8 +65,8 @@ class StarshipEntity:
         self.MGLT = MGLT
         self.cargo_capacity = cargo_capacity
         self.consumables = consumables
-        self.films = list(films) if films is not None else []
-        self.pilots = list(pilots) if pilots is not None else []
+        self.films = films if films is not None else []
+        self.pilots = pilots if pilots is not None else []
         self.url = url
         self.created = created
         self.edited = edited
@@ -71,30 +94,5 @@ class StarshipEntity:
             edited=data.get("edited"),
         )
 
-    def to_dict(self) -> dict[str, object]:
-        def _asdict_or_value(value: object) -> object:
-            try:
-                return asdict(value)
-            except Exception:
-                return value
-
-        return {
-            "name": self.name,
-            "model": self.model,
-            "starship_class": self.starship_class,
-            "manufacturer": self.manufacturer,
-            "cost_in_credits": self.cost_in_credits,
-            "length": self.length,
-            "crew": self.crew,
-            "passengers": self.passengers,
-            "max_atmosphering_speed": self.max_atmosphering_speed,
-            "hyperdrive_rating": self.hyperdrive_rating,
-            "MGLT": self.MGLT,
-            "cargo_capacity": self.cargo_capacity,
-            "consumables": self.consumables,
-            "films": [_asdict_or_value(film) for film in self.films],
-            "pilots": [_asdict_or_value(pilot) for pilot in self.pilots],
-            "url": self.url,
-            "created": self.created,
-            "edited": self.edited,
-        }
\ No newline at end of file
+    def to_dict(self, fields: Optional[FieldSelection] = None) -> dict[str, object]:
+        return serialize(self, fields)
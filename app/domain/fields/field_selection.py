@@ -0,0 +1,80 @@
+"""Sparse fieldsets parsed from the `fields=` query parameter."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Mapping, Optional
+
+# Campos que a chave `(recurso, id)` já fornece sem buscar o recurso
+URL_FIELDS = frozenset({"url"})
+
+
+class FieldSelection:
+    """Selected attribute names, plus nested selections for relationships.
+
+    `fields=title,characters.name` selects `title` and `characters` on the
+    root, with only `name` on each character. A relationship listed without
+    sub-fields (`fields=characters`) keeps all of its attributes.
+    """
+
+    __slots__ = ("names", "nested")
+
+    def __init__(self, names: frozenset[str], nested: Mapping[str, FieldSelection]) -> None:
+        self.names = names
+        self.nested = nested
+
+    def includes(self, name: str) -> bool:
+        return name in self.names
+
+    def child(self, name: str) -> Optional[FieldSelection]:
+        """Selection applied to a relationship; `None` keeps every attribute."""
+
+        return self.nested.get(name)
+
+    def url_only(self) -> bool:
+        return self.names <= URL_FIELDS
+
+    def depth(self) -> int:
+        """Number of levels in the selection (`characters.homeworld` has depth 2)."""
+
+        return 1 + max((child.depth() for child in self.nested.values()), default=0)
+
+    def paths(self) -> list[str]:
+        """Sorted leaf paths; equivalent selections (`b,a` and `a,b,a`) give the same list."""
+
+        paths = []
+        for name in self.names:
+            child = self.nested.get(name)
+            paths.extend([f"{name}.{path}" for path in child.paths()] if child is not None else [name])
+        return sorted(paths)
+
+
+def _build(paths: list[list[str]]) -> FieldSelection:
+    names: set[str] = set()
+    children: dict[str, list[list[str]]] = {}
+    for head, *rest in paths:
+        names.add(head)
+        if rest:
+            children.setdefault(head, []).append(rest)
+    return FieldSelection(
+        frozenset(names),
+        {name: _build(child_paths) for name, child_paths in children.items()},
+    )
+
+
+@lru_cache(maxsize=512)
+def parse_fields(value: Optional[str]) -> Optional[FieldSelection]:
+    """Parses `fields=title,characters.name`; empty or missing means every field."""
+
+    if not value or not isinstance(value, str):
+        return None
+
+    paths = [
+        [part.strip() for part in token.split(".")]
+        for token in value.split(",")
+        if token.strip()
+    ]
+    paths = [path for path in paths if all(path)]
+    if not paths:
+        return None
+    return _build(paths)
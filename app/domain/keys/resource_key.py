@@ -0,0 +1,150 @@
+"""Compact `(resource, id)` keys for SWAPI URLs."""
+
+from __future__ import annotations
+
+import os
+from enum import Enum
+from functools import lru_cache
+from typing import Hashable, NamedTuple, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_SWAPI_API_ROOT = "https://swapi.dev/api/"
+# Raiz usada para montar URLs a partir das chaves; SWAPI_BASE_URL aponta para um espelho ou o stub local
+SWAPI_API_ROOT = (os.getenv("SWAPI_BASE_URL") or DEFAULT_SWAPI_API_ROOT).rstrip("/") + "/"
+
+
+class SwapiResource(str, Enum):
+    FILMS = "films"
+    PEOPLE = "people"
+    PLANETS = "planets"
+    SPECIES = "species"
+    STARSHIPS = "starships"
+    VEHICLES = "vehicles"
+
+
+_RESOURCES = {resource.value: resource for resource in SwapiResource}
+
+
+class ResourceKey(NamedTuple):
+    """Identity of one SWAPI resource; the URL is rebuilt only when serialized."""
+
+    resource: SwapiResource
+    id: int
+
+    @property
+    def url(self) -> str:
+        return build_url(self)
+
+    def __str__(self) -> str:
+        return build_url(self)
+
+
+# Instâncias compartilhadas para os recursos em uso; limitado porque ids vêm também dos clientes
+@lru_cache(maxsize=8192)
+def key_for(resource: SwapiResource, item_id: int) -> ResourceKey:
+    return ResourceKey(resource, item_id)
+
+
+# Referência a um recurso relacionado: chave canônica ou URL ainda não normalizada
+ResourceRef = Union[ResourceKey, str]
+
+
+def _split_path(url: str) -> tuple[Optional[SwapiResource], Optional[int], str]:
+    parts = urlsplit(url.strip())
+    segments = [segment for segment in parts.path.split("/") if segment]
+    # Aceita http/https, com ou sem barra final e qualquer host (ex.: espelhos/stubs)
+    for index, segment in enumerate(segments):
+        resource = _RESOURCES.get(segment)
+        if resource is None:
+            continue
+        rest = segments[index + 1:]
+        if not rest:
+            return resource, None, parts.query
+        if len(rest) == 1 and rest[0].isdigit():
+            return resource, int(rest[0]), parts.query
+    return None, None, parts.query
+
+
+@lru_cache(maxsize=8192)
+def parse_url(url: str) -> Optional[ResourceKey]:
+    """Maps a SWAPI detail URL to its key; the same URL always yields the same object."""
+
+    if not isinstance(url, str):
+        return None
+    resource, item_id, _ = _split_path(url)
+    if resource is None or item_id is None:
+        return None
+    return key_for(resource, item_id)
+
+
+def as_key(value: object) -> Optional[ResourceKey]:
+    if isinstance(value, ResourceKey):
+        return value
+    if isinstance(value, str):
+        return parse_url(value)
+    return None
+
+
+def api_root() -> str:
+    return SWAPI_API_ROOT
+
+
+def set_api_root(root: str) -> None:
+    """Points every URL built from a key at another SWAPI (e.g. the benchmark stub)."""
+
+    global SWAPI_API_ROOT
+    SWAPI_API_ROOT = root.rstrip("/") + "/"
+    build_url.cache_clear()
+
+
+@lru_cache(maxsize=8192)
+def build_url(key: ResourceKey) -> str:
+    return f"{SWAPI_API_ROOT}{key.resource.value}/{key.id}/"
+
+
+def to_url(value: ResourceRef) -> str:
+    return build_url(value) if isinstance(value, ResourceKey) else value
+
+
+def resource_of(value: ResourceRef) -> Optional[SwapiResource]:
+    """Resource addressed by a key or by a detail/list URL."""
+
+    if isinstance(value, ResourceKey):
+        return value.resource
+    return _split_path(value)[0] if isinstance(value, str) else None
+
+
+def cache_key(url: ResourceRef, params: Optional[dict[str, object]] = None) -> Hashable:
+    """Normalized cache key: the resource key for details, `(resource, params)` for lists."""
+
+    if isinstance(url, ResourceKey):
+        if not params:
+            return url
+        return url, tuple(sorted((str(name), str(value)) for name, value in params.items()))
+
+    resource, item_id, query = _split_path(url)
+    merged = dict(parse_qsl(query))
+    if params:
+        merged.update({str(name): str(value) for name, value in params.items() if value is not None})
+    normalized_params = tuple(sorted(merged.items()))
+
+    if resource is None:
+        return url, normalized_params
+    if item_id is not None:
+        key = parse_url(url)
+        return key if not normalized_params else (key, normalized_params)
+    return resource, normalized_params
+
+
+def parse_ids(value: Optional[str]) -> Optional[list[int]]:
+    """Parses `ids=1,2,3` keeping the first occurrence of each id."""
+
+    if not value:
+        return None
+    try:
+        ids = [int(token) for token in value.split(",") if token.strip()]
+    except ValueError as exc:
+        raise ValueError("O parâmetro ids deve conter IDs inteiros separados por vírgula") from exc
+    if any(item < 1 for item in ids):
+        raise ValueError("O parâmetro ids deve conter IDs inteiros separados por vírgula")
+    return list(dict.fromkeys(ids)) or None
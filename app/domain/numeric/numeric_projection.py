@@ -0,0 +1,168 @@
+"""Typed numeric projection of the string fields returned by SWAPI."""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Mapping, Optional
+
+from app.domain.keys.resource_key import ResourceKey, as_key
+
+NumericParser = Callable[[Any], Optional[float]]
+
+UNKNOWN_VALUES = frozenset({"", "unknown", "n/a", "none", "indefinite", "varies"})
+
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_BIRTH_YEAR_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*(BBY|ABY)$", re.IGNORECASE)
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*(hour|day|week|month|year)s?$", re.IGNORECASE)
+_DAYS_PER_UNIT = {"hour": 1 / 24, "day": 1.0, "week": 7.0, "month": 30.0, "year": 365.0}
+
+
+def _normalized(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return None if text.lower() in UNKNOWN_VALUES else text
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """Parses "172", "1,000,000", "1000km" or "1 standard"; unknowns become None."""
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = _normalized(value)
+    if text is None:
+        return None
+    match = _NUMBER_RE.search(text.replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def parse_birth_year(value: Any) -> Optional[float]:
+    """Maps "19BBY" to -19.0 and "4ABY" to 4.0 (years relative to Yavin)."""
+
+    text = _normalized(value)
+    if text is None:
+        return None
+    match = _BIRTH_YEAR_RE.match(text)
+    if not match:
+        return None
+    years = float(match.group(1))
+    return -years if match.group(2).upper() == "BBY" else years
+
+
+def parse_duration_days(value: Any) -> Optional[float]:
+    """Normalizes consumables such as "2 months" or "1 year" to days."""
+
+    text = _normalized(value)
+    if text is None:
+        return None
+    match = _DURATION_RE.match(text)
+    if not match:
+        return None
+    return float(match.group(1)) * _DAYS_PER_UNIT[match.group(2).lower()]
+
+
+def parse_date(value: Any) -> Optional[float]:
+    """Parses ISO dates/timestamps to POSIX seconds so they sort numerically."""
+
+    text = _normalized(value)
+    if text is None:
+        return None
+    try:
+        if len(text) == 10:
+            day = date.fromisoformat(text)
+            return datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+_TIMESTAMPS: dict[str, NumericParser] = {"created": parse_date, "edited": parse_date}
+
+_CRAFT_FIELDS: dict[str, NumericParser] = {
+    "cost_in_credits": parse_number,
+    "length": parse_number,
+    "crew": parse_number,
+    "passengers": parse_number,
+    "max_atmosphering_speed": parse_number,
+    "cargo_capacity": parse_number,
+    "consumables": parse_duration_days,
+}
+
+NUMERIC_FIELDS: dict[str, dict[str, NumericParser]] = {
+    "films": {"episode_id": parse_number, "release_date": parse_date, **_TIMESTAMPS},
+    "people": {"height": parse_number, "mass": parse_number, "birth_year": parse_birth_year, **_TIMESTAMPS},
+    "planets": {
+        "rotation_period": parse_number,
+        "orbital_period": parse_number,
+        "diameter": parse_number,
+        "gravity": parse_number,
+        "surface_water": parse_number,
+        "population": parse_number,
+        **_TIMESTAMPS,
+    },
+    "species": {"average_height": parse_number, "average_lifespan": parse_number, **_TIMESTAMPS},
+    "starships": {**_CRAFT_FIELDS, "hyperdrive_rating": parse_number, "MGLT": parse_number, **_TIMESTAMPS},
+    "vehicles": {**_CRAFT_FIELDS, **_TIMESTAMPS},
+}
+
+
+def _reader(source: Any) -> Callable[[str], Any]:
+    if isinstance(source, Mapping):
+        return source.get
+    return lambda name: getattr(source, name, None)
+
+
+class NumericProjection:
+    """Parses the numeric fields of a resource once per payload version.
+
+    Projections are cached per resource key together with the `edited`
+    timestamp they were parsed from, so the same SWAPI resource is parsed
+    once no matter how many requests sort or filter on it. An edit upstream
+    replaces the entry; payloads without `edited` (sparse DTOs) are parsed
+    every time, since their version is unknown. At most `max_entries`
+    resources are kept, least recently used first out.
+    """
+
+    max_entries = 4096
+
+    def __init__(self) -> None:
+        self._cache: OrderedDict[ResourceKey, tuple[Any, dict[str, Optional[float]]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fields(self, resource: str) -> dict[str, NumericParser]:
+        return NUMERIC_FIELDS.get(resource, {})
+
+    def project(self, resource: str, source: Any) -> dict[str, Optional[float]]:
+        read = _reader(source)
+        key = as_key(read("url"))
+        edited = read("edited")
+        cacheable = key is not None and edited is not None
+        if cacheable:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None and entry[0] == edited:
+                    self._cache.move_to_end(key)
+                    return entry[1]
+
+        projection = {name: parser(read(name)) for name, parser in self.fields(resource).items()}
+        if cacheable:
+            with self._lock:
+                # Substitui a versão anterior do mesmo recurso
+                self._cache[key] = (edited, projection)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return projection
+
+    def value(self, resource: str, source: Any, field_name: str) -> Optional[float]:
+        return self.project(resource, source).get(field_name)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+numeric_projection = NumericProjection()
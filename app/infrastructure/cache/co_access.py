@@ -0,0 +1,108 @@
+"""Approximate co-access statistics between SWAPI resources, used to predict follow-up lookups."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Hashable
+
+import numpy as np
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimates: never under-counts, over-counts only on hash collisions."""
+
+    def __init__(self, width: int = 4096, depth: int = 4) -> None:
+        self._width = width
+        self._depth = depth
+        self._table = np.zeros((depth, width), dtype=np.int32)
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        for row, column in enumerate(self._columns(item)):
+            self._table[row, column] += count
+
+    def estimate(self, item: Hashable) -> int:
+        return int(min(self._table[row, column] for row, column in enumerate(self._columns(item))))
+
+    def clear(self) -> None:
+        self._table.fill(0)
+
+    def _columns(self, item: Hashable) -> list[int]:
+        return [hash((row, item)) % self._width for row in range(self._depth)]
+
+
+class CoAccessTracker:
+    """Counts how often a related item is requested after the item that links to it was served.
+
+    `expose` registers the links present in a response; a later `observe` of
+    one of those targets, within `window_seconds`, counts as a co-access. Key
+    pairs live in a count-min sketch (the pair space is quadratic), while the
+    handful of `(resource, relation)` rates are kept exactly and let cold keys
+    benefit from what was learned on the rest of the resource.
+    """
+
+    def __init__(self, window_seconds: float = 60.0, max_exposed: int = 4096) -> None:
+        self._window_seconds = window_seconds
+        self._max_exposed = max_exposed
+        self._pairs = CountMinSketch()
+        self._sources = CountMinSketch()
+        self._relation_served: Counter[tuple[str, str]] = Counter()
+        self._relation_hits: Counter[tuple[str, str]] = Counter()
+        # alvo -> [(origem, (recurso, relação), instante)] ainda aguardando um acesso
+        self._exposed: OrderedDict[Hashable, list[tuple[Hashable, tuple[str, str], float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def served(self, source: Hashable) -> None:
+        with self._lock:
+            self._sources.add(source)
+
+    def expose(self, source: Hashable, relation: tuple[str, str], target: Hashable) -> None:
+        with self._lock:
+            self._relation_served[relation] += 1
+            self._exposed.setdefault(target, []).append((source, relation, time.monotonic()))
+            self._exposed.move_to_end(target)
+            while len(self._exposed) > self._max_exposed:
+                self._exposed.popitem(last=False)
+
+    def accessed(self, source: Hashable, relation: tuple[str, str], target: Hashable) -> None:
+        """Records a co-access that happened within the same request (e.g. a hydrated relation)."""
+
+        with self._lock:
+            self._relation_served[relation] += 1
+            self._relation_hits[relation] += 1
+            self._pairs.add((source, target))
+
+    def observe(self, target: Hashable) -> None:
+        if target not in self._exposed:
+            return
+        with self._lock:
+            exposures = self._exposed.pop(target, ())
+            deadline = time.monotonic() - self._window_seconds
+            for source, relation, exposed_at in exposures:
+                if exposed_at >= deadline:
+                    self._relation_hits[relation] += 1
+                    self._pairs.add((source, target))
+
+    def probability(
+        self,
+        source: Hashable,
+        relation: tuple[str, str],
+        target: Hashable,
+        min_samples: int = 5,
+    ) -> float:
+        """Estimated chance that `target` is requested after `source` is served."""
+
+        with self._lock:
+            by_key = self._pairs.estimate((source, target)) / max(self._sources.estimate(source), 1)
+            served = self._relation_served[relation]
+            by_relation = self._relation_hits[relation] / served if served >= min_samples else 0.0
+        return min(max(by_key, by_relation), 1.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pairs.clear()
+            self._sources.clear()
+            self._relation_served.clear()
+            self._relation_hits.clear()
+            self._exposed.clear()
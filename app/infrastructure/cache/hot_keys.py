@@ -0,0 +1,55 @@
+"""Tracking of frequently requested cache keys, used to re-warm them before expiry."""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import Any, Hashable, Optional
+
+# Como refazer a requisição de uma chave: URL (ou chave do recurso) e parâmetros
+RefetchArgs = tuple[Any, Optional[dict[str, Any]]]
+
+
+class HotKeyTracker:
+    """Decaying access counts per cache key, bounded to roughly `max_keys` entries."""
+
+    def __init__(self, max_keys: int = 1024) -> None:
+        self._max_keys = max_keys
+        self._counts: dict[Hashable, float] = {}
+        self._requests: dict[Hashable, RefetchArgs] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: Hashable, url: Any, params: Optional[dict[str, Any]] = None) -> None:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                self._requests[key] = (url, dict(params) if params else None)
+                count = 0.0
+            self._counts[key] = count + 1.0
+            if len(self._counts) > 2 * self._max_keys:
+                self._prune(self._max_keys)
+
+    def top(self, limit: int) -> list[RefetchArgs]:
+        with self._lock:
+            hottest = heapq.nlargest(limit, self._counts.items(), key=lambda item: item[1])
+            return [self._requests[key] for key, _ in hottest]
+
+    def decay(self, factor: float = 0.5) -> None:
+        """Ages the counts so keys that stopped being requested fall out of the hot set."""
+
+        with self._lock:
+            self._counts = {key: count * factor for key, count in self._counts.items() if count * factor >= 0.5}
+            self._requests = {key: self._requests[key] for key in self._counts}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._requests.clear()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _prune(self, keep: int) -> None:
+        hottest = heapq.nlargest(keep, self._counts.items(), key=lambda item: item[1])
+        self._counts = dict(hottest)
+        self._requests = {key: self._requests[key] for key in self._counts}
@@ -0,0 +1,38 @@
+"""Interning of repeated SWAPI strings before payloads enter the cache."""
+
+from __future__ import annotations
+
+from sys import intern
+from typing import Any
+
+from app.domain.keys.resource_key import parse_url
+
+# Textos livres (ex.: opening_crawl) raramente se repetem; internar só valores curtos
+MAX_INTERNED_LENGTH = 128
+
+
+def intern_value(value: Any) -> Any:
+    if isinstance(value, str):
+        if value.startswith(("http://", "https://")):
+            # URLs de recursos viram chaves `(recurso, id)`; paginação e links externos seguem texto
+            key = parse_url(value)
+            if key is not None:
+                return key
+        return intern(value) if len(value) <= MAX_INTERNED_LENGTH else value
+    if isinstance(value, list):
+        return [intern_value(item) for item in value]
+    if isinstance(value, dict):
+        return intern_payload(value)
+    return value
+
+
+def intern_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Returns a copy of `payload` whose keys and short strings are interned.
+
+    Colors, genders and climates repeat across hundreds of resources;
+    interning them once at ingestion makes every DTO built from the cached
+    payload share a single string object per distinct value. Resource URLs
+    are replaced by their shared `ResourceKey`.
+    """
+
+    return {intern(key): intern_value(value) for key, value in payload.items()}
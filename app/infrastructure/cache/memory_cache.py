@@ -1,32 +1,88 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from time import monotonic
-from typing import Any
+from typing import Any, Hashable, Optional
 
 
 class MemoryCache:
+    """TTL cache, optionally bounded to `max_entries` with least-recently-used eviction."""
 
-    def __init__(self, ttl_seconds: float = 300.0) -> None:
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: Optional[int] = None) -> None:
         self._ttl_seconds = ttl_seconds
-        self._store: dict[str, tuple[float | None, Any]] = {}
+        # None ou 0: sem limite de entradas
+        self._max_entries = max_entries or None
+        self._store: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        # Contadores simples (lidos pelo /metrics): sem lock, aproximados sob concorrência
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    def get(self, key: str) -> Any | None:
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    def configure(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None) -> None:
+        """Changes the TTL (new entries only) and the entry limit; `max_entries=0` removes the limit."""
+
+        if ttl_seconds is not None:
+            self._ttl_seconds = ttl_seconds
+        if max_entries is not None:
+            self._max_entries = max_entries or None
+            self._trim()
+
+    def get(self, key: Hashable) -> Any | None:
         entry = self._store.get(key)
         if entry is None:
+            self.misses += 1
             return None
 
         expires_at, value = entry
         if expires_at is not None and monotonic() >= expires_at:
-            del self._store[key]
+            self._store.pop(key, None)
+            self.misses += 1
+            self.evictions += 1
             return None
 
+        if self._max_entries is not None:
+            try:
+                self._store.move_to_end(key)
+            except KeyError:
+                # Removida por outra thread entre a leitura e a promoção: o valor lido continua válido
+                pass
+        self.hits += 1
         return value
 
-    def set(self, key: str, value: Any) -> None:
+    def remaining_ttl(self, key: Hashable) -> Optional[float]:
+        """Seconds until `key` expires; None when it is absent or never expires."""
+
+        entry = self._store.get(key)
+        if entry is None or entry[0] is None:
+            return None
+        return max(entry[0] - monotonic(), 0.0)
+
+    def set(self, key: Hashable, value: Any) -> None:
         expires_at = None
         if self._ttl_seconds > 0:
             expires_at = monotonic() + self._ttl_seconds
+        if self._max_entries is not None:
+            # Reinserir leva a chave para o fim da ordem (mais recente), mesmo se já existia
+            self._store.pop(key, None)
         self._store[key] = (expires_at, value)
+        self._trim()
 
     def clear(self) -> None:
         self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _trim(self) -> None:
+        if self._max_entries is None:
+            return
+        while len(self._store) > self._max_entries:
+            try:
+                self._store.popitem(last=False)
+            except KeyError:
+                break
+            self.evictions += 1
@@ -0,0 +1,85 @@
+"""Vectorized group-by kernels over columnar tables."""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.infrastructure.columnar.columnar_table import ColumnarTable
+
+METRICS = ("count", "sum", "mean", "min", "max")
+
+
+def group_codes(table: ColumnarTable, group_by: Optional[str]) -> tuple[np.ndarray, list[Optional[str]]]:
+    """Maps each row to a dense group index; rows without a value form the `None` group."""
+
+    if group_by is None:
+        return np.zeros(table.size, dtype=np.int64), [None]
+
+    column = table.categorical[group_by]
+    labels: list[Optional[str]] = list(column.categories)
+    codes = column.codes.astype(np.int64)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels.append(None)
+    return codes, labels
+
+
+def aggregate(
+    codes: np.ndarray,
+    group_count: int,
+    values: np.ndarray,
+    metrics: Sequence[str] = METRICS,
+    percentiles: Sequence[float] = (),
+) -> dict[str, np.ndarray]:
+    """Computes every metric for every group in one pass of sort + bincount.
+
+    NaN values (unknown in SWAPI) are ignored. Groups without known values
+    report `count == 0` and NaN for the remaining metrics.
+    """
+
+    known = ~np.isnan(values)
+    group = codes[known]
+    known_values = values[known]
+
+    # Ordena por (grupo, valor): cada grupo vira um segmento contíguo e ordenado
+    order = np.lexsort((known_values, group))
+    sorted_values = known_values[order]
+    counts = np.bincount(group, minlength=group_count)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    has_values = counts > 0
+    last = np.where(has_values, starts + counts - 1, 0)
+    first = np.where(has_values, starts, 0)
+
+    def _masked(result: np.ndarray) -> np.ndarray:
+        return np.where(has_values, result, np.nan)
+
+    results: dict[str, np.ndarray] = {}
+    sums = np.bincount(group, weights=known_values, minlength=group_count)
+    if "count" in metrics:
+        results["count"] = counts
+    if "sum" in metrics:
+        results["sum"] = _masked(sums)
+    if "mean" in metrics:
+        results["mean"] = _masked(sums / np.maximum(counts, 1))
+    if sorted_values.size:
+        if "min" in metrics:
+            results["min"] = _masked(sorted_values[first])
+        if "max" in metrics:
+            results["max"] = _masked(sorted_values[last])
+        for percentile in percentiles:
+            # Interpolação linear, como np.percentile, calculada para todos os grupos de uma vez
+            position = starts + (percentile / 100.0) * np.maximum(counts - 1, 0)
+            low = np.floor(position).astype(np.int64).clip(0, sorted_values.size - 1)
+            high = np.ceil(position).astype(np.int64).clip(0, sorted_values.size - 1)
+            interpolated = sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+            results[f"p{percentile:g}"] = _masked(interpolated)
+    else:
+        empty = np.full(group_count, np.nan)
+        for name in ("min", "max"):
+            if name in metrics:
+                results[name] = empty
+        for percentile in percentiles:
+            results[f"p{percentile:g}"] = empty
+    return results
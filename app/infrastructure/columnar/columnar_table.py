@@ -0,0 +1,139 @@
+"""NumPy-backed columnar tables with vectorized filter, sort and top-k."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+class RangeFilter(NamedTuple):
+    column: str
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+
+class MatchFilter(NamedTuple):
+    """Matches a categorical value or one of its comma-separated tokens."""
+
+    column: str
+    value: str
+
+
+class SortKey(NamedTuple):
+    column: str
+    descending: bool = False
+
+
+def _normalize_category(value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return None
+    text = value.strip().lower()
+    return text or None
+
+
+class CategoricalColumn:
+    """Dictionary-encoded column: sorted categories plus one int32 code per row."""
+
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, values: Sequence[Any]) -> None:
+        normalized = [_normalize_category(value) for value in values]
+        self.categories = tuple(sorted({value for value in normalized if value is not None}))
+        index = {category: code for code, category in enumerate(self.categories)}
+        self.codes = np.fromiter(
+            (index[value] if value is not None else -1 for value in normalized),
+            dtype=np.int32,
+            count=len(normalized),
+        )
+
+    def matching_codes(self, value: str) -> np.ndarray:
+        wanted = _normalize_category(value)
+        return np.array(
+            [
+                code
+                for code, category in enumerate(self.categories)
+                if category == wanted or wanted in (token.strip() for token in category.split(","))
+            ],
+            dtype=np.int32,
+        )
+
+    def sort_values(self) -> np.ndarray:
+        # Categorias ordenadas => códigos preservam a ordem lexicográfica
+        values = self.codes.astype(np.float64)
+        values[self.codes < 0] = np.nan
+        return values
+
+
+class ColumnarTable:
+    """Immutable table of numeric (float64, NaN = unknown) and categorical columns."""
+
+    __slots__ = ("size", "numeric", "categorical")
+
+    def __init__(
+        self,
+        size: int,
+        numeric: Mapping[str, Sequence[Optional[float]]],
+        categorical: Mapping[str, Sequence[Any]],
+    ) -> None:
+        self.size = size
+        self.numeric = {name: np.array(values, dtype=np.float64) for name, values in numeric.items()}
+        self.categorical = {name: CategoricalColumn(values) for name, values in categorical.items()}
+
+    def has_column(self, column: str) -> bool:
+        return column in self.numeric or column in self.categorical
+
+    def _sort_values(self, key: SortKey) -> np.ndarray:
+        if key.column in self.numeric:
+            values = self.numeric[key.column]
+        else:
+            values = self.categorical[key.column].sort_values()
+        # NaN fica por último nos dois sentidos
+        return -values if key.descending else values
+
+    def mask(self, filters: Sequence[RangeFilter | MatchFilter]) -> np.ndarray:
+        selected = np.ones(self.size, dtype=bool)
+        for item in filters:
+            if isinstance(item, MatchFilter):
+                column = self.categorical[item.column]
+                selected &= np.isin(column.codes, column.matching_codes(item.value))
+                continue
+
+            values = self.numeric[item.column]
+            # Comparações com NaN são falsas: valores desconhecidos nunca passam
+            if item.low is not None:
+                selected &= values >= item.low
+            if item.high is not None:
+                selected &= values <= item.high
+            if item.low is None and item.high is None:
+                selected &= ~np.isnan(values)
+        return selected
+
+    def query(
+        self,
+        filters: Sequence[RangeFilter | MatchFilter] = (),
+        sort: Sequence[SortKey] = (),
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """Returns the row indices that pass `filters`, ordered by `sort`.
+
+        Sorting is stable, so ties keep the input order. With `limit`, only
+        the rows whose primary key is within the k-th smallest value are
+        fully sorted.
+        """
+
+        indices = np.flatnonzero(self.mask(filters)) if filters else np.arange(self.size)
+        if not sort:
+            return indices[:limit] if limit is not None else indices
+
+        keys = [self._sort_values(key)[indices] for key in sort]
+        if limit is not None and 0 < limit < indices.size:
+            kth = np.partition(keys[0], limit - 1)[limit - 1]
+            if not np.isnan(kth):
+                candidates = keys[0] <= kth
+                indices = indices[candidates]
+                keys = [values[candidates] for values in keys]
+
+        # np.lexsort usa a última chave como primária
+        ordered = indices[np.lexsort(keys[::-1])]
+        return ordered[:limit] if limit is not None else ordered
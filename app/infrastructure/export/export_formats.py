@@ -0,0 +1,69 @@
+"""Encoders for bulk exports: gzip-compressed NDJSON and compressed NumPy columnar archives."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+
+from app.infrastructure.columnar.columnar_table import ColumnarTable
+
+# Nível 6 fica próximo do nível máximo em tamanho, com uma fração do custo de CPU
+GZIP_LEVEL = 6
+
+
+def ndjson_gzip(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    """One JSON document per line, gzip-compressed with a fixed mtime so equal data yields equal bytes."""
+
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as stream:
+        for row in rows:
+            stream.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode())
+            stream.write(b"\n")
+    return buffer.getvalue()
+
+
+def _text(values: Iterable[Any]) -> np.ndarray:
+    return np.array(["" if value is None else str(value) for value in values], dtype=str)
+
+
+def columnar_npz(tables: Mapping[str, tuple[Sequence[Mapping[str, Any]], ColumnarTable]]) -> bytes:
+    """Packs each resource's rows and columnar table into one `.npz` archive.
+
+    Every field of the rows is kept, so the archive is a full dump like the
+    NDJSON export. Arrays are named:
+
+    - `<resource>.<field>`: text as a unicode array ("" for missing);
+    - `<resource>.<relation>.offsets` / `.values`: list fields, row `i` owns
+      `values[offsets[i]:offsets[i + 1]]`;
+    - `<resource>.<numeric field>`: float64 projection (NaN for unknown),
+      with the original text in `<resource>.<numeric field>.text`;
+    - `<resource>.<categorical field>.codes` / `.categories`: int32
+      dictionary codes (-1 for missing) over the normalized values, next to
+      the text column.
+    """
+
+    arrays: dict[str, np.ndarray] = {}
+    for resource, (rows, table) in tables.items():
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        for name in names:
+            values = [row.get(name) for row in rows]
+            if any(isinstance(value, list) for value in values):
+                items = [value if isinstance(value, list) else [] for value in values]
+                arrays[f"{resource}.{name}.offsets"] = np.cumsum([0, *map(len, items)], dtype=np.int64)
+                arrays[f"{resource}.{name}.values"] = _text(item for value in items for item in value)
+            elif name in table.numeric:
+                arrays[f"{resource}.{name}"] = table.numeric[name]
+                arrays[f"{resource}.{name}.text"] = _text(values)
+            else:
+                arrays[f"{resource}.{name}"] = _text(values)
+        for name, column in table.categorical.items():
+            arrays[f"{resource}.{name}.codes"] = column.codes
+            arrays[f"{resource}.{name}.categories"] = np.array(column.categories, dtype=str)
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
@@ -0,0 +1,111 @@
+"""In-memory SWAPI relationship graph with integer-id adjacency arrays."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from app.domain.keys.resource_key import as_key
+
+# recurso -> campo de relacionamento -> recurso alvo
+RELATIONS: dict[str, dict[str, str]] = {
+    "films": {"characters": "people", "planets": "planets", "starships": "starships", "vehicles": "vehicles", "species": "species"},
+    "people": {"homeworld": "planets", "films": "films", "species": "species", "starships": "starships", "vehicles": "vehicles"},
+    "planets": {"residents": "people", "films": "films", "native_species": "species"},
+    "species": {"homeworld": "planets", "people": "people", "films": "films"},
+    "starships": {"pilots": "people", "films": "films"},
+    "vehicles": {"pilots": "people", "films": "films"},
+}
+
+# Cada aresta é a inversa de outra; `planets.native_species` não existe na SWAPI
+# e é derivada apenas de `species.homeworld`
+INVERSES: dict[tuple[str, str], tuple[str, str]] = {}
+for _left, _right in (
+    (("films", "characters"), ("people", "films")),
+    (("films", "planets"), ("planets", "films")),
+    (("films", "starships"), ("starships", "films")),
+    (("films", "vehicles"), ("vehicles", "films")),
+    (("films", "species"), ("species", "films")),
+    (("people", "homeworld"), ("planets", "residents")),
+    (("people", "species"), ("species", "people")),
+    (("people", "starships"), ("starships", "pilots")),
+    (("people", "vehicles"), ("vehicles", "pilots")),
+    (("species", "homeworld"), ("planets", "native_species")),
+):
+    INVERSES[_left] = _right
+    INVERSES[_right] = _left
+
+_EMPTY = np.empty(0, dtype=np.int32)
+
+
+def _linked_urls(value: object) -> Iterable[object]:
+    if isinstance(value, list):
+        return value
+    return (value,) if value else ()
+
+
+class RelationshipGraph:
+    """Both directions of every SWAPI relation as sorted int32 id arrays.
+
+    SWAPI stores each link twice (`film.characters` and `person.films`) and
+    the two sides are not always consistent; the graph takes the union of
+    both, so every relation can be traversed from either end.
+    """
+
+    def __init__(self, adjacency: Mapping[tuple[str, str], Mapping[int, np.ndarray]]) -> None:
+        self._adjacency = adjacency
+
+    @classmethod
+    def build(cls, dataset: Mapping[str, Iterable[Mapping[str, object]]]) -> RelationshipGraph:
+        edges: dict[tuple[str, str], dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+        for resource, payloads in dataset.items():
+            relations = RELATIONS.get(resource, {})
+            for payload in payloads:
+                source = as_key(payload.get("url"))
+                if source is None:
+                    continue
+                for relation, target_resource in relations.items():
+                    inverse = INVERSES.get((resource, relation))
+                    for url in _linked_urls(payload.get(relation)):
+                        target = as_key(url)
+                        if target is None or target[0] != target_resource:
+                            continue
+                        edges[(resource, relation)][source[1]].add(target[1])
+                        if inverse is not None:
+                            edges[inverse][target[1]].add(source[1])
+
+        adjacency = {
+            edge: {node: np.array(sorted(targets), dtype=np.int32) for node, targets in nodes.items()}
+            for edge, nodes in edges.items()
+        }
+        return cls(adjacency)
+
+    def neighbors(self, resource: str, relation: str, node_id: int) -> np.ndarray:
+        return self._adjacency.get((resource, relation), {}).get(node_id, _EMPTY)
+
+    def linked_to(self, resource: str, relation: str, target_id: int) -> np.ndarray:
+        """Ids of `resource` whose `relation` points at `target_id` (via the inverse edge)."""
+
+        inverse = INVERSES.get((resource, relation))
+        if inverse is None:
+            return _EMPTY
+        return self.neighbors(inverse[0], inverse[1], target_id)
+
+    def join(self, resource: str, constraints: Iterable[tuple[str, int]]) -> np.ndarray:
+        """Intersects the id sets of every `(relation, target_id)` constraint."""
+
+        arrays = sorted(
+            (self.linked_to(resource, relation, target_id) for relation, target_id in constraints),
+            key=len,
+        )
+        if not arrays:
+            return _EMPTY
+
+        result = arrays[0]
+        for array in arrays[1:]:
+            if not result.size:
+                break
+            result = np.intersect1d(result, array, assume_unique=True)
+        return result
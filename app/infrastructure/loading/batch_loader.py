@@ -0,0 +1,79 @@
+"""Per-request loader that coalesces concurrent loads into one batch call."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Recebe as chaves do lote e devolve um valor (ou a exceção daquele item) por chave, na mesma ordem
+BatchFunction = Callable[[list[K]], Awaitable[Sequence[V | BaseException]]]
+
+
+class BatchLoader(Generic[K, V]):
+    """Collects the loads issued while the event loop is busy and resolves them together.
+
+    Each key is resolved at most once per loader: later loads of the same key
+    share the first future, so a loader created per request fetches every
+    unique node a single time no matter how often it is referenced.
+    """
+
+    def __init__(self, batch_function: BatchFunction) -> None:
+        self._batch_function = batch_function
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._batches: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> asyncio.Future:
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            loop.call_soon(self._dispatch, 1)
+        return future
+
+    async def load_many(self, keys: Sequence[K]) -> list[V]:
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seeds the loader with an already materialized value."""
+
+        if key in self._futures:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def _dispatch(self, queued: int) -> None:
+        if len(self._queue) != queued:
+            # Ainda chegam chaves de tarefas agendadas no mesmo ciclo: espera um tick sem novidades
+            asyncio.get_running_loop().call_soon(self._dispatch, len(self._queue))
+            return
+
+        keys, self._queue = self._queue, []
+        # O loop só guarda referência fraca às tasks; mantê-las aqui evita coleta no meio do lote
+        batch = asyncio.ensure_future(self._resolve(keys))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _resolve(self, keys: list[K]) -> None:
+        try:
+            values = await self._batch_function(keys)
+        except Exception as exc:
+            values = [exc] * len(keys)
+
+        for key, value in zip(keys, values):
+            future = self._futures[key]
+            if future.done():
+                continue
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
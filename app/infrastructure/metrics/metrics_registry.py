@@ -0,0 +1,171 @@
+"""Minimal in-process metrics registry rendered in the Prometheus text format (0.0.4)."""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional, Sequence
+
+# Valores por combinação de labels, na ordem declarada na métrica
+LabelValues = tuple[str, ...]
+Collect = Callable[[], dict[LabelValues, float]]
+
+# Latências de 1ms a 10s: cobre cache (sub-milissegundo) e a SWAPI lenta
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (), collect: Optional[Collect] = None) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._collect = collect
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def samples(self) -> dict[LabelValues, float]:
+        if self._collect is not None:
+            return self._collect()
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, value in sorted(self.samples().items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, values)} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (contagem por bucket, não cumulativa; soma; total)
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def snapshot(self, *labels: str) -> tuple[list[int], float, int]:
+        """Cumulative bucket counts, sum and count for one label combination."""
+
+        with self._lock:
+            counts, total = self._series.get(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+            cumulative, running = [], 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            return cumulative, total[0], running
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            label_sets = sorted(self._series)
+        for values in label_sets:
+            cumulative, total, count = self.snapshot(*values)
+            for bound, running in zip((*self.buckets, math.inf), cumulative):
+                labels = _format_labels((*self.labels, "le"), (*values, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {running}")
+            base_labels = _format_labels(self.labels, values)
+            lines.append(f"{self.name}_sum{base_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base_labels} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Holds the process metrics and renders them for `/metrics`."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = (), collect: Optional[Collect] = None) -> Counter:
+        return self._register(Counter(name, documentation, labels, collect))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = (), collect: Optional[Collect] = None) -> Gauge:
+        return self._register(Gauge(name, documentation, labels, collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica já registrada: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,162 @@
+"""Gateway metrics: route latency and fan-out, upstream calls, caches and the thread pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Iterator, Mapping, Optional
+
+from app.domain.fields.field_selection import FieldSelection
+from app.infrastructure.cache.memory_cache import MemoryCache
+from app.infrastructure.metrics.metrics_registry import registry
+from app.infrastructure.profiling.request_profile import RequestProfile, activate_profile, current_profile, record_upstream_time
+from app.infrastructure.profiling.slow_request_log import slow_log
+
+FANOUT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+# Conjuntos de `expand=` distintos com série própria; os demais viram "other"
+MAX_EXPANSION_LABELS = 64
+
+# Caches e mapas observados no momento da coleta (nada é contado no caminho quente)
+_caches: dict[str, MemoryCache] = {}
+_inflight: dict[str, Mapping[Any, Any]] = {}
+_expansion_labels: set[str] = set()
+_expansion_lock = threading.Lock()
+
+
+def watch_cache(name: str, cache: MemoryCache) -> None:
+    _caches[name] = cache
+
+
+def watched_caches() -> dict[str, MemoryCache]:
+    return dict(_caches)
+
+
+def watch_inflight(name: str, inflight: Mapping[Any, Any]) -> None:
+    _inflight[name] = inflight
+
+
+def _default_executor() -> Any:
+    try:
+        return getattr(asyncio.get_running_loop(), "_default_executor", None)
+    except RuntimeError:
+        return None
+
+
+def _executor_threads() -> dict[tuple[str, ...], float]:
+    executor = _default_executor()
+    return {(): float(len(getattr(executor, "_threads", ())))}
+
+
+def _executor_queue_depth() -> dict[tuple[str, ...], float]:
+    queue = getattr(_default_executor(), "_work_queue", None)
+    return {(): float(queue.qsize() if queue is not None else 0)}
+
+
+REQUEST_LATENCY = registry.histogram(
+    "swapi_request_duration_seconds", "Request latency per route and expansion set", ("route", "expand"),
+)
+REQUEST_FANOUT = registry.histogram(
+    "swapi_request_fanout", "Payload lookups and upstream calls made by one request", ("route", "kind"),
+    buckets=FANOUT_BUCKETS,
+)
+UPSTREAM_REQUESTS = registry.counter(
+    "swapi_upstream_requests_total", "SWAPI calls by resource and HTTP status", ("resource", "status"),
+)
+UPSTREAM_LATENCY = registry.histogram(
+    "swapi_upstream_request_duration_seconds", "SWAPI call latency by resource", ("resource",),
+)
+UPSTREAM_INFLIGHT = registry.gauge(
+    "swapi_upstream_inflight", "SWAPI calls currently in flight (deduplicated)", ("pool",),
+    collect=lambda: {(name,): float(len(inflight)) for name, inflight in _inflight.items()},
+)
+CACHE_HITS = registry.counter(
+    "swapi_cache_hits_total", "MemoryCache lookups that found a live entry", ("cache",),
+    collect=lambda: {(name,): float(cache.hits) for name, cache in _caches.items()},
+)
+CACHE_MISSES = registry.counter(
+    "swapi_cache_misses_total", "MemoryCache lookups that found nothing (or an expired entry)", ("cache",),
+    collect=lambda: {(name,): float(cache.misses) for name, cache in _caches.items()},
+)
+CACHE_EVICTIONS = registry.counter(
+    "swapi_cache_evictions_total", "MemoryCache entries dropped before being read again", ("cache",),
+    collect=lambda: {(name,): float(cache.evictions) for name, cache in _caches.items()},
+)
+CACHE_ENTRIES = registry.gauge(
+    "swapi_cache_entries", "MemoryCache entries currently stored", ("cache",),
+    collect=lambda: {(name,): float(len(cache)) for name, cache in _caches.items()},
+)
+EXECUTOR_THREADS = registry.gauge(
+    "swapi_executor_threads", "Worker threads started by the default executor", collect=_executor_threads,
+)
+EXECUTOR_QUEUE_DEPTH = registry.gauge(
+    "swapi_executor_queue_depth", "Calls waiting for a default executor thread", collect=_executor_queue_depth,
+)
+
+
+def expansion_label(plan: Optional[FieldSelection]) -> str:
+    """Canonical label of a validated `expand=` plan, so `b,a` and `a,b` share a series.
+
+    Only the first `MAX_EXPANSION_LABELS` distinct plans get their own
+    series; later ones are recorded as `other`.
+    """
+
+    if plan is None:
+        return ""
+    label = ",".join(plan.paths())
+    if label not in _expansion_labels:
+        with _expansion_lock:
+            if label not in _expansion_labels:
+                if len(_expansion_labels) >= MAX_EXPANSION_LABELS:
+                    return "other"
+                _expansion_labels.add(label)
+    return label
+
+
+def record_expansion(plan: Optional[FieldSelection]) -> None:
+    """Labels the current request with the plan accepted by `ExpansionService.plan`."""
+
+    profile = current_profile()
+    if profile is not None:
+        profile.expansion = expansion_label(plan)
+
+
+@contextmanager
+def track_request(route: str, expand: Optional[str] = None, query_params: object = None) -> Iterator[RequestProfile]:
+    """Records latency and fan-out for `route`; slow requests also go to the slow-request log.
+
+    The `expand` label comes from `record_expansion`; a value that was never
+    validated (rejected with 400) is recorded as `invalid`.
+    """
+
+    with activate_profile() as profile:
+        lookups, upstream, hits = profile.lookups, profile.upstream_calls, profile.cache_hits
+        profile.expansion = None
+        started = perf_counter()
+        try:
+            yield profile
+        finally:
+            elapsed = perf_counter() - started
+            if not expand:
+                label = ""
+            else:
+                label = profile.expansion if profile.expansion is not None else "invalid"
+            REQUEST_LATENCY.observe(elapsed, route, label)
+            REQUEST_FANOUT.observe(profile.lookups - lookups, route, "lookups")
+            REQUEST_FANOUT.observe(profile.upstream_calls - upstream, route, "upstream")
+            slow_log.observe(
+                route,
+                elapsed,
+                query_params,
+                upstream_calls=profile.upstream_calls - upstream,
+                lookups=profile.lookups - lookups,
+                cache_hits=profile.cache_hits - hits,
+                stages=profile.stages,
+            )
+
+
+def record_upstream(resource: str, status: str, seconds: float) -> None:
+    UPSTREAM_REQUESTS.inc(resource, status)
+    UPSTREAM_LATENCY.observe(seconds, resource)
+    record_upstream_time(seconds)
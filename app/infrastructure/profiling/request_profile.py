@@ -0,0 +1,108 @@
+"""Per-request cost breakdown (upstream, cache, build/hydrate/serialize stages) kept in a contextvar."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Iterator, Optional
+
+
+class RequestProfile:
+    """Mutable counters for one request; executor threads see it through a copied context.
+
+    Stage durations are cumulative: concurrent work (e.g. `/batch`
+    sub-requests or parallel upstream calls) may add up to more than the
+    wall-clock total.
+    """
+
+    __slots__ = ("started", "lookups", "cache_hits", "cache_misses", "upstream_calls", "upstream_seconds", "stages", "expansion")
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        self.lookups = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.upstream_calls = 0
+        self.upstream_seconds = 0.0
+        self.stages: dict[str, float] = {}
+        # Rótulo do `expand=` validado; None enquanto nenhum plano foi aceito
+        self.expansion: Optional[str] = None
+
+    def elapsed(self) -> float:
+        return perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value (durations in milliseconds)."""
+
+        entries = [
+            f'upstream;dur={self.upstream_seconds * 1e3:.1f};desc="{self.upstream_calls} calls"',
+            f'cache;desc="hits={self.cache_hits} misses={self.cache_misses}"',
+        ]
+        entries.extend(f"{name};dur={seconds * 1e3:.1f}" for name, seconds in self.stages.items())
+        entries.append(f"total;dur={self.elapsed() * 1e3:.1f}")
+        return ", ".join(entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_ms": round(self.elapsed() * 1e3, 3),
+            "upstream": {"calls": self.upstream_calls, "ms": round(self.upstream_seconds * 1e3, 3)},
+            "cache": {"lookups": self.lookups, "hits": self.cache_hits, "misses": self.cache_misses},
+            "stages_ms": {name: round(seconds * 1e3, 3) for name, seconds in self.stages.items()},
+        }
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar("swapi_request_profile", default=None)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+@contextmanager
+def activate_profile() -> Iterator[RequestProfile]:
+    """Profiles the enclosed work, reusing the profile already active for this request."""
+
+    profile = _current.get()
+    if profile is not None:
+        yield profile
+        return
+
+    profile = RequestProfile()
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        profile.stages[name] = profile.stages.get(name, 0.0) + perf_counter() - started
+
+
+def record_lookup(hit: bool) -> None:
+    profile = _current.get()
+    if profile is None:
+        return
+    profile.lookups += 1
+    if hit:
+        profile.cache_hits += 1
+    else:
+        profile.cache_misses += 1
+
+
+def record_upstream_time(seconds: float) -> None:
+    profile = _current.get()
+    if profile is not None:
+        profile.upstream_calls += 1
+        profile.upstream_seconds += seconds
@@ -0,0 +1,137 @@
+"""Wall-clock sampling profiler over every thread of the process (event loop and executor workers)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Any, Optional
+
+# Folhas de pilha que significam "thread parada esperando trabalho" (select do loop, fila do executor)
+_IDLE_LEAVES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+Stack = tuple[str, ...]
+
+
+class StackSamples:
+    """Sample counts per collapsed stack; the first frame of each stack is the thread name."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.duration = 0.0
+        self.ticks = 0
+        self.stacks: Counter[Stack] = Counter()
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed format (`thread;outer;...;leaf count`), ready for flamegraph tools."""
+
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def speedscope(self, name: str = "swapi-gateway") -> dict[str, Any]:
+        """One sampled profile per thread in the speedscope file format."""
+
+        frames: list[dict[str, str]] = []
+        index: dict[str, int] = {}
+        per_thread: dict[str, tuple[list[list[int]], list[float]]] = {}
+        for stack, count in sorted(self.stacks.items()):
+            thread, *calls = stack
+            indices = []
+            for label in calls:
+                if label not in index:
+                    index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(index[label])
+            samples, weights = per_thread.setdefault(thread, ([], []))
+            samples.append(indices)
+            weights.append(round(count * self.interval, 6))
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "swapi-gateway",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(self.duration, 6),
+                    "samples": samples,
+                    "weights": weights,
+                }
+                for thread, (samples, weights) in sorted(per_thread.items())
+            ],
+        }
+
+
+class SamplingProfiler:
+    """Polls `sys._current_frames()` at a fixed interval from the calling thread.
+
+    The calling thread is excluded from the samples; run it in a worker
+    thread so the event loop keeps serving the traffic being profiled.
+    """
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False, max_depth: int = 128) -> None:
+        self.interval = interval
+        self.include_idle = include_idle
+        self.max_depth = max_depth
+        self._labels: dict[CodeType, str] = {}
+        self._root = os.getcwd() + os.sep
+
+    def run(self, seconds: float) -> StackSamples:
+        samples = StackSamples(self.interval)
+        own = threading.get_ident()
+        started = time.perf_counter()
+        deadline = started + seconds
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._stack(frame)
+                if stack is not None:
+                    samples.stacks[(names.get(ident, f"thread-{ident}"), *stack)] += 1
+            samples.ticks += 1
+
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            time.sleep(min(self.interval, deadline - now))
+
+        samples.duration = time.perf_counter() - started
+        return samples
+
+    def _stack(self, frame: Any) -> Optional[Stack]:
+        code = frame.f_code
+        if not self.include_idle and (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+            return None
+
+        labels: list[str] = []
+        while frame is not None and len(labels) < self.max_depth:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(self._root):
+                filename = filename[len(self._root):]
+            elif "site-packages" + os.sep in filename:
+                filename = filename.split("site-packages" + os.sep, 1)[1]
+            else:
+                filename = os.path.basename(filename)
+            # `;` separa quadros no formato colapsado
+            label = self._labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        return label
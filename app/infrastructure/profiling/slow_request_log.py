@@ -0,0 +1,119 @@
+"""Bounded log of the requests that exceeded a latency threshold, with their query shape and cost."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from app.infrastructure.tracing.tracer import current_span
+
+logger = logging.getLogger("app.slow_requests")
+
+# Parâmetros cujo valor define a forma da consulta; nos demais só a presença importa (ex.: id=?)
+SHAPE_VALUE_PARAMS = frozenset({"expand", "fields", "order", "order_by", "format", "metrics", "group_by"})
+
+
+def normalize_params(query_params: object) -> dict[str, Any]:
+    """Explicitly set query params of a dataclass (`FilmsQueryParams` etc.), in declaration order."""
+
+    if query_params is None or not dataclasses.is_dataclass(query_params):
+        return {}
+    params = {}
+    for field in dataclasses.fields(query_params):
+        value = getattr(query_params, field.name)
+        if value is not None and value is not False:
+            params[field.name] = value
+    return params
+
+
+def query_shape(params: dict[str, Any]) -> str:
+    """Canonical shape, so `?id=1&films=true` and `?id=4&films=true` group together."""
+
+    parts = []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, bool):
+            parts.append(f"{name}={str(value).lower()}")
+        elif name in SHAPE_VALUE_PARAMS:
+            parts.append(f"{name}={value}")
+        else:
+            parts.append(f"{name}=?")
+    return "&".join(parts)
+
+
+class SlowRequestLog:
+    """Ring buffer of slow requests; optionally mirrors each entry to a JSON log line."""
+
+    def __init__(self, threshold_seconds: float = 0.5, capacity: int = 100, log: bool = False) -> None:
+        self.threshold_seconds = threshold_seconds
+        self.log = log
+        self._entries: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._entries.maxlen or 0
+
+    def configure(self, threshold_seconds: float, capacity: int, log: bool) -> None:
+        with self._lock:
+            self.threshold_seconds = threshold_seconds
+            self.log = log
+            self._entries = deque(self._entries, maxlen=max(capacity, 1))
+
+    def observe(
+        self,
+        route: str,
+        seconds: float,
+        query_params: object = None,
+        upstream_calls: int = 0,
+        lookups: int = 0,
+        cache_hits: int = 0,
+        stages: Optional[dict[str, float]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Keeps the request when it took at least the threshold; returns the stored entry."""
+
+        if seconds < self.threshold_seconds:
+            return None
+
+        params = normalize_params(query_params)
+        span = current_span()
+        entry = {
+            "timestamp": time.time(),
+            "route": route,
+            "duration_ms": round(seconds * 1e3, 3),
+            "shape": query_shape(params),
+            "params": params,
+            "relations": [name for name, value in params.items() if value is True],
+            "upstream_calls": upstream_calls,
+            "lookups": lookups,
+            "cache_hit_ratio": round(cache_hits / lookups, 4) if lookups else None,
+            "stages_ms": {name: round(value * 1e3, 3) for name, value in (stages or {}).items()},
+            "trace_id": span.trace_id if span is not None and span.recording else None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+        if self.log:
+            logger.warning(json.dumps(entry, separators=(",", ":"), default=str))
+        return entry
+
+    def entries(self, route: Optional[str] = None, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Newest first, optionally restricted to one route."""
+
+        with self._lock:
+            entries = [entry for entry in reversed(self._entries) if route is None or entry["route"] == route]
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+slow_log = SlowRequestLog()
@@ -0,0 +1,413 @@
+"""Lightweight OpenTelemetry-compatible tracer: W3C trace context, OTLP span model, pluggable exporters."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar, Token
+from enum import IntEnum
+from typing import Any, Callable, Optional, Protocol, Sequence
+
+logger = logging.getLogger(__name__)
+
+AttributeValue = str | bool | int | float
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class SpanKind(IntEnum):
+    # Mesmos valores do enum SpanKind do OTLP
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class StatusCode(IntEnum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+class Span:
+    """One timed operation; mirrors the OTLP span fields."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message",
+    )
+
+    recording = True
+
+    def __init__(self, name: str, trace_id: str, span_id: str, parent_id: Optional[str], kind: SpanKind) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: dict[str, AttributeValue] = {}
+        self.status = StatusCode.UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: StatusCode, message: str = "") -> None:
+        self.status = status
+        self.status_message = message
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+    def to_otlp(self) -> dict[str, Any]:
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": int(self.status), "message": self.status_message},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NonRecordingSpan:
+    """Placeholder for spans that are not sampled; every call is a no-op."""
+
+    __slots__ = ("trace_id", "span_id")
+
+    recording = False
+
+    def __init__(self, trace_id: str = "0" * 32, span_id: str = "0" * 16) -> None:
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_status(self, status: StatusCode, message: str = "") -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[tuple[str, str, bool]]:
+    """`(trace_id, parent span_id, sampled)` from a W3C `traceparent` header."""
+
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: Sequence[Span]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in memory; meant for tests and local debugging."""
+
+    def __init__(self) -> None:
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        self.clear()
+
+
+class LoggingSpanExporter:
+    """Writes each finished span as one OTLP-JSON log line."""
+
+    def __init__(self, target: Optional[logging.Logger] = None) -> None:
+        self._logger = target or logging.getLogger("app.tracing.spans")
+
+    def export(self, spans: Sequence[Span]) -> None:
+        import json
+
+        for span in spans:
+            self._logger.info(json.dumps(span.to_otlp(), separators=(",", ":")))
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OtlpHttpSpanExporter:
+    """Sends spans to an OTLP/HTTP collector (`/v1/traces`, JSON encoding) in batches.
+
+    A batch goes out when `batch_size` spans are buffered or, like the
+    `schedule_delay` of the OTel BatchSpanProcessor, at most
+    `schedule_delay` seconds after the previous flush.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "swapi-gateway",
+        batch_size: int = 256,
+        timeout: float = 5.0,
+        schedule_delay: float = 5.0,
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._batch_size = batch_size
+        self._timeout = timeout
+        self._schedule_delay = schedule_delay
+        self._buffer: list[Span] = []
+        self._lock = threading.Lock()
+        # Uma única thread de envio: a requisição nunca espera o coletor
+        self._sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otlp-export")
+        # Envio periódico, iniciado no primeiro export: com pouco tráfego os spans não ficam parados no buffer
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._buffer.extend(spans)
+            if self._flusher is None and not self._stopped.is_set():
+                self._flusher = threading.Thread(target=self._flush_periodically, name="otlp-flush", daemon=True)
+                self._flusher.start()
+            if len(self._buffer) < self._batch_size:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Hands every buffered span to the sender thread."""
+
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._sender.submit(self._send, batch)
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        self._sender.shutdown(wait=True)
+
+    def payload(self, spans: Sequence[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self._service_name}}]},
+                "scopeSpans": [{"scope": {"name": "app"}, "spans": [span.to_otlp() for span in spans]}],
+            }]
+        }
+
+    def _send(self, spans: Sequence[Span]) -> None:
+        import requests
+
+        try:
+            requests.post(self._endpoint, json=self.payload(spans), timeout=self._timeout).raise_for_status()
+        except Exception:
+            logger.warning("Falha ao exportar %d spans para %s", len(spans), self._endpoint, exc_info=True)
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self._schedule_delay):
+            self.flush()
+
+
+_current: ContextVar[Optional[Span | _NonRecordingSpan]] = ContextVar("swapi_current_span", default=None)
+
+
+class _SpanScope:
+    """Context manager that activates a span and exports it when the block ends."""
+
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: Tracer, span: Span | _NonRecordingSpan) -> None:
+        self._tracer = tracer
+        self._span = span
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Span | _NonRecordingSpan:
+        self._token = _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        _current.reset(self._token)
+        span = self._span
+        if not span.recording:
+            return
+        if exc is not None:
+            span.set_attribute("exception.type", exc_type.__name__)
+            span.set_attribute("exception.message", str(exc))
+            span.set_status(StatusCode.ERROR, str(exc))
+        span.end_ns = time.time_ns()
+        self._tracer._finish(span)
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> _NonRecordingSpan:
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NonRecordingSpan()
+_NOOP_SCOPE = _NoopScope()
+
+
+class Tracer:
+    """Creates spans when an exporter is configured; otherwise every call is a cheap no-op."""
+
+    def __init__(self) -> None:
+        self._exporter: Optional[SpanExporter] = None
+        self._sample_ratio = 1.0
+        self.enabled = False
+
+    def configure(self, exporter: Optional[SpanExporter], sample_ratio: float = 1.0) -> None:
+        previous = self._exporter
+        self._exporter = exporter
+        self._sample_ratio = min(max(sample_ratio, 0.0), 1.0)
+        self.enabled = exporter is not None
+        if previous is not None and previous is not exporter:
+            previous.shutdown()
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        traceparent: Optional[str] = None,
+    ) -> _SpanScope | _NoopScope:
+        """Starts a child of the current span, or a root (continuing `traceparent` when given)."""
+
+        if not self.enabled:
+            return _NOOP_SCOPE
+
+        parent = _current.get()
+        if parent is not None:
+            if not parent.recording:
+                return _SpanScope(self, parent)
+            return _SpanScope(self, Span(name, parent.trace_id, _new_id(64), parent.span_id, kind))
+
+        remote = parse_traceparent(traceparent)
+        if remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id = _new_id(128), None
+            sampled = random.random() < self._sample_ratio
+        if not sampled:
+            return _SpanScope(self, _NonRecordingSpan(trace_id))
+        return _SpanScope(self, Span(name, trace_id, _new_id(64), parent_id, kind))
+
+    def _finish(self, span: Span) -> None:
+        exporter = self._exporter
+        if exporter is None:
+            return
+        try:
+            exporter.export((span,))
+        except Exception:
+            logger.warning("Falha ao exportar o span %s", span.name, exc_info=True)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def current_span() -> Optional[Span | _NonRecordingSpan]:
+    return _current.get()
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Wraps a service method in a span named `<Class>.<method>`, tagged with its SWAPI resource."""
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        def _span_name(args: tuple[Any, ...]) -> str:
+            if name:
+                return name
+            owner = type(args[0]).__name__ if args else ""
+            return f"{owner}.{function.__name__}" if owner else function.__name__
+
+        def _tag(span: Span | _NonRecordingSpan, args: tuple[Any, ...]) -> None:
+            resource = getattr(args[0], "resource_name", None) if args else None
+            if span.recording and resource:
+                span.set_attribute("swapi.resource", resource)
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not tracer.enabled:
+                    return await function(*args, **kwargs)
+                with tracer.start_span(_span_name(args)) as span:
+                    _tag(span, args)
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return function(*args, **kwargs)
+            with tracer.start_span(_span_name(args)) as span:
+                _tag(span, args)
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def exporter_for(name: str, endpoint: Optional[str] = None) -> Optional[SpanExporter]:
+    """Builds the exporter selected in the configuration (`none`, `memory`, `logging` or `otlp`)."""
+
+    name = (name or "none").strip().lower()
+    if name == "none":
+        return None
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "logging":
+        return LoggingSpanExporter()
+    if name == "otlp":
+        return OtlpHttpSpanExporter(endpoint or "http://localhost:4318/v1/traces")
+    raise ValueError(f"Exportador de spans desconhecido: {name}")
+
+
+tracer = Tracer()
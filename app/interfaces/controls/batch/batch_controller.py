@@ -0,0 +1,114 @@
+"""Controller for the batch endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import fields
+from functools import cache
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError, create_model
+from typing import Any
+
+from app.interfaces.controls.films.films_controller import controller as films_controller
+from app.interfaces.controls.people.people_controller import controller as people_controller
+from app.interfaces.controls.planets.planets_controller import controller as planets_controller
+from app.interfaces.controls.species.species_controller import controller as species_controller
+from app.interfaces.controls.starships.starships_controller import controller as starships_controller
+from app.interfaces.controls.vehicles.vehicles_controller import controller as vehicles_controller
+from app.infrastructure.metrics.swapi_metrics import track_request
+from app.interfaces.dtos.batch.batch_request_dto import BatchItemDTO, BatchRequestDTO
+from app.interfaces.query_params.films.films_query_params import FilmsQueryParams
+from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
+from app.interfaces.query_params.planets.planets_query_params import PlanetsQueryParams
+from app.interfaces.query_params.species.species_query_params import SpeciesQueryParams
+from app.interfaces.query_params.starships.starships_query_params import StarshipsQueryParams
+from app.interfaces.query_params.vehicles.vehicles_query_params import VehiclesQueryParams
+
+MAX_BATCH_REQUESTS = 50
+
+
+@cache
+def _params_model(params_type: type) -> type[BaseModel]:
+    """Pydantic model with the types and `Query` constraints (ge=1, ...) of a query params dataclass."""
+
+    return create_model(
+        f"Batch{params_type.__name__}",
+        **{item.name: (item.type, item.default) for item in fields(params_type)},
+    )
+
+
+class BatchController:
+    """Runs several resource lookups concurrently inside a single HTTP request.
+
+    Sub-requests go through the same controllers as the GET routes, so they
+    share the payload cache and the in-flight deduplication of
+    `BaseSwapiService`: a URL needed by several sub-requests is fetched once.
+    """
+
+    def __init__(self) -> None:
+        self._resources = {
+            "films": (films_controller, FilmsQueryParams),
+            "people": (people_controller, PeopleQueryParams),
+            "planets": (planets_controller, PlanetsQueryParams),
+            "species": (species_controller, SpeciesQueryParams),
+            "starships": (starships_controller, StarshipsQueryParams),
+            "vehicles": (vehicles_controller, VehiclesQueryParams),
+        }
+
+    def _query_params(self, params_type: type, params: dict[str, Any]) -> Any:
+        known = {item.name for item in fields(params_type)}
+        unknown = sorted(set(params) - known)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Parâmetros inválidos: {', '.join(unknown)}")
+
+        # Listas em JSON (ex.: "ids": [1, 2]) equivalem ao formato separado por vírgula da query string
+        normalized = {
+            name: ",".join(str(item) for item in value) if isinstance(value, list) else value
+            for name, value in params.items()
+        }
+        # Mesma validação e conversão de tipos da query string ("3" -> 3, "false" -> False, limit >= 1)
+        try:
+            validated = _params_model(params_type).model_validate(normalized)
+        except ValidationError as exc:
+            errors = exc.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("params", *error["loc"])
+            raise HTTPException(status_code=422, detail=jsonable_encoder(errors)) from exc
+        return params_type(**validated.model_dump())
+
+    async def _run(self, item: BatchItemDTO, background_tasks: BackgroundTasks) -> dict[str, Any]:
+        response: dict[str, Any] = {"id": item.id, "resource": item.resource}
+        entry = self._resources.get(item.resource)
+        if entry is None:
+            return {**response, "status": 404, "body": {"detail": f"Recurso desconhecido: {item.resource}"}}
+
+        controller, params_type = entry
+        try:
+            body = await controller.fetch(self._query_params(params_type, item.params or {}), background_tasks)
+        except HTTPException as exc:
+            return {**response, "status": exc.status_code, "body": {"detail": exc.detail}}
+        return {**response, "status": 200, "body": body}
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/batch", tags=["batch"])
+
+        @router.post("")
+        async def post_batch(request: BatchRequestDTO, background_tasks: BackgroundTasks) -> dict:
+            if not request.requests:
+                raise HTTPException(status_code=400, detail="Informe ao menos uma requisição")
+            if len(request.requests) > MAX_BATCH_REQUESTS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"O lote aceita no máximo {MAX_BATCH_REQUESTS} requisições",
+                )
+
+            with track_request("/batch"):
+                responses = await asyncio.gather(*[self._run(item, background_tasks) for item in request.requests])
+            return {"responses": responses}
+
+        return router
+
+
+controller = BatchController()
+router = controller.register_routes()
@@ -0,0 +1,86 @@
+"""Controller for the debug endpoints: on-demand profiling and the slow-request log."""
+
+from __future__ import annotations
+
+import hmac
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from typing import Annotated
+
+from app.application.services.profiling.profiler_service import ProfilerBusyError, ProfilerService
+from app.config.configuration import load_configuration
+from app.infrastructure.profiling.slow_request_log import slow_log
+from app.interfaces.query_params.debug.debug_profile_query_params import DebugProfileQueryParams
+from app.interfaces.query_params.debug.debug_slow_query_params import DebugSlowQueryParams
+
+
+class DebugController:
+    """Profiles the live process and lists slow requests; disabled unless a debug token is configured."""
+
+    def __init__(self, token: str = "") -> None:
+        self._token = token
+        self._service = ProfilerService()
+
+    def _authorize(self, request: Request) -> None:
+        if not self._token:
+            # Sem token configurado o endpoint nem existe para quem está de fora
+            raise HTTPException(status_code=404, detail="Not Found")
+
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(credentials.strip().encode(), self._token.encode()):
+            raise HTTPException(status_code=401, detail="Token de depuração inválido", headers={"WWW-Authenticate": "Bearer"})
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/debug", tags=["debug"])
+
+        @router.get("/profile")
+        async def get_profile(
+            request: Request,
+            query_params: Annotated[DebugProfileQueryParams, Depends()],
+        ) -> Response:
+            self._authorize(request)
+
+            mode = (query_params.mode or "cpu").lower()
+            output = (query_params.format or "collapsed").lower()
+            if mode not in {"cpu", "alloc"}:
+                raise HTTPException(status_code=400, detail=f"Modo de perfil desconhecido: {query_params.mode}")
+            if mode == "cpu" and output not in {"collapsed", "speedscope"}:
+                raise HTTPException(status_code=400, detail=f"Formato de perfil desconhecido: {query_params.format}")
+
+            try:
+                if mode == "alloc":
+                    return JSONResponse(await self._service.allocation_profile(query_params.seconds, query_params.limit))
+                samples = await self._service.cpu_profile(
+                    query_params.seconds,
+                    interval=query_params.interval_ms / 1000,
+                    include_idle=bool(query_params.idle),
+                )
+            except ProfilerBusyError as exc:
+                raise HTTPException(status_code=409, detail=str(exc)) from exc
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+            if output == "speedscope":
+                return JSONResponse(
+                    samples.speedscope(),
+                    headers={"Content-Disposition": 'attachment; filename="profile.speedscope.json"'},
+                )
+            return PlainTextResponse(samples.collapsed())
+
+        @router.get("/slow")
+        async def get_slow_requests(
+            request: Request,
+            query_params: Annotated[DebugSlowQueryParams, Depends()],
+        ) -> dict:
+            self._authorize(request)
+            return {
+                "threshold_ms": round(slow_log.threshold_seconds * 1e3, 3),
+                "capacity": slow_log.capacity,
+                "requests": slow_log.entries(query_params.route, query_params.limit),
+            }
+
+        return router
+
+
+controller = DebugController(load_configuration()["debug_token"])
+router = controller.register_routes()
@@ -0,0 +1,117 @@
+"""Controller for bulk export endpoints."""
+
+from __future__ import annotations
+
+import re
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import Response, StreamingResponse
+from typing import Annotated, Iterator, Optional
+
+from app.application.services.export.export_service import ExportArtifact, ExportService
+from app.infrastructure.metrics.swapi_metrics import track_request
+from app.interfaces.query_params.export.export_query_params import ExportQueryParams
+
+CHUNK_SIZE = 64 * 1024
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class ExportController:
+    """Streams full-dataset dumps with ETag revalidation and byte-range resume."""
+
+    def __init__(self) -> None:
+        self._service = ExportService()
+
+    def _byte_range(self, header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+        """Parses a single `bytes=` range; returns None to serve the whole file."""
+
+        if not header:
+            return None
+        match = _RANGE_RE.match(header.strip())
+        if not match or not any(match.groups()):
+            # Múltiplos intervalos ou unidades desconhecidas: responde o arquivo completo
+            return None
+
+        start, end = match.groups()
+        if not start:
+            length = int(end)
+            if length == 0:
+                raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+            return max(size - length, 0), size - 1
+
+        first = int(start)
+        last = min(int(end), size - 1) if end else size - 1
+        if first >= size or first > last:
+            raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+        return first, last
+
+    def _weak_tags(self, header: str) -> list[str]:
+        """Entity tags of `If-None-Match` without `W/`: RFC 9110 uses weak comparison there."""
+
+        tags = [tag.strip() for tag in header.split(",")]
+        return [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+    def _chunks(self, content: bytes, first: int, last: int) -> Iterator[bytes]:
+        view = memoryview(content)
+        for offset in range(first, last + 1, CHUNK_SIZE):
+            yield bytes(view[offset:min(offset + CHUNK_SIZE, last + 1)])
+
+    def _respond(self, request: Request, artifact: ExportArtifact) -> Response:
+        headers = {
+            "ETag": artifact.etag,
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "public, no-cache",
+            "Content-Disposition": f'attachment; filename="{artifact.filename}"',
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or artifact.etag in self._weak_tags(if_none_match)):
+            return Response(status_code=304, headers=headers)
+
+        size = len(artifact.content)
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if if_range and if_range.strip() != artifact.etag:
+            # O arquivo mudou desde o download parcial: reinicia do começo
+            range_header = None
+
+        byte_range = self._byte_range(range_header, size)
+        if byte_range is None:
+            headers["Content-Length"] = str(size)
+            return StreamingResponse(self._chunks(artifact.content, 0, size - 1), media_type=artifact.media_type, headers=headers)
+
+        first, last = byte_range
+        headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+        headers["Content-Length"] = str(last - first + 1)
+        return StreamingResponse(
+            self._chunks(artifact.content, first, last),
+            status_code=206,
+            media_type=artifact.media_type,
+            headers=headers,
+        )
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/export", tags=["export"])
+
+        @router.get("/{resource}")
+        async def get_export(
+            resource: str,
+            request: Request,
+            query_params: Annotated[ExportQueryParams, Depends()],
+        ) -> Response:
+            try:
+                with track_request("/export/{resource}", query_params=query_params):
+                    artifact = await self._service.export(resource, query_params.format or "ndjson")
+            except KeyError as exc:
+                raise HTTPException(status_code=404, detail=f"Recurso desconhecido: {resource}") from exc
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+            return self._respond(request, artifact)
+
+        return router
+
+
+controller = ExportController()
+router = controller.register_routes()
@@ -0,0 +1,67 @@
+"""Controller for the GraphQL endpoint."""
+
+from __future__ import annotations
+
+import json
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Annotated, Any, Optional
+
+from app.application.services.graphql.graphql_service import GraphQLService
+from app.infrastructure.metrics.swapi_metrics import track_request
+from app.interfaces.dtos.graphql.graphql_request_dto import GraphQLRequestDTO
+from app.interfaces.query_params.graphql.graphql_query_params import GraphQLQueryParams
+
+
+class GraphQLController:
+    """Exposes films, people, planets, species, starships and vehicles through GraphQL."""
+
+    def __init__(self) -> None:
+        self._service = GraphQLService()
+
+    def _decode_json(self, name: str, value: Optional[str]) -> Optional[dict[str, Any]]:
+        if not value:
+            return None
+        try:
+            decoded = json.loads(value)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"O parâmetro {name} deve ser um JSON válido") from exc
+        if decoded is not None and not isinstance(decoded, dict):
+            raise HTTPException(status_code=400, detail=f"O parâmetro {name} deve ser um objeto JSON")
+        return decoded
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/graphql", tags=["graphql"])
+
+        @router.post("")
+        async def post_graphql(request: GraphQLRequestDTO) -> dict:
+            try:
+                with track_request("/graphql"):
+                    return await self._service.execute(
+                        request.query,
+                        request.variables,
+                        request.operationName,
+                        request.extensions,
+                    )
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        @router.get("")
+        async def get_graphql(query_params: Annotated[GraphQLQueryParams, Depends()]) -> dict:
+            variables = self._decode_json("variables", query_params.variables)
+            extensions = self._decode_json("extensions", query_params.extensions)
+            try:
+                with track_request("/graphql"):
+                    return await self._service.execute(
+                        query_params.query,
+                        variables,
+                        query_params.operationName,
+                        extensions,
+                    )
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        return router
+
+
+controller = GraphQLController()
+router = controller.register_routes()
@@ -0,0 +1,29 @@
+"""Controller for the Prometheus metrics endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+# Importa as métricas do gateway para registrá-las antes da primeira coleta
+import app.infrastructure.metrics.swapi_metrics  # noqa: F401
+from app.infrastructure.metrics.metrics_registry import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsController:
+    """Exposes the in-process metrics registry in the Prometheus text format."""
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+        @router.get("")
+        async def get_metrics() -> Response:
+            return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+        return router
+
+
+controller = MetricsController()
+router = controller.register_routes()
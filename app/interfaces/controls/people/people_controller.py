@@ -2,52 +2,84 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Annotated
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from typing import Annotated, Optional
 
 from app.application.services.people.people_service import PeopleService
+from app.application.services.expansion.expansion_service import ExpansionService
+from app.domain.fields.field_selection import parse_fields
+from app.domain.keys.resource_key import api_root, parse_ids
+from app.infrastructure.metrics.swapi_metrics import record_expansion, track_request
+from app.infrastructure.profiling.request_profile import profile_stage
 from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
 
 
 class PeopleController:
     """Exposes people read endpoints backed by the SWAPI."""
 
-    SWAPI_BASE_URL: str = "https://swapi.dev/api/people/"
-
     def __init__(self) -> None:
         self._service = PeopleService()
 
     def _validate_params(self, query_params: PeopleQueryParams) -> PeopleQueryParams:
         if query_params.all:
+            query_params.homeworld = True
             query_params.films = True
             query_params.species = True
             query_params.starships = True
             query_params.vehicles = True
 
+        if query_params.ids:
+            query_params.id = None
+
         if query_params.id:
             query_params.name = None
 
         if query_params.name:
             query_params.id = None
 
+        try:
+            parse_ids(query_params.ids)
+            record_expansion(ExpansionService().plan(self._service.resource_name, query_params.expand))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
         return query_params
 
+    async def fetch(
+        self,
+        query_params: PeopleQueryParams,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> list[dict]:
+        """Runs one lookup; shared by the GET route and the /batch endpoint."""
+
+        query_params = self._validate_params(query_params)
+
+        # Raiz lida a cada requisição para que `set_api_root` valha também aqui
+        swapi_url = f"{api_root()}{self._service.resource_name}/"
+        if query_params.id:
+            swapi_url = f"{swapi_url}{query_params.id}/"
+
+        try:
+            people_entities = await self._service.create_entities(swapi_url, query_params)
+            if background_tasks is not None:
+                # Pré-busca dos relacionados prováveis depois que a resposta é enviada
+                background_tasks.add_task(self._service.prefetch_related, people_entities)
+            fields = parse_fields(query_params.fields)
+            with profile_stage("serialize"):
+                return [person.to_dict(fields) for person in people_entities]
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
     def register_routes(self) -> APIRouter:
         router = APIRouter(prefix="/people", tags=["people"])
 
         @router.get("/")
-        async def get_people(query_params: Annotated[PeopleQueryParams, Depends()]) -> list[dict]:
-            query_params = self._validate_params(query_params)
-
-            swapi_url = f"{self.SWAPI_BASE_URL}"
-            if query_params.id:
-                swapi_url = f"{self.SWAPI_BASE_URL}{query_params.id}/"
-
-            try:
-                people_entities = await self._service.create_entities(swapi_url, query_params)
-                return [person.to_dict() for person in people_entities]
-            except Exception as exc:
-                raise HTTPException(status_code=500, detail=str(exc)) from exc
+        async def get_people(
+            query_params: Annotated[PeopleQueryParams, Depends()],
+            background_tasks: BackgroundTasks,
+        ) -> list[dict]:
+            with track_request("/people/", query_params.expand, query_params):
+                return await self.fetch(query_params, background_tasks)
 
         return router
 
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Annotated
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from typing import Annotated, Optional
 
 from app.application.services.planets.planets_service import PlanetsService
+from app.application.services.expansion.expansion_service import ExpansionService
+from app.domain.fields.field_selection import parse_fields
+from app.domain.keys.resource_key import api_root, parse_ids
+from app.infrastructure.metrics.swapi_metrics import record_expansion, track_request
+from app.infrastructure.profiling.request_profile import profile_stage
 from app.interfaces.query_params.planets.planets_query_params import PlanetsQueryParams
 
 
 class PlanetsController:
     """Exposes planet read endpoints backed by the SWAPI."""
 
-    SWAPI_BASE_URL: str = "https://swapi.dev/api/planets/"
-
     def __init__(self) -> None:
         self._service = PlanetsService()
 
@@ -22,30 +25,58 @@ class PlanetsController:
             query_params.residents = True
             query_params.films = True
 
+        if query_params.ids:
+            query_params.id = None
+
         if query_params.id:
             query_params.name = None
 
         if query_params.name:
             query_params.id = None
 
+        try:
+            parse_ids(query_params.ids)
+            record_expansion(ExpansionService().plan(self._service.resource_name, query_params.expand))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
         return query_params
 
+    async def fetch(
+        self,
+        query_params: PlanetsQueryParams,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> list[dict]:
+        """Runs one lookup; shared by the GET route and the /batch endpoint."""
+
+        query_params = self._validate_params(query_params)
+
+        # Raiz lida a cada requisição para que `set_api_root` valha também aqui
+        swapi_url = f"{api_root()}{self._service.resource_name}/"
+        if query_params.id:
+            swapi_url = f"{swapi_url}{query_params.id}/"
+
+        try:
+            planet_entities = await self._service.create_entities(swapi_url, query_params)
+            if background_tasks is not None:
+                # Pré-busca dos relacionados prováveis depois que a resposta é enviada
+                background_tasks.add_task(self._service.prefetch_related, planet_entities)
+            fields = parse_fields(query_params.fields)
+            with profile_stage("serialize"):
+                return [planet.to_dict(fields) for planet in planet_entities]
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
     def register_routes(self) -> APIRouter:
         router = APIRouter(prefix="/planets", tags=["planets"])
 
         @router.get("/")
-        async def get_planets(query_params: Annotated[PlanetsQueryParams, Depends()]) -> list[dict]:
-            query_params = self._validate_params(query_params)
-
-            swapi_url = f"{self.SWAPI_BASE_URL}"
-            if query_params.id:
-                swapi_url = f"{self.SWAPI_BASE_URL}{query_params.id}/"
-
-            try:
-                planet_entities = await self._service.create_entities(swapi_url, query_params)
-                return [planet.to_dict() for planet in planet_entities]
-            except Exception as exc:
-                raise HTTPException(status_code=500, detail=str(exc)) from exc
+        async def get_planets(
+            query_params: Annotated[PlanetsQueryParams, Depends()],
+            background_tasks: BackgroundTasks,
+        ) -> list[dict]:
+            with track_request("/planets/", query_params.expand, query_params):
+                return await self.fetch(query_params, background_tasks)
 
         return router
 
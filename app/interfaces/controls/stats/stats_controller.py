@@ -0,0 +1,40 @@
+"""Controller for aggregate statistics endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Depends
+from typing import Annotated
+
+from app.application.services.dataset.dataset_service import RESOURCES
+from app.application.services.stats.stats_service import StatsService
+from app.infrastructure.metrics.swapi_metrics import track_request
+from app.interfaces.query_params.stats.stats_query_params import StatsQueryParams
+
+
+class StatsController:
+    """Exposes group-by statistics over the numeric fields of each SWAPI resource."""
+
+    def __init__(self) -> None:
+        self._service = StatsService()
+
+    def register_routes(self) -> APIRouter:
+        router = APIRouter(prefix="/stats", tags=["stats"])
+
+        @router.get("/{resource}")
+        async def get_stats(resource: str, query_params: Annotated[StatsQueryParams, Depends()]) -> dict:
+            if resource not in RESOURCES:
+                raise HTTPException(status_code=404, detail=f"Recurso desconhecido: {resource}")
+
+            try:
+                with track_request("/stats/{resource}", query_params=query_params):
+                    return await self._service.compute(resource, query_params)
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        return router
+
+
+controller = StatsController()
+router = controller.register_routes()
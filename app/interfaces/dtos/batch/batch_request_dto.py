@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class BatchItemDTO:
+    resource: str
+    params: Optional[Dict[str, Any]] = None
+    id: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class BatchRequestDTO:
+    requests: List[BatchItemDTO] = field(default_factory=list)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class GraphQLRequestDTO:
+    query: Optional[str] = None
+    variables: Optional[Dict[str, Any]] = None
+    operationName: Optional[str] = None
+    extensions: Optional[Dict[str, Any]] = None
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
+from app.domain.keys.resource_key import ResourceRef
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PeopleDTO:
+    # Campos com chaves/URLs de recursos, convertidos em URL na serialização
+    reference_fields: ClassVar[tuple[str, ...]] = ("homeworld", "url", "films", "species", "starships", "vehicles")
+
     name: str
     birth_year: Optional[str] = None
     eye_color: Optional[str] = None
@@ -14,15 +19,15 @@ class PeopleDTO:
     height: Optional[str] = None
     mass: Optional[str] = None
     skin_color: Optional[str] = None
-    homeworld: Optional[str] = None
-    url: Optional[str] = None
+    homeworld: Optional[ResourceRef] = None
+    url: Optional[ResourceRef] = None
     created: Optional[str] = None
     edited: Optional[str] = None
 
-    films: Optional[List[str]] = field(default_factory=list)
-    species: Optional[List[str]] = field(default_factory=list)
-    starships: Optional[List[str]] = field(default_factory=list)
-    vehicles: Optional[List[str]] = field(default_factory=list)
+    films: Optional[List[ResourceRef]] = field(default_factory=list)
+    species: Optional[List[ResourceRef]] = field(default_factory=list)
+    starships: Optional[List[ResourceRef]] = field(default_factory=list)
+    vehicles: Optional[List[ResourceRef]] = field(default_factory=list)
 
     # NÃO PRECISA DE to_dict, POIS COMO É UM DATACLASS, JÁ TEM ESSE MÉTODO IMPLÍCITO
         # people_dict = asdict(seu_objeto_people_dto)
\ No newline at end of file
@@ -1,9 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
-@dataclass
+from app.domain.keys.resource_key import ResourceRef
+
+@dataclass(slots=True, frozen=True)
 class PlanetDTO:
+    # Campos com chaves/URLs de recursos, convertidos em URL na serialização
+    reference_fields: ClassVar[tuple[str, ...]] = ("url", "residents", "films")
+
     name: str 
     rotation_period: Optional[str] = None
     orbital_period: Optional[str] = None
@@ -13,12 +18,12 @@ class PlanetDTO:
     terrain: Optional[str] = None
     surface_water: Optional[str] = None
     population: Optional[str] = None
-    url: Optional[str] = None
+    url: Optional[ResourceRef] = None
     created: Optional[str] = None
     edited: Optional[str] = None
 
-    residents: Optional[List[str]] = field(default_factory=list)
-    films: Optional[List[str]] = field(default_factory=list)
+    residents: Optional[List[ResourceRef]] = field(default_factory=list)
+    films: Optional[List[ResourceRef]] = field(default_factory=list)
     
     # NÃO PRECISA DE to_dict, POIS COMO É UM DATACLASS, JÁ TEM ESSE MÉTODO IMPLÍCITO
         # planet_dict = asdict(seu_objeto_planet_dto)
\ No newline at end of file
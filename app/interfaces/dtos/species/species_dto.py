@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
+from app.domain.keys.resource_key import ResourceRef
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SpeciesDTO:
+    # Campos com chaves/URLs de recursos, convertidos em URL na serialização
+    reference_fields: ClassVar[tuple[str, ...]] = ("homeworld", "url", "people", "films")
+
     name: str
     classification: Optional[str] = None
     designation: Optional[str] = None
@@ -15,13 +20,13 @@ class SpeciesDTO:
     hair_colors: Optional[str] = None
     skin_colors: Optional[str] = None
     language: Optional[str] = None
-    homeworld: Optional[str] = None
-    url: Optional[str] = None
+    homeworld: Optional[ResourceRef] = None
+    url: Optional[ResourceRef] = None
     created: Optional[str] = None
     edited: Optional[str] = None
 
-    people: Optional[List[str]] = field(default_factory=list)
-    films: Optional[List[str]] = field(default_factory=list)
+    people: Optional[List[ResourceRef]] = field(default_factory=list)
+    films: Optional[List[ResourceRef]] = field(default_factory=list)
 
     # NÃO PRECISA DE to_dict, POIS COMO É UM DATACLASS, JÁ TEM ESSE MÉTODO IMPLÍCITO
         # species_dict = asdict(seu_objeto_species_dto)
\ No newline at end of file
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
+from app.domain.keys.resource_key import ResourceRef
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class StarshipDTO:
+    # Campos com chaves/URLs de recursos, convertidos em URL na serialização
+    reference_fields: ClassVar[tuple[str, ...]] = ("url", "films", "pilots")
+
     name: str
     model: Optional[str] = None
     starship_class: Optional[str] = None
@@ -19,12 +24,12 @@ class StarshipDTO:
     MGLT: Optional[str] = None
     cargo_capacity: Optional[str] = None
     consumables: Optional[str] = None
-    url: Optional[str] = None
+    url: Optional[ResourceRef] = None
     created: Optional[str] = None
     edited: Optional[str] = None
 
-    films: Optional[List[str]] = field(default_factory=list)
-    pilots: Optional[List[str]] = field(default_factory=list)
+    films: Optional[List[ResourceRef]] = field(default_factory=list)
+    pilots: Optional[List[ResourceRef]] = field(default_factory=list)
 
     # NÃO PRECISA DE to_dict, POIS COMO É UM DATACLASS, JÁ TEM ESSE MÉTODO IMPLÍCITO
         # starship_dict = asdict(seu_objeto_starship_dto)
\ No newline at end of file
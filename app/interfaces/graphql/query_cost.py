@@ -0,0 +1,117 @@
+"""Static cost estimate of a GraphQL operation, computed before execution."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+)
+
+# Tamanho presumido de uma lista sem `limit` (filmes têm dezenas de personagens)
+DEFAULT_LIST_SIZE = 10
+
+
+class InvalidLimitError(ValueError):
+    """`limit` below 1 on a list field; rejected before pricing so it cannot lower the cost."""
+
+
+def _list_size(node: FieldNode, variables: Mapping[str, Any]) -> int:
+    for argument in node.arguments or ():
+        if argument.name.value != "limit":
+            continue
+        value = argument.value
+        limit: Optional[int] = None
+        if isinstance(value, IntValueNode):
+            limit = int(value.value)
+        elif isinstance(value, VariableNode) and isinstance(variables.get(value.name.value), int):
+            limit = variables[value.name.value]
+        if limit is None:
+            break
+        if limit < 1:
+            raise InvalidLimitError(f"O argumento limit de {node.name.value} deve ser maior ou igual a 1 (recebido {limit})")
+        return limit
+    return DEFAULT_LIST_SIZE
+
+
+class _CostWalker:
+    def __init__(self, schema: GraphQLSchema, fragments: Mapping[str, FragmentDefinitionNode], variables: Mapping[str, Any]) -> None:
+        self._schema = schema
+        self._fragments = fragments
+        self._variables = variables
+
+    def selection_cost(self, selection_set: Optional[SelectionSetNode], parent: GraphQLObjectType, seen: frozenset[str]) -> int:
+        if selection_set is None:
+            return 0
+
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self._field_cost(selection, parent, seen)
+            elif isinstance(selection, InlineFragmentNode):
+                cost += self.selection_cost(selection.selection_set, parent, seen)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self._fragments.get(name)
+                if fragment is not None and name not in seen:
+                    cost += self.selection_cost(fragment.selection_set, parent, seen | {name})
+        return cost
+
+    def _field_cost(self, node: FieldNode, parent: GraphQLObjectType, seen: frozenset[str]) -> int:
+        name = node.name.value
+        field = parent.fields.get(name)
+        if field is None or name.startswith("__"):
+            return 1
+
+        field_type = field.type
+        multiplier = 1
+        while isinstance(field_type, (GraphQLNonNull, GraphQLList)):
+            if isinstance(field_type, GraphQLList):
+                multiplier *= _list_size(node, self._variables)
+            field_type = field_type.of_type
+
+        if not isinstance(field_type, GraphQLObjectType):
+            return 1
+        return 1 + multiplier * self.selection_cost(node.selection_set, field_type, seen)
+
+
+def query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    variables: Optional[Mapping[str, Any]] = None,
+    operation_name: Optional[str] = None,
+) -> int:
+    """Estimates resolved fields: each list multiplies its subtree by `limit` (or a default size).
+
+    Raises `InvalidLimitError` when a list field asks for fewer than one item.
+    """
+
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    walker = _CostWalker(schema, fragments, variables or {})
+
+    cost = 0
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        if operation_name and (definition.name is None or definition.name.value != operation_name):
+            continue
+        root = schema.get_root_type(definition.operation)
+        if root is not None:
+            cost = max(cost, walker.selection_cost(definition.selection_set, root, frozenset()))
+    return cost
@@ -0,0 +1,133 @@
+"""GraphQL schema over the six SWAPI resources and their relationships."""
+
+from __future__ import annotations
+
+from dataclasses import fields as dataclass_fields
+from typing import Any, Callable
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+from app.domain.keys.resource_key import SwapiResource, as_key, key_for, to_url
+from app.infrastructure.graph.relationship_graph import RELATIONS
+from app.interfaces.dtos.films.films_dto import FilmDTO
+from app.interfaces.dtos.people.people_dto import PeopleDTO
+from app.interfaces.dtos.planets.planets_dto import PlanetDTO
+from app.interfaces.dtos.species.species_dto import SpeciesDTO
+from app.interfaces.dtos.starships.starships_dto import StarshipDTO
+from app.interfaces.dtos.vehicles.vehicles_dto import VehicleDTO
+
+# recurso -> (tipo GraphQL, DTO, campo de consulta individual, campo de listagem)
+RESOURCE_TYPES: dict[str, tuple[str, type, str, str]] = {
+    "films": ("Film", FilmDTO, "film", "allFilms"),
+    "people": ("Person", PeopleDTO, "person", "allPeople"),
+    "planets": ("Planet", PlanetDTO, "planet", "allPlanets"),
+    "species": ("Species", SpeciesDTO, "species", "allSpecies"),
+    "starships": ("Starship", StarshipDTO, "starship", "allStarships"),
+    "vehicles": ("Vehicle", VehicleDTO, "vehicle", "allVehicles"),
+}
+
+SINGLE_RELATIONS = frozenset({"homeworld"})
+INT_FIELDS = frozenset({"episode_id"})
+
+
+def _resolve_id(dto: Any, info: GraphQLResolveInfo) -> int | None:
+    key = as_key(dto.url)
+    return key.id if key is not None else None
+
+
+def _resolve_url(dto: Any, info: GraphQLResolveInfo) -> str | None:
+    return to_url(dto.url) if dto.url else None
+
+
+def _relation_resolver(relation: str) -> Callable[..., Any]:
+    single = relation in SINGLE_RELATIONS
+
+    async def resolve(dto: Any, info: GraphQLResolveInfo) -> Any:
+        loader = info.context["loader"]
+        value = getattr(dto, relation)
+        if single:
+            key = as_key(value)
+            return await loader.load(key) if key is not None else None
+        return await loader.load_many([key for key in map(as_key, value or ()) if key is not None])
+
+    return resolve
+
+
+def _item_resolver(resource: str) -> Callable[..., Any]:
+    async def resolve(_: Any, info: GraphQLResolveInfo, id: int) -> Any:
+        return await info.context["loader"].load(key_for(SwapiResource(resource), id))
+
+    return resolve
+
+
+def _list_resolver(resource: str) -> Callable[..., Any]:
+    async def resolve(_: Any, info: GraphQLResolveInfo, **arguments: Any) -> Any:
+        return await info.context["list_resource"](
+            resource,
+            arguments.get("search"),
+            arguments.get("limit"),
+            arguments.get("orderBy"),
+        )
+
+    return resolve
+
+
+def build_schema() -> GraphQLSchema:
+    object_types: dict[str, GraphQLObjectType] = {}
+
+    def _fields_for(resource: str) -> Callable[[], dict[str, GraphQLField]]:
+        def _fields() -> dict[str, GraphQLField]:
+            dto_type = RESOURCE_TYPES[resource][1]
+            relations = RELATIONS[resource]
+            result = {
+                "id": GraphQLField(GraphQLInt, resolve=_resolve_id),
+                "url": GraphQLField(GraphQLString, resolve=_resolve_url),
+            }
+            for item in dataclass_fields(dto_type):
+                if item.name in result:
+                    continue
+                if item.name in relations:
+                    target = object_types[relations[item.name]]
+                    field_type = target if item.name in SINGLE_RELATIONS else GraphQLNonNull(GraphQLList(GraphQLNonNull(target)))
+                    result[item.name] = GraphQLField(field_type, resolve=_relation_resolver(item.name))
+                else:
+                    result[item.name] = GraphQLField(GraphQLInt if item.name in INT_FIELDS else GraphQLString)
+            return result
+
+        return _fields
+
+    for resource, (type_name, *_rest) in RESOURCE_TYPES.items():
+        object_types[resource] = GraphQLObjectType(type_name, _fields_for(resource))
+
+    query_fields: dict[str, GraphQLField] = {}
+    for resource, (_, _dto, item_field, list_field) in RESOURCE_TYPES.items():
+        object_type = object_types[resource]
+        query_fields[item_field] = GraphQLField(
+            object_type,
+            args={"id": GraphQLArgument(GraphQLNonNull(GraphQLInt))},
+            resolve=_item_resolver(resource),
+        )
+        query_fields[list_field] = GraphQLField(
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(object_type))),
+            args={
+                "search": GraphQLArgument(GraphQLString, description="Busca pelo nome (ou título)"),
+                "limit": GraphQLArgument(GraphQLInt, description="Quantidade máxima de itens"),
+                "orderBy": GraphQLArgument(GraphQLString, description="Campos de ordenação, como em `order_by`"),
+            },
+            resolve=_list_resolver(resource),
+        )
+
+    return GraphQLSchema(query=GraphQLObjectType("Query", query_fields))
+
+
+swapi_schema = build_schema()
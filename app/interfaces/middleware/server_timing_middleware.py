@@ -0,0 +1,48 @@
+"""ASGI middleware that reports the request profile in `Server-Timing` and a debug header."""
+
+from __future__ import annotations
+
+import json
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.profiling.request_profile import activate_profile
+
+# Cabeçalho da requisição que pede o perfil; a resposta traz o JSON em PROFILE_HEADER
+DEBUG_HEADER = "x-debug-profile"
+PROFILE_HEADER = "X-Request-Profile"
+
+
+class ServerTimingMiddleware:
+    """Adds `Server-Timing` (always, or when asked) and the JSON breakdown (when asked).
+
+    Requests that did not ask for it are passed through untouched, so the
+    profile only costs anything when someone is looking at it.
+    """
+
+    def __init__(self, app: ASGIApp, always: bool = False) -> None:
+        self.app = app
+        self.always = always
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        debug = Headers(scope=scope).get(DEBUG_HEADER, "").strip().lower() in {"1", "true", "yes", "on"}
+        if not (self.always or debug):
+            await self.app(scope, receive, send)
+            return
+
+        with activate_profile() as profile:
+            async def send_with_timing(message: Message) -> None:
+                # O corpo JSON já foi serializado quando o início da resposta é enviado
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", profile.server_timing())
+                    if debug:
+                        headers.append(PROFILE_HEADER, json.dumps(profile.to_dict(), separators=(",", ":")))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
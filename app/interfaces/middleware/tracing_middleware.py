@@ -0,0 +1,49 @@
+"""ASGI middleware that opens the server span of each request, continuing an incoming W3C trace."""
+
+from __future__ import annotations
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing.tracer import SpanKind, StatusCode, tracer
+
+
+class TracingMiddleware:
+    """Wraps each HTTP request in a `SERVER` span; the response echoes its `traceparent`.
+
+    When no exporter is configured the request is passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        incoming = Headers(scope=scope).get("traceparent")
+        with tracer.start_span(f"{method} {scope.get('path', '')}", kind=SpanKind.SERVER, traceparent=incoming) as span:
+            if span.recording:
+                span.set_attribute("http.request.method", method)
+                span.set_attribute("url.path", scope.get("path", ""))
+                if scope.get("query_string"):
+                    span.set_attribute("url.query", scope["query_string"].decode("latin-1"))
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start" and span.recording:
+                    status = message["status"]
+                    span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        span.set_status(StatusCode.ERROR)
+                    MutableHeaders(scope=message).append("traceparent", span.traceparent)
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
+
+            # Nome de baixa cardinalidade: o template da rota (/people/{id}), quando houver
+            route = getattr(scope.get("route"), "path", None)
+            if route and span.recording:
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
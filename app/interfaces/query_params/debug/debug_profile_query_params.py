@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Query
+from fastapi.params import Param
+
+@dataclass
+class DebugProfileQueryParams:
+    seconds: Optional[float] = Query(5.0, gt=0, le=60, description="Duração da amostragem em segundos (máximo 60)")
+    # cpu: pilhas amostradas de todas as threads; alloc: crescimento de alocações (tracemalloc)
+    mode: Optional[str] = Query("cpu", description="Tipo de perfil: 'cpu' ou 'alloc'")
+    format: Optional[str] = Query("collapsed", description="Saída do modo cpu: 'collapsed' (texto) ou 'speedscope' (JSON)")
+    interval_ms: Optional[float] = Query(5.0, ge=1, le=100, description="Intervalo entre amostras em milissegundos")
+    idle: Optional[bool] = Query(False, description="Inclui threads paradas esperando trabalho (select do loop, fila do executor)")
+    limit: Optional[int] = Query(25, ge=1, le=200, description="Quantidade de pontos de alocação retornados no modo alloc")
+
+    def __post_init__(self):
+        """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if isinstance(value, Param):
+                setattr(self, field_name, value.default)
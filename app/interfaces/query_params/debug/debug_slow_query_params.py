@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Query
+from fastapi.params import Param
+
+@dataclass
+class DebugSlowQueryParams:
+    route: Optional[str] = Query(None, description="Filtra pela rota (ex.: '/people/')")
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas as N requisições lentas mais recentes")
+
+    def __post_init__(self):
+        """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if isinstance(value, Param):
+                setattr(self, field_name, value.default)
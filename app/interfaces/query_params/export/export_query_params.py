@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Query
+from fastapi.params import Param
+
+@dataclass
+class ExportQueryParams:
+    # Formato do arquivo: NDJSON compactado com gzip ou arquivo colunar do NumPy (.npz)
+    format: Optional[str] = Query("ndjson", description="Formato da exportação: 'ndjson' (gzip) ou 'npz' (colunar)")
+
+    def __post_init__(self):
+        """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if isinstance(value, Param):
+                setattr(self, field_name, value.default)
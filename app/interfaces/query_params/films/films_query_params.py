@@ -1,12 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional
-from fastapi import Query
+from fastapi import HTTPException, Query
 from fastapi.params import Param
 
+from app.domain.numeric.numeric_projection import parse_date
+
 @dataclass
 class FilmsQueryParams:
     # Parametros nativos da api SWAPI
     id: Optional[int] = Query(None, description="ID do filme na SWAPI")
+    ids: Optional[str] = Query(None, description="IDs de filmes separados por vírgula, buscados em uma única requisição") # ex.: '1,2,3'
     title: Optional[str] = Query(None, description="Busca pelo título do filme")
 
     # Parametros personalizados para busca dos relacionamentos sob demanda
@@ -19,10 +22,34 @@ class FilmsQueryParams:
     # Parametro que inclui todas os relacionamentos
     all: Optional[bool] = Query(None, description="Inclui todos os relacionamentos na resposta")
     order: Optional[str] = Query(None, description="Ordena os resultados pelo campo especificado") # 'ASC' ou 'DESC'
+    order_by: Optional[str] = Query(None, description="Ordena pelos campos informados, separados por vírgula ('-' inverte o sentido); números e datas da SWAPI são comparados pelo valor") # ex.: '-release_date'
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas os N primeiros resultados após filtros e ordenação")
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula; relacionamentos aceitam subcampos") # ex.: 'title,characters.name'
+    expand: Optional[str] = Query(None, description="Expande relacionamentos em vários níveis, separados por vírgula (máximo de 3 níveis)") # ex.: 'characters.homeworld'
+
+    # Filtros por faixa sobre os campos numéricos da SWAPI
+    min_release_date: Optional[str] = Query(None, description="Data de lançamento mínima (AAAA-MM-DD)")
+    max_release_date: Optional[str] = Query(None, description="Data de lançamento máxima (AAAA-MM-DD)")
+
+    # Filtros por valor categórico (aceita um dos itens de listas como 'arid, temperate')
+    director: Optional[str] = Query(None, description="Filtra pelo diretor do filme")
+
+    # Filtros por junção no grafo de relacionamentos (IDs da SWAPI)
+    character_id: Optional[int] = Query(None, description="Filtra filmes em que a pessoa de ID informado aparece")
+    planet_id: Optional[int] = Query(None, description="Filtra filmes em que o planeta de ID informado aparece")
+    starship_id: Optional[int] = Query(None, description="Filtra filmes em que a nave de ID informado aparece")
+    vehicle_id: Optional[int] = Query(None, description="Filtra filmes em que o veículo de ID informado aparece")
+    species_id: Optional[int] = Query(None, description="Filtra filmes em que a espécie de ID informado aparece")
 
     def __post_init__(self):
         """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
         for field_name in self.__dataclass_fields__:
             value = getattr(self, field_name)
             if isinstance(value, Param):
-                setattr(self, field_name, value.default)
\ No newline at end of file
+                setattr(self, field_name, value.default)
+
+        # Uma data que não pode ser lida viraria, em silêncio, uma faixa aberta
+        for field_name in ("min_release_date", "max_release_date"):
+            value = getattr(self, field_name)
+            if value is not None and parse_date(value) is None:
+                raise HTTPException(status_code=400, detail=f"Data inválida em {field_name}: {value} (use AAAA-MM-DD)")
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Query
+from fastapi.params import Param
+
+@dataclass
+class GraphQLQueryParams:
+    # Parametros do protocolo GraphQL sobre HTTP (GET), usados principalmente com persisted queries
+    query: Optional[str] = Query(None, description="Documento GraphQL")
+    variables: Optional[str] = Query(None, description="Variáveis da operação em JSON")
+    operationName: Optional[str] = Query(None, description="Operação executada quando o documento tem mais de uma")
+    extensions: Optional[str] = Query(None, description="Extensões em JSON (ex.: persistedQuery com sha256Hash)")
+
+    def __post_init__(self):
+        """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if isinstance(value, Param):
+                setattr(self, field_name, value.default)
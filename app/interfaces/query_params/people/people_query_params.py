@@ -7,9 +7,11 @@ from fastapi.params import Param
 class PeopleQueryParams:
     # Parametros nativos da api SWAPI
     id: Optional[int] = Query(None, description="ID da pessoa na SWAPI")
+    ids: Optional[str] = Query(None, description="IDs de pessoas separados por vírgula, buscados em uma única requisição") # ex.: '1,2,3'
     name: Optional[str] | None = Query(None, description="Busca pelo nome da pessoa")
 
     # Parametros personalizados para busca dos relacionamentos sob demanda
+    homeworld: Optional[bool] = Query(None, description="Busca também o planeta natal daquela pessoa")
     films: Optional[bool] = Query(None, description="Busca também os filmes relacionados aquela pessoa")
     species: Optional[bool] = Query(None, description="Busca também as espécies relacionadas aquela pessoa")
     starships: Optional[bool] = Query(None, description="Busca também as naves espaciais relacionadas aquela pessoa")
@@ -18,6 +20,26 @@ class PeopleQueryParams:
     # Parametro que inclui todas os relacionamentos
     all: Optional[bool] = Query(None, description="Inclui todos os relacionamentos na resposta")
     order: Optional[str] = Query(None, description="Ordena os resultados pelo campo especificado") # 'ASC' ou 'DESC'
+    order_by: Optional[str] = Query(None, description="Ordena pelos campos informados, separados por vírgula ('-' inverte o sentido); números e datas da SWAPI são comparados pelo valor") # ex.: '-mass'
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas os N primeiros resultados após filtros e ordenação")
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula; relacionamentos aceitam subcampos") # ex.: 'name,films.title'
+    expand: Optional[str] = Query(None, description="Expande relacionamentos em vários níveis, separados por vírgula (máximo de 3 níveis)") # ex.: 'homeworld.residents'
+
+    # Filtros por faixa sobre os campos numéricos da SWAPI
+    min_height: Optional[float] = Query(None, description="Altura mínima (cm)")
+    max_height: Optional[float] = Query(None, description="Altura máxima (cm)")
+    min_mass: Optional[float] = Query(None, description="Massa mínima (kg)")
+    max_mass: Optional[float] = Query(None, description="Massa máxima (kg)")
+
+    # Filtros por valor categórico (aceita um dos itens de listas como 'arid, temperate')
+    gender: Optional[str] = Query(None, description="Filtra pelo gênero da pessoa")
+
+    # Filtros por junção no grafo de relacionamentos (IDs da SWAPI)
+    homeworld_id: Optional[int] = Query(None, description="Filtra pessoas cujo planeta natal tem o ID informado")
+    film_id: Optional[int] = Query(None, description="Filtra pessoas que aparecem no filme de ID informado")
+    species_id: Optional[int] = Query(None, description="Filtra pessoas da espécie de ID informado")
+    starship_id: Optional[int] = Query(None, description="Filtra pessoas que pilotaram a nave de ID informado")
+    vehicle_id: Optional[int] = Query(None, description="Filtra pessoas que pilotaram o veículo de ID informado")
 
     def __post_init__(self):
         """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
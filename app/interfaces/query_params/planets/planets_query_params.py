@@ -7,6 +7,7 @@ from fastapi.params import Param
 class PlanetsQueryParams:
     # Parametros nativos da api SWAPI
     id: Optional[int] = Query(None, description="ID do planeta na SWAPI")
+    ids: Optional[str] = Query(None, description="IDs de planetas separados por vírgula, buscados em uma única requisição") # ex.: '1,2,3'
     name: Optional[str] = Query(None, description="Busca pelo nome do planeta")
 
     # Parametros personalizados para busca dos relacionamentos sob demanda
@@ -16,6 +17,25 @@ class PlanetsQueryParams:
     # Parametro que inclui todas os relacionamentos
     all: Optional[bool] = Query(None, description="Inclui todos os relacionamentos na resposta")
     order: Optional[str] = Query(None, description="Ordena os resultados pelo campo especificado") # 'ASC' ou 'DESC'
+    order_by: Optional[str] = Query(None, description="Ordena pelos campos informados, separados por vírgula ('-' inverte o sentido); números e datas da SWAPI são comparados pelo valor") # ex.: '-population'
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas os N primeiros resultados após filtros e ordenação")
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula; relacionamentos aceitam subcampos") # ex.: 'name,residents.name'
+    expand: Optional[str] = Query(None, description="Expande relacionamentos em vários níveis, separados por vírgula (máximo de 3 níveis)") # ex.: 'residents.species'
+
+    # Filtros por faixa sobre os campos numéricos da SWAPI
+    min_population: Optional[float] = Query(None, description="População mínima")
+    max_population: Optional[float] = Query(None, description="População máxima")
+    min_diameter: Optional[float] = Query(None, description="Diâmetro mínimo (km)")
+    max_diameter: Optional[float] = Query(None, description="Diâmetro máximo (km)")
+
+    # Filtros por valor categórico (aceita um dos itens de listas como 'arid, temperate')
+    climate: Optional[str] = Query(None, description="Filtra pelo clima do planeta (ex.: 'arid')")
+    terrain: Optional[str] = Query(None, description="Filtra pelo terreno do planeta (ex.: 'desert')")
+
+    # Filtros por junção no grafo de relacionamentos (IDs da SWAPI)
+    resident_id: Optional[int] = Query(None, description="Filtra planetas onde reside a pessoa de ID informado")
+    film_id: Optional[int] = Query(None, description="Filtra planetas que aparecem no filme de ID informado")
+    species_id: Optional[int] = Query(None, description="Filtra planetas natais da espécie de ID informado")
 
     def __post_init__(self):
         """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
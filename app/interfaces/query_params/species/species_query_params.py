@@ -7,15 +7,36 @@ from fastapi.params import Param
 class SpeciesQueryParams:
     # Parametros nativos da api SWAPI
     id: Optional[int] = Query(None, description="ID da espécie na SWAPI")
+    ids: Optional[str] = Query(None, description="IDs de espécies separados por vírgula, buscados em uma única requisição") # ex.: '1,2,3'
     name: Optional[str] = Query(None, description="Busca pelo nome da espécie")
 
     # Parametros personalizados para busca dos relacionamentos sob demanda
+    homeworld: Optional[bool] = Query(None, description="Busca também o planeta natal daquela espécie")
     people: Optional[bool] = Query(None, description="Busca também as pessoas relacionadas aquela espécie")
     films: Optional[bool] = Query(None, description="Busca também os filmes relacionados aquela espécie")
     
     # Parametro que inclui todas os relacionamentos
     all: Optional[bool] = Query(None, description="Inclui todos os relacionamentos na resposta")
     order: Optional[str] = Query(None, description="Ordena os resultados pelo campo especificado") # 'ASC' ou 'DESC'
+    order_by: Optional[str] = Query(None, description="Ordena pelos campos informados, separados por vírgula ('-' inverte o sentido); números e datas da SWAPI são comparados pelo valor") # ex.: '-average_lifespan'
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas os N primeiros resultados após filtros e ordenação")
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula; relacionamentos aceitam subcampos") # ex.: 'name,people.name'
+    expand: Optional[str] = Query(None, description="Expande relacionamentos em vários níveis, separados por vírgula (máximo de 3 níveis)") # ex.: 'people.starships'
+
+    # Filtros por faixa sobre os campos numéricos da SWAPI
+    min_height: Optional[float] = Query(None, description="Altura média mínima (cm)")
+    max_height: Optional[float] = Query(None, description="Altura média máxima (cm)")
+    min_lifespan: Optional[float] = Query(None, description="Expectativa de vida média mínima (anos)")
+    max_lifespan: Optional[float] = Query(None, description="Expectativa de vida média máxima (anos)")
+
+    # Filtros por valor categórico (aceita um dos itens de listas como 'arid, temperate')
+    classification: Optional[str] = Query(None, description="Filtra pela classificação da espécie")
+    designation: Optional[str] = Query(None, description="Filtra pela designação da espécie")
+
+    # Filtros por junção no grafo de relacionamentos (IDs da SWAPI)
+    homeworld_id: Optional[int] = Query(None, description="Filtra espécies cujo planeta natal tem o ID informado")
+    person_id: Optional[int] = Query(None, description="Filtra espécies da pessoa de ID informado")
+    film_id: Optional[int] = Query(None, description="Filtra espécies que aparecem no filme de ID informado")
 
     def __post_init__(self):
         """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
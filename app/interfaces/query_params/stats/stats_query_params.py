@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Optional
+from fastapi import Query
+from fastapi.params import Param
+
+@dataclass
+class StatsQueryParams:
+    # Campos numéricos (projetados a partir das strings da SWAPI) que serão agregados
+    fields: Optional[str] = Query(None, description="Campos numéricos agregados, separados por vírgula (padrão: todos)")
+
+    # Agrupamento e métricas
+    group_by: Optional[str] = Query(None, description="Campo categórico usado no agrupamento (ex.: 'climate')")
+    metrics: Optional[str] = Query(None, description="Métricas separadas por vírgula: count, sum, mean, min, max (padrão: todas)")
+    percentiles: Optional[str] = Query(None, description="Percentis separados por vírgula (ex.: '50,90,99')")
+
+    def __post_init__(self):
+        """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if isinstance(value, Param):
+                setattr(self, field_name, value.default)
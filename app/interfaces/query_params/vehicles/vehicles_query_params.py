@@ -7,6 +7,7 @@ from fastapi.params import Param
 class VehiclesQueryParams:
     # Parametros nativos da api SWAPI
     id: Optional[int] = Query(None, description="ID do veículo na SWAPI")
+    ids: Optional[str] = Query(None, description="IDs de veículos separados por vírgula, buscados em uma única requisição") # ex.: '1,2,3'
     name: Optional[str] = Query(None, description="Busca pelo nome do veículo")
     model: Optional[str] = Query(None, description="Busca pelo modelo do veículo")
 
@@ -17,6 +18,25 @@ class VehiclesQueryParams:
     # Parametro que inclui todas os relacionamentos
     all: Optional[bool] = Query(None, description="Inclui todos os relacionamentos na resposta")
     order: Optional[str] = Query(None, description="Ordena os resultados pelo campo especificado") # 'ASC' ou 'DESC'
+    order_by: Optional[str] = Query(None, description="Ordena pelos campos informados, separados por vírgula ('-' inverte o sentido); números e datas da SWAPI são comparados pelo valor") # ex.: '-crew'
+    limit: Optional[int] = Query(None, ge=1, description="Retorna apenas os N primeiros resultados após filtros e ordenação")
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula; relacionamentos aceitam subcampos") # ex.: 'name,pilots.name'
+    expand: Optional[str] = Query(None, description="Expande relacionamentos em vários níveis, separados por vírgula (máximo de 3 níveis)") # ex.: 'pilots.homeworld'
+
+    # Filtros por faixa sobre os campos numéricos da SWAPI
+    min_cost: Optional[float] = Query(None, description="Custo mínimo em créditos")
+    max_cost: Optional[float] = Query(None, description="Custo máximo em créditos")
+    min_crew: Optional[float] = Query(None, description="Tripulação mínima")
+    max_crew: Optional[float] = Query(None, description="Tripulação máxima")
+    min_length: Optional[float] = Query(None, description="Comprimento mínimo (m)")
+    max_length: Optional[float] = Query(None, description="Comprimento máximo (m)")
+
+    # Filtros por valor categórico (aceita um dos itens de listas como 'arid, temperate')
+    vehicle_class: Optional[str] = Query(None, description="Filtra pela classe do veículo")
+
+    # Filtros por junção no grafo de relacionamentos (IDs da SWAPI)
+    pilot_id: Optional[int] = Query(None, description="Filtra veículos pilotados pela pessoa de ID informado")
+    film_id: Optional[int] = Query(None, description="Filtra veículos que aparecem no filme de ID informado")
 
     def __post_init__(self):
         """Converte descriptors Query em valores padrão para uso fora do FastAPI."""
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -7,13 +9,57 @@ from app.interfaces.controls.planets.planets_controller import router as planets
 from app.interfaces.controls.species.species_controller import router as species_router
 from app.interfaces.controls.starships.starships_controller import router as starships_router
 from app.interfaces.controls.vehicles.vehicles_controller import router as vehicles_router
+from app.interfaces.controls.stats.stats_controller import router as stats_router
+from app.interfaces.controls.graphql.graphql_controller import router as graphql_router
+from app.interfaces.controls.batch.batch_controller import router as batch_router
+from app.interfaces.controls.export.export_controller import router as export_router
+from app.interfaces.controls.metrics.metrics_controller import router as metrics_router
+from app.interfaces.controls.debug.debug_controller import router as debug_router
+from app.interfaces.middleware.server_timing_middleware import PROFILE_HEADER, ServerTimingMiddleware
+from app.interfaces.middleware.tracing_middleware import TracingMiddleware
+from app.infrastructure.tracing.tracer import exporter_for, tracer
+from app.infrastructure.profiling.slow_request_log import slow_log
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.warmup.warmup_service import WarmupService
+from app.config.configuration import load_configuration
 
 import os
 
+configuration = load_configuration()
+tracer.configure(
+    exporter_for(configuration["tracing_exporter"], configuration["tracing_endpoint"]),
+    configuration["tracing_sample_ratio"],
+)
+BaseSwapiService.configure_cache(
+    configuration["cache_ttl_seconds"],
+    configuration["cache_max_entries"],
+    configuration["table_cache_max_entries"],
+)
+slow_log.configure(
+    configuration["slow_request_ms"] / 1000,
+    configuration["slow_log_size"],
+    configuration["slow_log_to_logs"],
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Aquece o cache antes de aceitar tráfego, sem bloquear além do orçamento configurado
+    warmup = WarmupService()
+    tasks = warmup.start(configuration)
+    await warmup.wait_ready(tasks[0] if tasks else None, configuration["warmup_budget_seconds"])
+    yield
+    for task in tasks:
+        task.cancel()
+    # Envia os spans ainda em buffer antes de encerrar
+    tracer.configure(None)
+
+
 app = FastAPI(
     title="Api Star Wars - Backend Python FastAPI",
     description="Arquitetura DDD: camada de API, domínio e infraestrutura comunicando com a SWAPI.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -21,7 +67,10 @@ app.add_middleware(
     allow_origins=["*"], 
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", PROFILE_HEADER, "traceparent"],
 )
+app.add_middleware(ServerTimingMiddleware, always=configuration["server_timing"])
+app.add_middleware(TracingMiddleware)
 
 app.include_router(films_router)
 app.include_router(people_router)
@@ -29,6 +78,12 @@ app.include_router(planets_router)
 app.include_router(species_router)
 app.include_router(starships_router)
 app.include_router(vehicles_router)
+app.include_router(stats_router)
+app.include_router(graphql_router)
+app.include_router(batch_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
+app.include_router(debug_router)
 
 @app.get("/health")
 def healthcheck() -> dict[str, str]:
@@ -0,0 +1,92 @@
+"""Benchmark of the columnar query path against Python `sorted()`/filters.
+
+The Python baseline mirrors the former per-service `_order_entities` lambdas and a
+list-comprehension range filter over the (cached) numeric projection.
+
+Usage:
+    python -m benchmarks.bench_columnar
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import Any
+
+from app.application.services.planets.planets_service import PlanetsService
+from app.domain.numeric.numeric_projection import numeric_projection
+from app.infrastructure.columnar.columnar_table import RangeFilter, SortKey
+from benchmarks.payloads import planet_payload, url
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def _planets(size: int) -> list[dict[str, Any]]:
+    rng = random.Random(size)
+    rows = []
+    for item_id in range(1, size + 1):
+        payload = planet_payload(rng, item_id)
+        payload["url"] = url("planets", item_id)
+        rows.append(payload)
+    return rows
+
+
+def _python_sort_by_name(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(rows, key=lambda planet: (planet["name"] or "").lower())
+
+
+def _python_filter_sort(rows: list[dict[str, Any]], limit: int | None = None) -> list[dict[str, Any]]:
+    def population(row: dict[str, Any]) -> float | None:
+        return numeric_projection.value("planets", row, "population")
+
+    selected = [row for row in rows if (value := population(row)) is not None and 1e5 <= value <= 1e11]
+    ordered = sorted(selected, key=lambda row: (-population(row), row["name"].lower()))
+    return ordered[:limit] if limit is not None else ordered
+
+
+def _best(func: Any, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    service = PlanetsService()
+    filters = [RangeFilter("population", 1e5, 1e11)]
+    sort = [SortKey("population", True), SortKey("name")]
+
+    print(f"{'rows':>6}  {'shape':<26}{'python us':>12}{'columnar us':>14}{'speedup':>10}")
+    for size in SIZES:
+        rows = _planets(size)
+        table = service._build_table(rows)
+        number = max(1, 20000 // size)
+
+        columnar = [rows[index] for index in table.query(filters, sort)]
+        assert [row["url"] for row in columnar] == [row["url"] for row in _python_filter_sort(rows)]
+
+        shapes = {
+            "sort by name": (
+                lambda: _python_sort_by_name(rows),
+                lambda: [rows[index] for index in table.query(sort=[SortKey("name")])],
+            ),
+            "filter + 2-key sort": (
+                lambda: _python_filter_sort(rows),
+                lambda: [rows[index] for index in table.query(filters, sort)],
+            ),
+            "filter + 2-key top-10": (
+                lambda: _python_filter_sort(rows, limit=10),
+                lambda: [rows[index] for index in table.query(filters, sort, limit=10)],
+            ),
+        }
+        for label, (python_path, columnar_path) in shapes.items():
+            python_seconds = _best(python_path, number)
+            columnar_seconds = _best(columnar_path, number)
+            print(
+                f"{size:>6}  {label:<26}{python_seconds * 1e6:>12.1f}{columnar_seconds * 1e6:>14.1f}"
+                f"{python_seconds / columnar_seconds:>9.1f}x"
+            )
+
+        build_seconds = _best(lambda: service._build_table(rows), max(1, number // 4))
+        print(f"{size:>6}  {'table build (once/payload)':<26}{'':>12}{build_seconds * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
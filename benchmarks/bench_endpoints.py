@@ -0,0 +1,293 @@
+"""End-to-end latency and throughput benchmark for the resource endpoints.
+
+Drives the real FastAPI app (routing, middleware, services, serialization)
+in-process through `httpx.ASGITransport`, with SWAPI served by the local
+stub over real HTTP after an injected latency. For every resource it runs
+four query shapes — single id, name search, list and `all=true` — under:
+
+- cold cache: the gateway caches are cleared before each request,
+  requests run one at a time;
+- warm cache: every distinct query is primed once, then the requests run
+  with the configured concurrency.
+
+Each scenario is repeated (the run with the best p50 is kept, as in
+`timeit`) and reports p50/p95/p99 latency, requests/s, errors and SWAPI
+calls per request. The calls of each request are read from the app's own
+request profile (`X-Request-Profile`), so they are also attributed to
+their path under concurrency. Results can be written as JSON and compared
+against a stored baseline recorded with the same settings; the run exits
+with status 1 when a scenario regresses (slower p50, more SWAPI calls for
+any path or new errors).
+
+Usage:
+    python -m benchmarks.bench_endpoints
+    python -m benchmarks.bench_endpoints --output results.json
+    python -m benchmarks.bench_endpoints --baseline benchmarks/baselines/endpoints.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import sys
+import time
+from typing import Any, Optional
+
+import httpx
+
+from app.interfaces.middleware.server_timing_middleware import DEBUG_HEADER, PROFILE_HEADER
+from benchmarks.payloads import RESOURCE_COUNTS
+from benchmarks.swapi_stub import StubConfig, SwapiStub
+
+SHAPES = ("single", "search", "list", "all")
+SEARCH_PARAMS = {
+    "films": ("title", "Film"),
+    "people": ("name", "Person"),
+    "planets": ("name", "Planet"),
+    "species": ("name", "Species"),
+    "starships": ("name", "Starships"),
+    "vehicles": ("name", "Vehicles"),
+}
+# IDs percorridos em rodízio: consultas distintas, mas um conjunto pequeno o bastante para aquecer
+DISTINCT_IDS = 5
+
+# Regressão: p50 acima de (1 + tolerância) × baseline e pelo menos este tanto mais lento;
+# p95/p99 são reportados, mas oscilam demais entre execuções para bloquear sozinhos
+MIN_REGRESSION_MS = 10.0
+# Configurações que mudam os números: só se compara com uma baseline gravada com os mesmos valores
+RUN_SETTINGS = ("latency_ms", "latency_distribution", "cold_requests", "warm_requests", "concurrency", "repeats")
+
+
+def paths_for(resource: str, shape: str) -> list[str]:
+    """Distinct request paths of one scenario, visited round-robin."""
+
+    ids = range(1, min(DISTINCT_IDS, RESOURCE_COUNTS[resource]) + 1)
+    if shape == "single":
+        return [f"/{resource}/?id={item_id}" for item_id in ids]
+    if shape == "all":
+        return [f"/{resource}/?id={item_id}&all=true" for item_id in ids]
+    if shape == "search":
+        param, prefix = SEARCH_PARAMS[resource]
+        return [f"/{resource}/?{param}={prefix}%20{item_id}" for item_id in ids]
+    return [f"/{resource}/"]
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _clear_caches() -> None:
+    from app.application.services.base_service import BaseSwapiService
+    from app.domain.numeric.numeric_projection import numeric_projection
+
+    BaseSwapiService._cache.clear()
+    BaseSwapiService._hot_keys.clear()
+    BaseSwapiService._co_access.clear()
+    numeric_projection.clear()
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    paths: list[str],
+    total: int,
+    concurrency: int,
+    cold: bool,
+) -> tuple[list[float], int, float, dict[str, list[int]]]:
+    latencies: list[float] = []
+    errors = 0
+    calls: dict[str, list[int]] = {}
+    cursor = iter(range(total))
+
+    async def _worker() -> None:
+        nonlocal errors
+        for index in cursor:
+            if cold:
+                _clear_caches()
+            path = paths[index % len(paths)]
+            started = time.perf_counter()
+            response = await client.get(path, headers={DEBUG_HEADER: "1"})
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+            profile = json.loads(response.headers.get(PROFILE_HEADER, "{}"))
+            calls.setdefault(path, []).append(profile.get("upstream", {}).get("calls", 0))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[_worker() for _ in range(concurrency)])
+    return latencies, errors, time.perf_counter() - started, calls
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float, calls: dict[str, list[int]]) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    upstream_calls = sum(sum(values) for values in calls.values())
+    return {
+        "requests": count,
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 0.50) * 1e3, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1e3, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1e3, 3),
+        "rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "upstream_per_request": round(upstream_calls / count, 3) if count else 0.0,
+        "upstream_by_path": {path: round(sum(values) / len(values), 3) for path, values in sorted(calls.items())},
+    }
+
+
+async def run_suite(
+    resources: list[str],
+    shapes: list[str],
+    cold_requests: int,
+    warm_requests: int,
+    concurrency: int,
+    repeats: int = 3,
+) -> dict[str, dict[str, Any]]:
+    """Runs every scenario `repeats` times and keeps the run with the lowest p50 (like `timeit`)."""
+
+    from app.main import app
+
+    async def _best(paths: list[str], total: int, workers: int, cold: bool) -> dict[str, Any]:
+        runs = []
+        for _ in range(max(repeats, 1)):
+            if not cold:
+                _clear_caches()
+                for path in paths:
+                    await client.get(path)
+            latencies, errors, elapsed, calls = await _drive(client, paths, total, workers, cold)
+            runs.append(summarize(latencies, errors, elapsed, calls))
+        return min(runs, key=lambda run: run["p50_ms"])
+
+    results: dict[str, dict[str, Any]] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60.0) as client:
+        for resource in resources:
+            for shape in shapes:
+                paths = paths_for(resource, shape)
+                results[f"{resource}/{shape}/cold"] = await _best(paths, cold_requests, 1, cold=True)
+                results[f"{resource}/{shape}/warm"] = await _best(paths, warm_requests, concurrency, cold=False)
+    _clear_caches()
+    return results
+
+
+def settings_mismatch(settings: dict[str, Any], baseline_meta: dict[str, Any]) -> list[str]:
+    """Run settings that differ from the ones the baseline was recorded with."""
+
+    return [
+        f"{name}={baseline_meta.get(name)!r} (atual {settings[name]!r})"
+        for name in RUN_SETTINGS
+        if baseline_meta.get(name) != settings[name]
+    ]
+
+
+def compare(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], tolerance: float) -> list[str]:
+    """Regressions against the baseline: slower p50, more SWAPI calls for a path or new errors.
+
+    SWAPI calls are compared per request path, only for paths present in
+    both runs, so the mix of paths does not move the figure.
+    """
+
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            continue
+        limit = base["p50_ms"] * (1 + tolerance)
+        if current["p50_ms"] > limit and current["p50_ms"] - base["p50_ms"] >= MIN_REGRESSION_MS:
+            regressions.append(f"{name}: p50 {base['p50_ms']:.1f}ms -> {current['p50_ms']:.1f}ms")
+        current_calls = current.get("upstream_by_path", {})
+        for path, base_calls in base.get("upstream_by_path", {}).items():
+            if path in current_calls and current_calls[path] > base_calls + 0.01:
+                regressions.append(f"{name}: SWAPI calls for {path} {base_calls} -> {current_calls[path]}")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {current['errors']}")
+    return regressions
+
+
+def _print_table(results: dict[str, dict[str, Any]], baseline: Optional[dict[str, dict[str, Any]]]) -> None:
+    print(f"{'scenario':<24}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'calls/req':>11}{'errors':>8}{'vs p50':>9}")
+    for name, row in results.items():
+        delta = ""
+        base = (baseline or {}).get(name)
+        if base and base["p50_ms"]:
+            delta = f"{(row['p50_ms'] / base['p50_ms'] - 1) * 100:+.0f}%"
+        print(
+            f"{name:<24}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+            f"{row['rps']:>9.1f}{row['upstream_per_request']:>11.2f}{row['errors']:>8}{delta:>9}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end endpoint benchmark against the local SWAPI stub")
+    parser.add_argument("--resources", default=",".join(RESOURCE_COUNTS), help="Recursos separados por vírgula")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="Formas de consulta: single, search, list, all")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latência injetada em cada chamada à SWAPI")
+    parser.add_argument("--latency-distribution", default="fixed")
+    parser.add_argument("--cold-requests", type=int, default=10)
+    parser.add_argument("--warm-requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3, help="Execuções por cenário; vale a de menor p50")
+    parser.add_argument("--output", help="Grava os resultados em JSON neste arquivo")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Aumento relativo de p50 aceito (0.5 = 50%%)")
+    args = parser.parse_args()
+    settings = {name: getattr(args, name) for name in RUN_SETTINGS}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            document = json.load(handle)
+        # Números de outra configuração (latência, volume, concorrência) não são comparáveis
+        mismatch = settings_mismatch(settings, document.get("meta", {}))
+        if mismatch:
+            parser.error("a baseline foi gravada com outras configurações: " + ", ".join(mismatch))
+        baseline = document["scenarios"]
+
+    stub = SwapiStub(StubConfig(latency_ms=args.latency_ms, latency_distribution=args.latency_distribution))
+    # O app lê a raiz da SWAPI ao ser importado: aponta para o stub antes do import
+    os.environ["SWAPI_BASE_URL"] = stub.base_url
+    os.environ.setdefault("SWAPI_WARMUP_ENABLED", "false")
+
+    with stub:
+        results = asyncio.run(run_suite(
+            [item.strip() for item in args.resources.split(",") if item.strip()],
+            [item.strip() for item in args.shapes.split(",") if item.strip()],
+            args.cold_requests,
+            args.warm_requests,
+            args.concurrency,
+            args.repeats,
+        ))
+
+    _print_table(results, baseline)
+
+    if args.output:
+        document = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                **settings,
+            },
+            "scenarios": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+            handle.write("\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Micro-benchmarks for the per-item hot loops behind `?all=true` responses.
+
+Isolates, for every resource, the three stages that run once per returned
+item, over the whole synthetic dataset (SWAPI cardinalities):
+
+- build: `_instance_payload`, a decoded and interned payload into its DTO;
+- hydrate: `_hydrate_<resource>_entity` with every relationship flag on,
+  against a warm payload cache, so there is no I/O. This is DTO
+  construction for the related items, executor dispatch and entity
+  construction;
+- serialize: `to_dict` of the hydrated entities.
+
+Wall time is the best of several `timeit` repeats per item. Allocations
+come from a separate `tracemalloc` pass, so tracing does not inflate the
+timings:
+- peak bytes: transient high-water mark per item;
+- retained bytes: bytes kept alive by the result, per item;
+- blocks: allocated blocks kept alive by the result, per item.
+
+Results can be written as JSON and compared against a stored baseline. The
+run exits with status 1 when a stage is slower than the tolerance allows
+or retains more memory.
+
+Usage:
+    python -m benchmarks.bench_hot_loops
+    python -m benchmarks.bench_hot_loops --resources films,people --stages hydrate
+    python -m benchmarks.bench_hot_loops --output results.json --baseline benchmarks/baselines/hot_loops.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.films.films_service import FilmsService
+from app.application.services.people.people_service import PeopleService
+from app.application.services.planets.planets_service import PlanetsService
+from app.application.services.species.species_service import SpeciesService
+from app.application.services.starships.starships_service import StarshipsService
+from app.application.services.vehicles.vehicles_service import VehiclesService
+from app.domain.keys.resource_key import cache_key
+from app.infrastructure.cache.interning import intern_payload
+from app.interfaces.query_params.films.films_query_params import FilmsQueryParams
+from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
+from app.interfaces.query_params.planets.planets_query_params import PlanetsQueryParams
+from app.interfaces.query_params.species.species_query_params import SpeciesQueryParams
+from app.interfaces.query_params.starships.starships_query_params import StarshipsQueryParams
+from app.interfaces.query_params.vehicles.vehicles_query_params import VehiclesQueryParams
+from benchmarks.payloads import build_dataset, decoded
+
+STAGES = ("build", "hydrate", "serialize")
+
+# Recurso -> (service, query params, corrotina de hidratação)
+RESOURCES = {
+    "films": (FilmsService(), FilmsQueryParams, "_hydrate_film_entity"),
+    "people": (PeopleService(), PeopleQueryParams, "_hydrate_person_entity"),
+    "planets": (PlanetsService(), PlanetsQueryParams, "_hydrate_planet_entity"),
+    "species": (SpeciesService(), SpeciesQueryParams, "_hydrate_species_entity"),
+    "starships": (StarshipsService(), StarshipsQueryParams, "_hydrate_starship_entity"),
+    "vehicles": (VehiclesService(), VehiclesQueryParams, "_hydrate_vehicle_entity"),
+}
+
+# Regressão de tempo: acima de (1 + tolerância) × baseline e pelo menos este tanto mais lento
+MIN_REGRESSION_US = 1.0
+# Alocações são quase determinísticas: aceita só esta folga relativa sobre o baseline
+ALLOCATION_TOLERANCE = 0.10
+
+
+def all_relations(query_params_class: type) -> Any:
+    """Query params with every relationship flag on, as the controllers do for `all=true`."""
+
+    query_params = query_params_class()
+    for item in dataclasses.fields(query_params):
+        if item.type == Optional[bool]:
+            setattr(query_params, item.name, True)
+    return query_params
+
+
+def warm_cache(dataset: dict[str, list[dict[str, Any]]]) -> None:
+    """Stores every payload as a SWAPI response would be cached: decoded and interned."""
+
+    BaseSwapiService._cache.clear()
+    for items in dataset.values():
+        for payload in items:
+            BaseSwapiService._cache.set(cache_key(payload["url"]), intern_payload(decoded(payload)))
+
+
+def _time_per_item(run: Callable[[], Any], items: int, repeats: int, min_seconds: float = 0.2) -> float:
+    # Calibra o número de execuções para cada medição durar pelo menos min_seconds
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_seconds / 0.2))
+    return min(timer.repeat(repeat=repeats, number=number)) / number / items
+
+
+def _allocations_per_item(run: Callable[[], Any], items: int) -> dict[str, float]:
+    run()  # aquece caches internos (chaves, strings internadas) que ficam de fora da conta
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before_bytes, _ = tracemalloc.get_traced_memory()
+        before_blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        result = run()
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks() - before_blocks
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "peak_bytes": round((peak - before_bytes) / items, 1),
+        "retained_bytes": round((current - before_bytes) / items, 1),
+        "blocks": round(blocks / items, 1),
+    }
+
+
+def run_suite(resources: list[str], stages: list[str], repeats: int) -> dict[str, dict[str, Any]]:
+    dataset = build_dataset()
+    warm_cache(dataset)
+    loop = asyncio.new_event_loop()
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for resource in resources:
+            service, query_params_class, hydrate_name = RESOURCES[resource]
+            hydrate = getattr(service, hydrate_name)
+            query_params = all_relations(query_params_class)
+            payloads = [intern_payload(decoded(payload)) for payload in dataset[resource]]
+            dtos = [service._instance_payload(payload) for payload in payloads]
+
+            async def _hydrate_all() -> list[Any]:
+                # Sequencial, como create_entities: um item por vez, relações em paralelo no executor
+                return [await hydrate(dto, query_params) for dto in dtos]
+
+            entities = loop.run_until_complete(_hydrate_all())
+            runs = {
+                "build": lambda: [service._instance_payload(payload) for payload in payloads],
+                "hydrate": lambda: loop.run_until_complete(_hydrate_all()),
+                "serialize": lambda: [entity.to_dict() for entity in entities],
+            }
+            for stage in stages:
+                run = runs[stage]
+                row = {"items": len(payloads), "us_per_item": round(_time_per_item(run, len(payloads), repeats) * 1e6, 3)}
+                row.update(_allocations_per_item(run, len(payloads)))
+                results[f"{resource}/{stage}"] = row
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+        BaseSwapiService._cache.clear()
+    return results
+
+
+def compare(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], tolerance: float) -> list[str]:
+    """Regressions against the baseline: slower per item, or more bytes retained per item."""
+
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            continue
+        limit = base["us_per_item"] * (1 + tolerance)
+        if current["us_per_item"] > limit and current["us_per_item"] - base["us_per_item"] >= MIN_REGRESSION_US:
+            regressions.append(f"{name}: {base['us_per_item']:.1f}us -> {current['us_per_item']:.1f}us per item")
+        allowed = base["retained_bytes"] * (1 + ALLOCATION_TOLERANCE) + 16
+        if current["retained_bytes"] > allowed:
+            regressions.append(
+                f"{name}: retained {base['retained_bytes']:.0f}B -> {current['retained_bytes']:.0f}B per item"
+            )
+    return regressions
+
+
+def _print_table(results: dict[str, dict[str, Any]], baseline: Optional[dict[str, dict[str, Any]]]) -> None:
+    print(f"{'stage':<22}{'items':>7}{'us/item':>11}{'peak B':>10}{'kept B':>10}{'blocks':>9}{'vs time':>9}")
+    for name, row in results.items():
+        delta = ""
+        base = (baseline or {}).get(name)
+        if base and base["us_per_item"]:
+            delta = f"{(row['us_per_item'] / base['us_per_item'] - 1) * 100:+.0f}%"
+        print(
+            f"{name:<22}{row['items']:>7}{row['us_per_item']:>11.1f}{row['peak_bytes']:>10.0f}"
+            f"{row['retained_bytes']:>10.0f}{row['blocks']:>9.1f}{delta:>9}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for DTO build, hydration and serialization")
+    parser.add_argument("--resources", default=",".join(RESOURCES), help="Recursos separados por vírgula")
+    parser.add_argument("--stages", default=",".join(STAGES), help="Etapas: build, hydrate, serialize")
+    parser.add_argument("--repeats", type=int, default=5, help="Repetições do timeit; vale a mais rápida")
+    parser.add_argument("--output", help="Grava os resultados em JSON neste arquivo")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Aumento relativo de tempo aceito (0.3 = 30%%)")
+    args = parser.parse_args()
+
+    results = run_suite(
+        [item.strip() for item in args.resources.split(",") if item.strip()],
+        [item.strip() for item in args.stages.split(",") if item.strip()],
+        args.repeats,
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)["scenarios"]
+    _print_table(results, baseline)
+
+    if args.output:
+        document = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "repeats": args.repeats,
+            },
+            "scenarios": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+            handle.write("\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Memory benchmark for DTOs, entities and a hydrated `?all=true` film.
+
+Compares the slot-based DTOs/entities and ingestion-time interning against
+an equivalent `__dict__`-based layout that keeps every decoded string and
+copies relationship lists, as the services did before.
+
+Usage:
+    python -m benchmarks.bench_memory
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import random
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from app.application.services.films.films_service import FilmsService
+from app.application.services.people.people_service import PeopleService
+from app.application.services.planets.planets_service import PlanetsService
+from app.application.services.species.species_service import SpeciesService
+from app.application.services.starships.starships_service import StarshipsService
+from app.application.services.vehicles.vehicles_service import VehiclesService
+from app.domain.entities.films.films_entity import FilmEntity
+from app.domain.keys.resource_key import ResourceRef, as_key
+from app.infrastructure.cache.interning import intern_payload
+from benchmarks.payloads import build_dataset, decoded
+
+SERVICES = {
+    "films": FilmsService(),
+    "people": PeopleService(),
+    "planets": PlanetsService(),
+    "species": SpeciesService(),
+    "starships": StarshipsService(),
+    "vehicles": VehiclesService(),
+}
+
+FILM_RELATIONS = ("characters", "planets", "starships", "vehicles", "species")
+RELATION_RESOURCE = {
+    "characters": "people",
+    "planets": "planets",
+    "starships": "starships",
+    "vehicles": "vehicles",
+    "species": "species",
+}
+
+
+@functools.cache
+def _legacy_dto_class(dto_class: type) -> type:
+    """Rebuilds `dto_class` as a plain dataclass with a per-instance `__dict__`."""
+
+    return dataclasses.make_dataclass(
+        f"Legacy{dto_class.__name__}",
+        [(item.name, Any, dataclasses.field(default=None)) for item in dataclasses.fields(dto_class)],
+    )
+
+
+def _legacy_dto(service: Any, payload: dict[str, Any]) -> Any:
+    dto = service._instance_payload(payload)
+    legacy_class = _legacy_dto_class(type(dto))
+    return legacy_class(**{item.name: payload.get(item.name) for item in dataclasses.fields(dto)})
+
+
+def _shallow_size(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def _retained(builder: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        graph = builder()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del graph
+    return current
+
+
+def _hydrated_film(dataset: dict[str, list[dict[str, Any]]], legacy: bool) -> Any:
+    def _payload(resource: str, item_url: ResourceRef) -> dict[str, Any]:
+        item_id = as_key(item_url).id
+        payload = decoded(dataset[resource][item_id - 1])
+        return payload if legacy else intern_payload(payload)
+
+    def _dto(resource: str, payload: dict[str, Any]) -> Any:
+        service = SERVICES[resource]
+        return _legacy_dto(service, payload) if legacy else service._instance_payload(payload)
+
+    film_payload = _payload("films", dataset["films"][0]["url"])
+    film = _dto("films", film_payload)
+    related = {
+        relation: [_dto(RELATION_RESOURCE[relation], _payload(RELATION_RESOURCE[relation], item_url))
+                   for item_url in getattr(film, relation)]
+        for relation in FILM_RELATIONS
+    }
+
+    fields = {item.name: getattr(film, item.name) for item in dataclasses.fields(film)}
+    if legacy:
+        fields.update({relation: list(items) for relation, items in related.items()})
+        return SimpleNamespace(**fields)
+
+    fields.update(related)
+    return FilmEntity(**fields)
+
+
+def main() -> None:
+    dataset = build_dataset()
+    rng = random.Random(7)
+
+    print("Per-object size (bytes, object + instance dict)")
+    print(f"{'dto':<14}{'legacy':>10}{'slots':>10}{'saved':>10}")
+    for resource, service in SERVICES.items():
+        payload = rng.choice(dataset[resource])
+        legacy = _shallow_size(_legacy_dto(service, payload))
+        compact = _shallow_size(service._instance_payload(payload))
+        print(f"{resource:<14}{legacy:>10}{compact:>10}{legacy - compact:>10}")
+
+    # Chaves `(recurso, id)` e strings internadas são compartilhadas pelo processo; medir em regime
+    _hydrated_film(dataset, legacy=False)
+    legacy_film = _retained(lambda: _hydrated_film(dataset, legacy=True))
+    compact_film = _retained(lambda: _hydrated_film(dataset, legacy=False))
+    print()
+    print("Hydrated `?all=true` film (bytes retained, payloads included)")
+    print(f"legacy:  {legacy_film:>10}")
+    print(f"compact: {compact_film:>10}")
+    print(f"saved:   {legacy_film - compact_film:>10} ({(1 - compact_film / legacy_film) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
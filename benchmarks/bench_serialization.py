@@ -0,0 +1,117 @@
+"""CPU benchmark for entity `to_dict` serialization.
+
+Compares the shared precompiled serializers against the previous per-entity
+`to_dict`, which tried `dataclasses.asdict` on every related item and fell
+back on the raised exception for plain URL strings.
+
+Usage:
+    python -m benchmarks.bench_serialization
+"""
+
+from __future__ import annotations
+
+import timeit
+from dataclasses import asdict
+from typing import Any
+
+from app.application.services.films.films_service import FilmsService
+from app.application.services.people.people_service import PeopleService
+from app.application.services.planets.planets_service import PlanetsService
+from app.application.services.species.species_service import SpeciesService
+from app.application.services.starships.starships_service import StarshipsService
+from app.application.services.vehicles.vehicles_service import VehiclesService
+from app.domain.entities.films.films_entity import FilmEntity
+from app.domain.entities.people.people_entity import PeopleEntity
+from benchmarks.payloads import build_dataset
+
+RELATION_SERVICES = {
+    "characters": ("people", PeopleService()),
+    "planets": ("planets", PlanetsService()),
+    "starships": ("starships", StarshipsService()),
+    "vehicles": ("vehicles", VehiclesService()),
+    "species": ("species", SpeciesService()),
+}
+RELATION_FIELDS = {"characters", "planets", "starships", "vehicles", "species", "films", "homeworld"}
+
+
+def legacy_to_dict(entity: Any) -> dict[str, Any]:
+    def _asdict_or_value(value: object) -> object:
+        try:
+            return asdict(value)
+        except Exception:
+            return value
+
+    result = {}
+    for name in entity.__slots__:
+        value = getattr(entity, name)
+        if isinstance(value, list):
+            value = [_asdict_or_value(item) for item in value]
+        elif name in RELATION_FIELDS:
+            value = _asdict_or_value(value) if value else None
+        result[name] = value
+    return result
+
+
+def _item(dataset: dict[str, list[dict[str, Any]]], resource: str, item_url: str) -> dict[str, Any]:
+    return dataset[resource][int(item_url.rstrip("/").rsplit("/", 1)[-1]) - 1]
+
+
+def hydrated_film(dataset: dict[str, list[dict[str, Any]]]) -> FilmEntity:
+    film = FilmsService()._instance_payload(dataset["films"][0])
+    related = {
+        relation: [service._instance_payload(_item(dataset, resource, item_url))
+                   for item_url in getattr(film, relation)]
+        for relation, (resource, service) in RELATION_SERVICES.items()
+    }
+    return FilmEntity(
+        title=film.title,
+        episode_id=film.episode_id,
+        opening_crawl=film.opening_crawl,
+        director=film.director,
+        producer=film.producer,
+        release_date=film.release_date,
+        url=film.url,
+        created=film.created,
+        edited=film.edited,
+        **related,
+    )
+
+
+def people_page(dataset: dict[str, list[dict[str, Any]]]) -> list[PeopleEntity]:
+    service = PeopleService()
+    page = []
+    for payload in dataset["people"][:10]:
+        person = service._instance_payload(payload)
+        page.append(PeopleEntity(**{name: getattr(person, name) for name in PeopleEntity.__slots__}))
+    return page
+
+
+def _measure(label: str, legacy: Any, current: Any, number: int) -> None:
+    legacy_seconds = min(timeit.repeat(legacy, number=number, repeat=5)) / number
+    current_seconds = min(timeit.repeat(current, number=number, repeat=5)) / number
+    print(
+        f"{label:<28}{legacy_seconds * 1e6:>12.1f}{current_seconds * 1e6:>12.1f}"
+        f"{legacy_seconds / current_seconds:>9.1f}x"
+    )
+
+
+def main() -> None:
+    dataset = build_dataset()
+    film = hydrated_film(dataset)
+    page = people_page(dataset)
+
+    assert legacy_to_dict(film) == film.to_dict()
+    assert [legacy_to_dict(person) for person in page] == [person.to_dict() for person in page]
+
+    print(f"{'shape':<28}{'legacy us':>12}{'current us':>12}{'speedup':>10}")
+    _measure("film ?all=true", lambda: legacy_to_dict(film), film.to_dict, 200)
+    _measure(
+        "people page (URL lists)",
+        lambda: [legacy_to_dict(person) for person in page],
+        lambda: [person.to_dict() for person in page],
+        500,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Upstream-call benchmark for unexpanded `/people/` and `/species/` pages.
+
+Compares the previous behaviour, where every person and species always
+resolved its `homeworld` with a SWAPI call, against the opt-in
+`homeworld=true` flag. Each scenario starts from a cold cache and a fake
+SWAPI that answers from the synthetic dataset after a fixed latency.
+
+Usage:
+    python -m benchmarks.bench_upstream_calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable
+from unittest.mock import Mock, patch
+
+from app.application.services.base_service import BaseSwapiService
+from app.application.services.people.people_service import PeopleService
+from app.application.services.species.species_service import SpeciesService
+from app.domain.numeric.numeric_projection import numeric_projection
+from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
+from app.interfaces.query_params.species.species_query_params import SpeciesQueryParams
+from benchmarks.payloads import BASE_URL, build_dataset, decoded
+
+PAGE_SIZE = 10
+LATENCY_SECONDS = 0.02
+
+
+def fake_swapi(dataset: dict[str, list[dict[str, Any]]], calls: list[str]) -> Callable[..., Mock]:
+    def _get(url: str, params: dict[str, Any] | None = None, timeout: float | None = None) -> Mock:
+        calls.append(url)
+        time.sleep(LATENCY_SECONDS)
+        resource, _, item_id = url[len(BASE_URL):].strip("/").partition("/")
+        items = dataset[resource]
+        if item_id:
+            body = decoded(items[int(item_id) - 1])
+        else:
+            page = int((params or {}).get("page", 1))
+            results = items[(page - 1) * PAGE_SIZE: page * PAGE_SIZE]
+            has_next = page * PAGE_SIZE < len(items)
+            body = {
+                "count": len(items),
+                "next": f"{BASE_URL}{resource}/?page={page + 1}" if has_next else None,
+                "results": [decoded(item) for item in results],
+            }
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = body
+        return response
+
+    return _get
+
+
+def _cold() -> None:
+    BaseSwapiService._cache.clear()
+    BaseSwapiService._hot_keys.clear()
+    BaseSwapiService._co_access.clear()
+    numeric_projection.clear()
+
+
+def _measure(dataset: dict[str, list[dict[str, Any]]], service: BaseSwapiService, url: str, query_params: Any) -> tuple[int, float]:
+    _cold()
+    calls: list[str] = []
+    with patch("requests.get", side_effect=fake_swapi(dataset, calls)):
+        started = time.perf_counter()
+        entities = asyncio.run(service.create_entities(url, query_params))
+        elapsed = time.perf_counter() - started
+    assert len(entities) == PAGE_SIZE
+    return len(calls), elapsed
+
+
+def main() -> None:
+    dataset = build_dataset()
+    scenarios = [
+        ("/people/", PeopleService(), f"{BASE_URL}people/", PeopleQueryParams),
+        ("/species/", SpeciesService(), f"{BASE_URL}species/", SpeciesQueryParams),
+    ]
+
+    print(f"{'query':<12}{'before calls':>14}{'after calls':>13}{'before ms':>11}{'after ms':>10}")
+    for label, service, url, params_type in scenarios:
+        # Antes: o planeta natal era sempre buscado, o que equivale a `homeworld=true` hoje
+        before_calls, before_seconds = _measure(dataset, service, url, params_type(homeworld=True))
+        after_calls, after_seconds = _measure(dataset, service, url, params_type())
+        print(
+            f"{label:<12}{before_calls:>14}{after_calls:>13}"
+            f"{before_seconds * 1e3:>11.1f}{after_seconds * 1e3:>10.1f}"
+        )
+    _cold()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Deterministic synthetic SWAPI payloads with realistic cardinalities."""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+BASE_URL = "https://swapi.dev/api/"
+
+# Cardinalidades do dataset real da SWAPI
+RESOURCE_COUNTS = {
+    "films": 6,
+    "people": 82,
+    "planets": 60,
+    "species": 37,
+    "starships": 36,
+    "vehicles": 39,
+}
+
+COLORS = ["blue", "brown", "black", "green", "red", "yellow", "white", "grey", "hazel", "n/a"]
+CLIMATES = ["arid", "temperate", "tropical", "frozen", "murky", "temperate, tropical", "unknown"]
+TERRAINS = ["desert", "grasslands, mountains", "jungle, rainforests", "tundra, ice caves", "swamp", "ocean"]
+GENDERS = ["male", "female", "n/a", "hermaphrodite"]
+CLASSIFICATIONS = ["mammal", "artificial", "sentient", "gastropod", "reptile", "amphibian"]
+STARSHIP_CLASSES = ["Starfighter", "Light freighter", "Star Destroyer", "Corvette", "Transport"]
+VEHICLE_CLASSES = ["wheeled", "repulsorcraft", "walker", "starfighter", "airspeeder"]
+TIMESTAMP = "2014-12-10T14:23:31.880000Z"
+
+
+def url(resource: str, item_id: int) -> str:
+    return f"{BASE_URL}{resource}/{item_id}/"
+
+
+def _sample(rng: random.Random, resource: str, low: int, high: int) -> list[str]:
+    total = RESOURCE_COUNTS[resource]
+    size = min(total, rng.randint(low, high))
+    return [url(resource, item_id) for item_id in sorted(rng.sample(range(1, total + 1), size))]
+
+
+def _number(rng: random.Random, low: int, high: int, unknown_ratio: float = 0.1) -> str:
+    if rng.random() < unknown_ratio:
+        return "unknown"
+    return str(rng.randint(low, high))
+
+
+def film_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    return {
+        "title": f"Film {item_id}",
+        "episode_id": item_id,
+        "opening_crawl": " ".join(["It is a period of civil war."] * 20),
+        "director": "George Lucas",
+        "producer": "Gary Kurtz, Rick McCallum",
+        "release_date": f"{1976 + item_id * 3}-05-25",
+        "characters": _sample(rng, "people", 18, 40),
+        "planets": _sample(rng, "planets", 3, 13),
+        "starships": _sample(rng, "starships", 8, 15),
+        "vehicles": _sample(rng, "vehicles", 4, 20),
+        "species": _sample(rng, "species", 5, 20),
+        "url": url("films", item_id),
+        "created": TIMESTAMP,
+        "edited": TIMESTAMP,
+    }
+
+
+def person_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    return {
+        "name": f"Person {item_id}",
+        "height": _number(rng, 66, 264),
+        "mass": _number(rng, 15, 1358),
+        "hair_color": rng.choice(COLORS),
+        "skin_color": rng.choice(COLORS),
+        "eye_color": rng.choice(COLORS),
+        "birth_year": f"{rng.randint(8, 900)}BBY",
+        "gender": rng.choice(GENDERS),
+        "homeworld": url("planets", rng.randint(1, RESOURCE_COUNTS["planets"])),
+        "films": _sample(rng, "films", 1, 6),
+        "species": _sample(rng, "species", 0, 1),
+        "vehicles": _sample(rng, "vehicles", 0, 2),
+        "starships": _sample(rng, "starships", 0, 3),
+        "url": url("people", item_id),
+        "created": TIMESTAMP,
+        "edited": TIMESTAMP,
+    }
+
+
+def planet_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    return {
+        "name": f"Planet {item_id}",
+        "rotation_period": _number(rng, 12, 48),
+        "orbital_period": _number(rng, 180, 5000),
+        "diameter": _number(rng, 0, 118000),
+        "climate": rng.choice(CLIMATES),
+        "gravity": "1 standard",
+        "terrain": rng.choice(TERRAINS),
+        "surface_water": _number(rng, 0, 100),
+        "population": _number(rng, 1000, 1000000000000, unknown_ratio=0.3),
+        "residents": _sample(rng, "people", 0, 10),
+        "films": _sample(rng, "films", 0, 5),
+        "url": url("planets", item_id),
+        "created": TIMESTAMP,
+        "edited": TIMESTAMP,
+    }
+
+
+def species_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    return {
+        "name": f"Species {item_id}",
+        "classification": rng.choice(CLASSIFICATIONS),
+        "designation": rng.choice(["sentient", "reptilian"]),
+        "average_height": _number(rng, 40, 300),
+        "skin_colors": ", ".join(rng.sample(COLORS, 3)),
+        "hair_colors": ", ".join(rng.sample(COLORS, 2)),
+        "eye_colors": ", ".join(rng.sample(COLORS, 2)),
+        "average_lifespan": _number(rng, 20, 1000, unknown_ratio=0.4),
+        "homeworld": url("planets", rng.randint(1, RESOURCE_COUNTS["planets"])),
+        "language": f"Language {item_id}",
+        "people": _sample(rng, "people", 1, 8),
+        "films": _sample(rng, "films", 1, 5),
+        "url": url("species", item_id),
+        "created": TIMESTAMP,
+        "edited": TIMESTAMP,
+    }
+
+
+def _craft_payload(rng: random.Random, resource: str, item_id: int) -> dict[str, Any]:
+    return {
+        "name": f"{resource.title()} {item_id}",
+        "model": f"Model {item_id}",
+        "manufacturer": "Corellian Engineering Corporation",
+        "cost_in_credits": _number(rng, 10000, 1000000000, unknown_ratio=0.25),
+        "length": f"{rng.randint(5, 20000)}.{rng.randint(0, 9)}",
+        "max_atmosphering_speed": _number(rng, 30, 1500),
+        "crew": _number(rng, 1, 50000),
+        "passengers": _number(rng, 0, 80000),
+        "cargo_capacity": _number(rng, 0, 1000000000),
+        "consumables": f"{rng.randint(1, 6)} {rng.choice(['days', 'weeks', 'months', 'years'])}",
+        "pilots": _sample(rng, "people", 0, 4),
+        "films": _sample(rng, "films", 1, 3),
+        "url": url(resource, item_id),
+        "created": TIMESTAMP,
+        "edited": TIMESTAMP,
+    }
+
+
+def starship_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    payload = _craft_payload(rng, "starships", item_id)
+    payload["hyperdrive_rating"] = f"{rng.randint(0, 6)}.0"
+    payload["MGLT"] = _number(rng, 10, 120)
+    payload["starship_class"] = rng.choice(STARSHIP_CLASSES)
+    return payload
+
+
+def vehicle_payload(rng: random.Random, item_id: int) -> dict[str, Any]:
+    payload = _craft_payload(rng, "vehicles", item_id)
+    payload["vehicle_class"] = rng.choice(VEHICLE_CLASSES)
+    return payload
+
+
+BUILDERS = {
+    "films": film_payload,
+    "people": person_payload,
+    "planets": planet_payload,
+    "species": species_payload,
+    "starships": starship_payload,
+    "vehicles": vehicle_payload,
+}
+
+
+def build_dataset(seed: int = 42) -> dict[str, list[dict[str, Any]]]:
+    """Builds every resource of the synthetic universe, keyed by resource name."""
+
+    rng = random.Random(seed)
+    return {
+        resource: [BUILDERS[resource](rng, item_id) for item_id in range(1, total + 1)]
+        for resource, total in RESOURCE_COUNTS.items()
+    }
+
+
+def decoded(payload: dict[str, Any]) -> dict[str, Any]:
+    """Round-trips a payload through JSON, as if freshly received from SWAPI."""
+
+    return json.loads(json.dumps(payload))
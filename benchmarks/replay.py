@@ -0,0 +1,358 @@
+"""Replays recorded request logs against the gateway and reports how it held up.
+
+Reads JSON lines, one request per line. Log prefixes before the first `{`
+are ignored, so structured log files can be used as they are. Each entry
+needs a target, given by one of:
+
+- `path`, with or without a query string: `{"path": "/people/?id=1", "timestamp": 1700000000.5}`
+- `url`, a full URL; only the path and query are used
+- `route` plus `params`, as written by the slow-request log
+  (`SWAPI_SLOW_REQUEST_MS=0 SWAPI_SLOW_LOG_TO_LOGS=true` records every request)
+
+`timestamp` (epoch seconds or ISO 8601), `method` and `body` are optional.
+
+Rates:
+- `--mode original` keeps the recorded gaps between requests;
+- `--mode accelerated --speed 10` divides the gaps by 10;
+- `--mode concurrency --concurrency 16` ignores timing and keeps 16
+  requests in flight.
+
+Every request asks for the debug profile (`X-Debug-Profile`), so cache
+hits and SWAPI calls are read from the responses. That works in-process
+and against a remote instance alike. The report gives latency
+percentiles, error rates by status and a per-window timeline of
+throughput, latency and cache hit ratio.
+
+Without `--url`, the real app runs in-process against the local SWAPI
+stub. Settings such as the cache TTL are read from the environment, as in
+production.
+
+Usage:
+    python -m benchmarks.replay --generate traffic.jsonl --count 2000 --rps 40
+    python -m benchmarks.replay traffic.jsonl --mode accelerated --speed 5 --output replay.json
+    python -m benchmarks.replay traffic.jsonl --mode concurrency --concurrency 32 --url http://127.0.0.1:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Optional
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+
+from benchmarks.bench_endpoints import percentile
+from benchmarks.payloads import RESOURCE_COUNTS
+from benchmarks.swapi_stub import StubConfig, SwapiStub
+
+MODES = ("original", "accelerated", "concurrency")
+PROFILE_HEADER = "x-request-profile"
+
+
+@dataclasses.dataclass
+class RecordedRequest:
+    offset: float
+    path: str
+    method: str = "GET"
+    body: Optional[Any] = None
+
+
+@dataclasses.dataclass
+class ReplayResult:
+    sent_at: float
+    latency: float
+    status: int
+    cache_hits: int = 0
+    cache_misses: int = 0
+    upstream_calls: int = 0
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _query_value(value: Any) -> str:
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+def _target(entry: dict[str, Any]) -> Optional[str]:
+    if isinstance(entry.get("path"), str):
+        return entry["path"]
+    if isinstance(entry.get("url"), str):
+        parts = urlsplit(entry["url"])
+        return parts.path + (f"?{parts.query}" if parts.query else "")
+    if isinstance(entry.get("route"), str) and "{" not in entry["route"]:
+        params = entry.get("params") or {}
+        query = urlencode({name: _query_value(value) for name, value in params.items()})
+        return entry["route"] + (f"?{query}" if query else "")
+    return None
+
+
+def load_log(path: str) -> tuple[list[RecordedRequest], int]:
+    """Recorded requests sorted by time (offsets from the first one) and the number of skipped lines."""
+
+    entries: list[tuple[Optional[float], int, dict[str, Any], str]] = []
+    skipped = 0
+    with open(path, encoding="utf-8") as handle:
+        for index, line in enumerate(handle):
+            start = line.find("{")
+            if start < 0:
+                skipped += bool(line.strip())
+                continue
+            try:
+                entry = json.loads(line[start:])
+            except ValueError:
+                skipped += 1
+                continue
+            target = _target(entry) if isinstance(entry, dict) else None
+            if target is None:
+                skipped += 1
+                continue
+            entries.append((_timestamp(entry.get("timestamp", entry.get("time"))), index, entry, target))
+
+    # Sem horário registrado, a linha herda o horário da anterior (gap zero)
+    timed = [timestamp for timestamp, _, _, _ in entries if timestamp is not None]
+    first = min(timed) if timed else 0.0
+    requests, last = [], first
+    for timestamp, _, entry, target in sorted(entries, key=lambda item: (item[0] is None, item[0] or 0.0, item[1])):
+        last = timestamp if timestamp is not None else last
+        requests.append(RecordedRequest(last - first, target, str(entry.get("method") or "GET").upper(), entry.get("body")))
+    return requests, skipped
+
+
+def generate_log(path: str, count: int, rps: float, seed: int = 42) -> None:
+    """Writes a synthetic traffic log: Zipf-skewed ids and a production-like mix of query shapes."""
+
+    rng = random.Random(seed)
+    shapes = [("single", 0.55), ("all", 0.15), ("search", 0.15), ("list", 0.10), ("expand", 0.05)]
+    resources = list(RESOURCE_COUNTS)
+    started = time.time()
+    offset = 0.0
+    with open(path, "w", encoding="utf-8") as handle:
+        for _ in range(count):
+            offset += rng.expovariate(rps)
+            resource = rng.choice(resources)
+            # Poucos itens concentram a maior parte do tráfego, como em produção
+            item_id = min(int(rng.paretovariate(1.2)), RESOURCE_COUNTS[resource])
+            shape = rng.choices([name for name, _ in shapes], [weight for _, weight in shapes])[0]
+            if shape == "single":
+                target = f"/{resource}/?id={item_id}"
+            elif shape == "all":
+                target = f"/{resource}/?id={item_id}&all=true"
+            elif shape == "search":
+                field = "title" if resource == "films" else "name"
+                target = f"/{resource}/?{field}={rng.choice('aeiou')}{rng.randint(0, 9)}"
+            elif shape == "expand" and resource == "people":
+                target = f"/people/?id={item_id}&expand=homeworld.residents"
+            else:
+                target = f"/{resource}/"
+            handle.write(json.dumps({"timestamp": round(started + offset, 6), "path": target}) + "\n")
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    requests: list[RecordedRequest],
+    mode: str,
+    speed: float = 1.0,
+    concurrency: int = 8,
+    max_inflight: int = 512,
+) -> tuple[list[ReplayResult], float]:
+    results: list[ReplayResult] = []
+    started = time.perf_counter()
+
+    async def _send(request: RecordedRequest) -> None:
+        sent_at = time.perf_counter() - started
+        begin = time.perf_counter()
+        try:
+            response = await client.request(request.method, request.path, json=request.body, headers={"X-Debug-Profile": "1"})
+            status = response.status_code
+            profile = json.loads(response.headers.get(PROFILE_HEADER, "{}"))
+        except httpx.HTTPError:
+            status, profile = 0, {}
+        latency = time.perf_counter() - begin
+        cache = profile.get("cache", {})
+        results.append(ReplayResult(
+            sent_at, latency, status,
+            cache.get("hits", 0), cache.get("misses", 0), profile.get("upstream", {}).get("calls", 0),
+        ))
+
+    if mode == "concurrency":
+        cursor = iter(requests)
+
+        async def _worker() -> None:
+            for request in cursor:
+                await _send(request)
+
+        await asyncio.gather(*[_worker() for _ in range(max(concurrency, 1))])
+        return results, time.perf_counter() - started
+
+    # Malha aberta: cada requisição sai no seu horário, mesmo que as anteriores ainda não tenham voltado
+    factor = 1.0 if mode == "original" else max(speed, 1e-6)
+    limit = asyncio.Semaphore(max_inflight)
+    tasks = []
+
+    async def _limited(request: RecordedRequest) -> None:
+        async with limit:
+            await _send(request)
+
+    for request in requests:
+        delay = request.offset / factor - (time.perf_counter() - started)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_limited(request)))
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - started
+
+
+def _latency_summary(latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(percentile(ordered, 0.50) * 1e3, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1e3, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1e3, 3),
+        "max_ms": round((ordered[-1] if ordered else 0.0) * 1e3, 3),
+    }
+
+
+def _hit_ratio(hits: int, misses: int) -> Optional[float]:
+    return round(hits / (hits + misses), 4) if hits + misses else None
+
+
+def build_report(results: list[ReplayResult], elapsed: float, window: float) -> dict[str, Any]:
+    """Overall latency, errors and cache behaviour plus a per-window timeline."""
+
+    statuses = Counter(result.status for result in results)
+    errors = sum(count for status, count in statuses.items() if status == 0 or status >= 400)
+    hits = sum(result.cache_hits for result in results)
+    misses = sum(result.cache_misses for result in results)
+
+    buckets: dict[int, list[ReplayResult]] = {}
+    for result in results:
+        buckets.setdefault(int(result.sent_at // window), []).append(result)
+    timeline = []
+    for index in sorted(buckets):
+        bucket = buckets[index]
+        timeline.append({
+            "t": round(index * window, 3),
+            "requests": len(bucket),
+            "errors": sum(1 for result in bucket if result.status == 0 or result.status >= 400),
+            **_latency_summary([result.latency for result in bucket]),
+            "cache_hit_ratio": _hit_ratio(sum(r.cache_hits for r in bucket), sum(r.cache_misses for r in bucket)),
+            "upstream_calls": sum(result.upstream_calls for result in bucket),
+        })
+
+    return {
+        "requests": len(results),
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(results) / elapsed, 2) if elapsed else 0.0,
+        "errors": errors,
+        "error_rate": round(errors / len(results), 4) if results else 0.0,
+        "by_status": {str(status): count for status, count in sorted(statuses.items())},
+        **_latency_summary([result.latency for result in results]),
+        "cache_hit_ratio": _hit_ratio(hits, misses),
+        "upstream_calls": sum(result.upstream_calls for result in results),
+        "timeline": timeline,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"{report['requests']} requests in {report['duration_s']:.1f}s ({report['rps']:.1f} req/s), "
+        f"errors {report['errors']} ({report['error_rate'] * 100:.2f}%), statuses {report['by_status']}"
+    )
+    print(
+        f"latency p50 {report['p50_ms']:.1f}ms  p95 {report['p95_ms']:.1f}ms  p99 {report['p99_ms']:.1f}ms  "
+        f"max {report['max_ms']:.1f}ms  cache hit ratio {report['cache_hit_ratio']}  SWAPI calls {report['upstream_calls']}"
+    )
+    print()
+    print(f"{'t (s)':>8}{'reqs':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'hit ratio':>11}{'SWAPI':>7}")
+    for row in report["timeline"]:
+        ratio = "-" if row["cache_hit_ratio"] is None else f"{row['cache_hit_ratio']:.2f}"
+        print(
+            f"{row['t']:>8.1f}{row['requests']:>7}{row['errors']:>8}{row['p50_ms']:>9.1f}"
+            f"{row['p95_ms']:>9.1f}{ratio:>11}{row['upstream_calls']:>7}"
+        )
+
+
+async def _run(args: argparse.Namespace, requests: list[RecordedRequest]) -> tuple[list[ReplayResult], float]:
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout) as client:
+            return await replay(client, requests, args.mode, args.speed, args.concurrency)
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=args.timeout) as client:
+        return await replay(client, requests, args.mode, args.speed, args.concurrency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replays recorded traffic against the gateway")
+    parser.add_argument("log", nargs="?", help="Arquivo JSON lines com as requisições gravadas")
+    parser.add_argument("--mode", choices=MODES, default="original")
+    parser.add_argument("--speed", type=float, default=10.0, help="Aceleração no modo accelerated")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requisições simultâneas no modo concurrency")
+    parser.add_argument("--limit", type=int, help="Reproduz apenas as N primeiras requisições")
+    parser.add_argument("--window", type=float, default=1.0, help="Largura das janelas da linha do tempo (s)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--url", help="Instância remota; sem isso o app roda no processo contra o stub")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latência do stub da SWAPI")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Taxa de erros 500 do stub")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Taxa de respostas 429 do stub")
+    parser.add_argument("--output", help="Grava o relatório em JSON neste arquivo")
+    parser.add_argument("--generate", metavar="PATH", help="Gera um log sintético neste arquivo e encerra")
+    parser.add_argument("--count", type=int, default=1000, help="Requisições do log sintético")
+    parser.add_argument("--rps", type=float, default=20.0, help="Taxa média do log sintético")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate_log(args.generate, args.count, args.rps, args.seed)
+        print(f"{args.count} requisições gravadas em {args.generate}")
+        return
+    if not args.log:
+        parser.error("informe o arquivo de log ou --generate")
+
+    requests, skipped = load_log(args.log)
+    if args.limit:
+        requests = requests[:args.limit]
+    if skipped:
+        print(f"{skipped} linhas ignoradas (sem JSON ou sem rota)", file=sys.stderr)
+
+    if args.url:
+        results, elapsed = asyncio.run(_run(args, requests))
+    else:
+        stub = SwapiStub(StubConfig(
+            seed=args.seed, latency_ms=args.latency_ms, error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+        ))
+        # O app lê a raiz da SWAPI ao ser importado: aponta para o stub antes do import
+        os.environ["SWAPI_BASE_URL"] = stub.base_url
+        with stub:
+            results, elapsed = asyncio.run(_run(args, requests))
+
+    report = build_report(results, elapsed, args.window)
+    _print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Long-running soak test for the memory footprint of the gateway caches.
+
+Runs the real app in-process (through `httpx.ASGITransport`) for a long
+synthetic workload with high key cardinality: most requests are searches
+for random strings, so nearly every one is a new cache key, mixed with
+single-id and `all=true` lookups. SWAPI is served by the local stub in a
+separate process, so its own memory stays out of the measurements.
+
+At a fixed interval it samples:
+- the process RSS and the blocks held by the Python allocator;
+- the entries of every watched `MemoryCache`;
+- object counts for the most common types (`gc.get_objects`).
+
+Samples before the warm-up fraction are ignored (caches still filling).
+The steady part is split in halves. Memory has plateaued when the mean RSS
+of the second half is within the tolerance of the first. With a bounded
+cache (the default) the run exits with status 1 when memory does not
+plateau or a cache holds more entries than its limit. With
+`--cache-max-entries 0` the growth is only reported.
+
+Usage:
+    python -m benchmarks.soak_cache
+    python -m benchmarks.soak_cache --duration 3600 --cache-max-entries 5000 --output soak.json
+    python -m benchmarks.soak_cache --duration 120 --cache-max-entries 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import resource
+import socket
+import string
+import subprocess
+import sys
+import time
+from collections import Counter
+from statistics import mean
+from typing import Any
+
+import httpx
+
+from benchmarks.payloads import RESOURCE_COUNTS
+
+SEARCH_FIELDS = {resource: "title" if resource == "films" else "name" for resource in RESOURCE_COUNTS}
+# Tipos acompanhados por amostra: os mais numerosos em cada coleta
+TOP_TYPES = 12
+
+
+def rss_bytes() -> int:
+    """Current resident set size; falls back to the peak where /proc is unavailable."""
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def object_counts(limit: int = TOP_TYPES) -> dict[str, int]:
+    counts = Counter(type(item).__name__ for item in gc.get_objects())
+    return dict(counts.most_common(limit))
+
+
+def random_path(rng: random.Random, search_ratio: float) -> str:
+    """One request of the workload: mostly random searches (new keys), the rest id lookups."""
+
+    resource_name = rng.choice(list(RESOURCE_COUNTS))
+    roll = rng.random()
+    if roll < search_ratio:
+        term = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        return f"/{resource_name}/?{SEARCH_FIELDS[resource_name]}={term}"
+    item_id = rng.randint(1, RESOURCE_COUNTS[resource_name])
+    if roll < search_ratio + (1 - search_ratio) * 0.8:
+        return f"/{resource_name}/?id={item_id}"
+    return f"/{resource_name}/?id={item_id}&all=true"
+
+
+def plateau(samples: list[dict[str, Any]], warmup_fraction: float, tolerance: float) -> dict[str, Any]:
+    """Compares the mean RSS of the two halves of the steady part of the run."""
+
+    steady = samples[int(len(samples) * warmup_fraction):]
+    if len(steady) < 4:
+        return {"plateaued": None, "reason": "amostras insuficientes após o aquecimento"}
+
+    middle = len(steady) // 2
+    first = mean(sample["rss_bytes"] for sample in steady[:middle])
+    second = mean(sample["rss_bytes"] for sample in steady[middle:])
+    growth = (second - first) / first
+    minutes = (steady[-1]["t"] - steady[0]["t"]) / 60
+    slope = (steady[-1]["rss_bytes"] - steady[0]["rss_bytes"]) / 2**20 / minutes if minutes else 0.0
+
+    first_objects, last_objects = steady[0]["objects"], steady[-1]["objects"]
+    object_growth = {
+        name: last_objects[name] - first_objects.get(name, 0)
+        for name in last_objects
+        if last_objects[name] - first_objects.get(name, 0) > 0
+    }
+    return {
+        "plateaued": growth <= tolerance,
+        "rss_growth": round(growth, 4),
+        "rss_slope_mb_per_min": round(slope, 3),
+        "steady_samples": len(steady),
+        "object_growth": dict(sorted(object_growth.items(), key=lambda item: -item[1])),
+    }
+
+
+async def soak(
+    duration: float,
+    interval: float,
+    concurrency: int,
+    search_ratio: float,
+    seed: int,
+) -> list[dict[str, Any]]:
+    # O app lê a raiz da SWAPI e os limites do cache ao ser importado
+    from app.main import app
+    from app.infrastructure.metrics.swapi_metrics import watched_caches
+
+    rng = random.Random(seed)
+    requests = errors = 0
+    samples: list[dict[str, Any]] = []
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def _worker(client: httpx.AsyncClient) -> None:
+        nonlocal requests, errors
+        while time.perf_counter() < deadline:
+            response = await client.get(random_path(rng, search_ratio))
+            requests += 1
+            errors += response.status_code >= 400
+
+    async def _sampler() -> None:
+        while True:
+            gc.collect()
+            sample = {
+                "t": round(time.perf_counter() - started, 2),
+                "requests": requests,
+                "errors": errors,
+                "rss_bytes": rss_bytes(),
+                "allocated_blocks": sys.getallocatedblocks(),
+                "cache_entries": {name: len(cache) for name, cache in watched_caches().items()},
+                "objects": object_counts(),
+            }
+            samples.append(sample)
+            entries = " ".join(f"{name}={count}" for name, count in sample["cache_entries"].items())
+            print(
+                f"{sample['t']:>8.0f}s {requests:>9} reqs {errors:>6} errors "
+                f"RSS {sample['rss_bytes'] / 2**20:>8.1f}MB blocks {sample['allocated_blocks']:>9} {entries}",
+                flush=True,
+            )
+            if time.perf_counter() >= deadline:
+                return
+            await asyncio.sleep(min(interval, max(deadline - time.perf_counter(), 0.0)))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://soak", timeout=60.0) as client:
+        await asyncio.gather(_sampler(), *[_worker(client) for _ in range(concurrency)])
+    return samples
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _start_stub(latency_ms: float) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.swapi_stub", "--port", str(port), "--latency-ms", str(latency_ms)],
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/_stub/stats", timeout=1.0)
+            return process, f"http://127.0.0.1:{port}/api/"
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("O stub da SWAPI não respondeu a tempo")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Soak test for the cache memory footprint")
+    parser.add_argument("--duration", type=float, default=600.0, help="Duração total (s)")
+    parser.add_argument("--interval", type=float, default=10.0, help="Intervalo entre amostras (s)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--search-ratio", type=float, default=0.7, help="Fração de buscas por termos aleatórios")
+    parser.add_argument("--cache-max-entries", type=int, default=2000, help="Limite do cache de payloads (0 = sem limite)")
+    parser.add_argument("--table-cache-max-entries", type=int, default=256)
+    parser.add_argument("--cache-ttl", type=float, default=300.0, help="TTL do cache (s)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latência do stub da SWAPI")
+    parser.add_argument("--warmup-fraction", type=float, default=0.3, help="Fração inicial ignorada no veredito")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Crescimento de RSS aceito entre as metades")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Grava amostras e veredito em JSON neste arquivo")
+    args = parser.parse_args()
+
+    process, base_url = _start_stub(args.latency_ms)
+    os.environ["SWAPI_BASE_URL"] = base_url
+    os.environ["SWAPI_WARMUP_ENABLED"] = "false"
+    os.environ["SWAPI_CACHE_MAX_ENTRIES"] = str(args.cache_max_entries)
+    os.environ["SWAPI_TABLE_CACHE_MAX_ENTRIES"] = str(args.table_cache_max_entries)
+    os.environ["SWAPI_CACHE_TTL_SECONDS"] = str(args.cache_ttl)
+    try:
+        samples = asyncio.run(soak(
+            args.duration, args.interval, args.concurrency, args.search_ratio, args.seed,
+        ))
+    finally:
+        process.terminate()
+        process.wait()
+
+    bounded = args.cache_max_entries > 0
+    verdict = plateau(samples, args.warmup_fraction, args.tolerance)
+    limits = {"payloads": args.cache_max_entries, "tables": args.table_cache_max_entries}
+    overflow = [
+        f"{name}: {count} > {limits[name]}"
+        for name, count in samples[-1]["cache_entries"].items()
+        if limits.get(name) and count > limits[name]
+    ] if samples else []
+
+    print()
+    print(
+        f"RSS growth over the steady part: {verdict.get('rss_growth', 0) * 100:+.1f}% "
+        f"({verdict.get('rss_slope_mb_per_min', 0):+.2f} MB/min), plateaued: {verdict['plateaued']}"
+    )
+    if verdict.get("object_growth"):
+        print("Object growth: " + ", ".join(f"{name} +{count}" for name, count in verdict["object_growth"].items()))
+    for line in overflow:
+        print(f"OVER LIMIT {line}")
+
+    if args.output:
+        document = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                **{name: value for name, value in vars(args).items() if name != "output"},
+            },
+            "verdict": {**verdict, "over_limit": overflow},
+            "samples": samples,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+            handle.write("\n")
+
+    if bounded and (verdict["plateaued"] is False or overflow):
+        print("FAIL memory did not plateau under the bounded cache")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
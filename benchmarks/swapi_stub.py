@@ -0,0 +1,333 @@
+"""Local SWAPI emulator over the synthetic dataset, with latency and failure injection.
+
+Serves `/api/`, `/api/<resource>/` (pages of 10, `?page=` and `?search=`
+like the real SWAPI) and `/api/<resource>/<id>/` over plain HTTP, so the
+gateway can be exercised with real sockets, threads and timeouts instead
+of a patched `requests.get`. Every link in the payloads points back at
+the stub.
+
+Faults are decided per request from `(seed, path and query, n-th hit)`,
+so the same run sees the same latencies, errors and 429s regardless of
+how concurrent requests interleave.
+
+Control endpoints (outside `/api/`):
+    GET  /_stub/stats    requests served, by path (with query) and by status
+    POST /_stub/reset    zeroes the counters
+    GET  /_stub/config   current fault injection settings
+    POST /_stub/config   JSON object with the settings to change
+
+Usage:
+    python -m benchmarks.swapi_stub --port 8765 --latency-ms 40 --latency-distribution lognormal --throttle-rate 0.02
+    SWAPI_BASE_URL=http://127.0.0.1:8765/api/ uvicorn app.main:app
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from benchmarks.payloads import BASE_URL, RESOURCE_COUNTS, build_dataset
+
+PAGE_SIZE = 10
+CHUNK_SIZE = 1024
+
+# Campos pesquisados por `?search=` em cada recurso da SWAPI
+SEARCH_FIELDS = {
+    "films": ("title",),
+    "people": ("name",),
+    "planets": ("name",),
+    "species": ("name",),
+    "starships": ("name", "model"),
+    "vehicles": ("name", "model"),
+}
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclasses.dataclass
+class StubConfig:
+    """Fault injection settings; rates are probabilities per request."""
+
+    seed: int = 42
+    # Latência antes da resposta: fixed = latency_ms; uniform = latency_ms ± spread;
+    # exponential = média latency_ms; lognormal = mediana latency_ms e sigma = spread
+    latency_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_spread: float = 0.5
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: int = 1
+    # Corpo enviado aos poucos ao longo de slow_body_ms (conexão lenta)
+    slow_body_rate: float = 0.0
+    slow_body_ms: float = 200.0
+
+    def __post_init__(self) -> None:
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Distribuição de latência desconhecida: {self.latency_distribution}")
+
+
+@dataclasses.dataclass
+class Fault:
+    status: int = 200
+    delay: float = 0.0
+    slow_body: bool = False
+
+
+class SwapiStub:
+    """HTTP server emulating SWAPI; use as a context manager or `start()`/`stop()`."""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or StubConfig()
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._hits: Counter[str] = Counter()
+        self._statuses: Counter[int] = Counter()
+        self._pages: dict[tuple[str, str, int], bytes] = {}
+        self._items = self._load(self.config.seed)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def start(self) -> SwapiStub:
+        # Intervalo curto: stop() não espera o meio segundo padrão do serve_forever
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="swapi-stub", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> SwapiStub:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": sum(self._hits.values()),
+                "by_path": dict(self._hits),
+                "by_status": {str(status): count for status, count in sorted(self._statuses.items())},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits.clear()
+            self._statuses.clear()
+
+    def configure(self, **changes: Any) -> StubConfig:
+        fields = {field.name for field in dataclasses.fields(StubConfig)}
+        unknown = set(changes) - fields
+        if unknown:
+            raise ValueError(f"Configurações desconhecidas: {', '.join(sorted(unknown))}")
+        config = dataclasses.replace(self.config, **changes)
+        if config.seed != self.config.seed:
+            self._items = self._load(config.seed)
+            self._pages.clear()
+        self.config = config
+        return config
+
+    ################### Funções Internas ###################
+
+    def _load(self, seed: int) -> dict[str, list[bytes]]:
+        # Links reescritos para o próprio stub; cada item já serializado uma única vez
+        text = json.dumps(build_dataset(seed)).replace(BASE_URL, self.base_url)
+        return {resource: [json.dumps(item).encode() for item in items] for resource, items in json.loads(text).items()}
+
+    def _fault(self, target: str) -> Fault:
+        with self._lock:
+            self._hits[target] += 1
+            occurrence = self._hits[target]
+        config = self.config
+        rng = random.Random(f"{config.seed}:{target}:{occurrence}")
+
+        fault = Fault(delay=self._latency(rng, config))
+        roll = rng.random()
+        if roll < config.throttle_rate:
+            fault.status = 429
+        elif roll < config.throttle_rate + config.error_rate:
+            fault.status = 500
+        fault.slow_body = rng.random() < config.slow_body_rate
+        return fault
+
+    def _latency(self, rng: random.Random, config: StubConfig) -> float:
+        base = config.latency_ms / 1000
+        if base <= 0:
+            return 0.0
+        if config.latency_distribution == "uniform":
+            return max(0.0, rng.uniform(base * (1 - config.latency_spread), base * (1 + config.latency_spread)))
+        if config.latency_distribution == "exponential":
+            return rng.expovariate(1 / base)
+        if config.latency_distribution == "lognormal":
+            return rng.lognormvariate(math.log(base), config.latency_spread)
+        return base
+
+    def _route(self, path: str, query: dict[str, list[str]]) -> tuple[int, bytes]:
+        segments = [segment for segment in path.split("/") if segment]
+        if not segments or segments[0] != "api":
+            return 404, _NOT_FOUND
+        if len(segments) == 1:
+            return 200, json.dumps({resource: f"{self.base_url}{resource}/" for resource in RESOURCE_COUNTS}).encode()
+
+        resource = segments[1]
+        items = self._items.get(resource)
+        if items is None or len(segments) > 3:
+            return 404, _NOT_FOUND
+        if len(segments) == 3:
+            if not segments[2].isdigit() or not 1 <= int(segments[2]) <= len(items):
+                return 404, _NOT_FOUND
+            return 200, items[int(segments[2]) - 1]
+
+        search = (query.get("search") or [""])[0].strip().lower()
+        page = (query.get("page") or ["1"])[0]
+        if not page.isdigit() or int(page) < 1:
+            return 404, _NOT_FOUND
+        body = self._page(resource, search, int(page))
+        return (200, body) if body is not None else (404, _NOT_FOUND)
+
+    def _page(self, resource: str, search: str, page: int) -> Optional[bytes]:
+        cache_key = (resource, search, page)
+        cached = self._pages.get(cache_key)
+        if cached is not None:
+            return cached
+
+        items = [json.loads(item) for item in self._items[resource]]
+        if search:
+            fields = SEARCH_FIELDS[resource]
+            items = [item for item in items if any(search in str(item.get(field, "")).lower() for field in fields)]
+        start = (page - 1) * PAGE_SIZE
+        if start >= len(items) and page > 1:
+            return None
+
+        def _link(number: int) -> str:
+            params = {"search": search, "page": number} if search else {"page": number}
+            return f"{self.base_url}{resource}/?{urlencode(params)}"
+
+        body = json.dumps({
+            "count": len(items),
+            "next": _link(page + 1) if start + PAGE_SIZE < len(items) else None,
+            "previous": _link(page - 1) if page > 1 else None,
+            "results": items[start:start + PAGE_SIZE],
+        }).encode()
+        self._pages[cache_key] = body
+        return body
+
+
+_NOT_FOUND = json.dumps({"detail": "Not found"}).encode()
+
+
+def _handler_for(stub: SwapiStub) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            parts = urlsplit(self.path)
+            if parts.path.startswith("/_stub/"):
+                self._control(parts.path)
+                return
+
+            fault = stub._fault(self.path)
+            if fault.delay:
+                time.sleep(fault.delay)
+            if fault.status == 429:
+                self._send(429, json.dumps({"detail": "Request was throttled."}).encode(),
+                           {"Retry-After": str(stub.config.retry_after_seconds)})
+                return
+            if fault.status == 500:
+                self._send(500, json.dumps({"detail": "Internal server error"}).encode())
+                return
+
+            status, body = stub._route(parts.path, parse_qs(parts.query))
+            self._send(status, body, slow=fault.slow_body)
+
+        def do_POST(self) -> None:
+            path = urlsplit(self.path).path
+            if path == "/_stub/reset":
+                stub.reset()
+                self._send(204, b"")
+            elif path == "/_stub/config":
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    config = stub.configure(**json.loads(self.rfile.read(length) or b"{}"))
+                except (TypeError, ValueError) as exc:
+                    self._send(400, json.dumps({"detail": str(exc)}).encode())
+                    return
+                self._send(200, json.dumps(dataclasses.asdict(config)).encode())
+            else:
+                self._send(404, _NOT_FOUND)
+
+        def _control(self, path: str) -> None:
+            if path == "/_stub/stats":
+                self._send(200, json.dumps(stub.stats()).encode())
+            elif path == "/_stub/config":
+                self._send(200, json.dumps(dataclasses.asdict(stub.config)).encode())
+            else:
+                self._send(404, _NOT_FOUND)
+
+        def _send(self, status: int, body: bytes, headers: Optional[dict[str, str]] = None, slow: bool = False) -> None:
+            with stub._lock:
+                stub._statuses[status] += 1
+            self.send_response(status)
+            if body:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if not slow or not body:
+                self.wfile.write(body)
+                return
+
+            chunks = [body[offset:offset + CHUNK_SIZE] for offset in range(0, len(body), CHUNK_SIZE)]
+            pause = stub.config.slow_body_ms / 1000 / len(chunks)
+            for chunk in chunks:
+                self.wfile.write(chunk)
+                self.wfile.flush()
+                time.sleep(pause)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return _Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local SWAPI emulator for benchmarks and tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    for field in dataclasses.fields(StubConfig):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=type(field.default), default=field.default)
+    args = parser.parse_args()
+
+    config = StubConfig(**{field.name: getattr(args, field.name) for field in dataclasses.fields(StubConfig)})
+    stub = SwapiStub(config, host=args.host, port=args.port)
+    print(f"SWAPI stub em {stub.base_url} (Ctrl+C para encerrar)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+import requests
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from app.main import app
@@ -10,9 +11,26 @@ from app.main import app
 def clear_cache():
     """Clear the service cache before each test."""
     from app.application.services.base_service import BaseSwapiService
+    from app.application.services.graph.graph_service import GraphService
+    from app.domain.keys.resource_key import key_for, parse_url
+    from app.domain.numeric.numeric_projection import numeric_projection
+    from app.infrastructure.metrics.metrics_registry import registry
+    from app.infrastructure.profiling.slow_request_log import slow_log
     BaseSwapiService._cache.clear()
+    BaseSwapiService._table_cache.clear()
+    BaseSwapiService._hot_keys.clear()
+    BaseSwapiService._co_access.clear()
+    GraphService._snapshot = None
+    key_for.cache_clear()
+    parse_url.cache_clear()
+    numeric_projection.clear()
+    registry.clear()
+    slow_log.clear()
     yield
     BaseSwapiService._cache.clear()
+    BaseSwapiService._hot_keys.clear()
+    BaseSwapiService._co_access.clear()
+    numeric_projection.clear()
 
 
 @pytest.fixture
@@ -40,6 +58,31 @@ def mock_requests_get(mock_swapi_response):
         yield mock_get
 
 
+@pytest.fixture
+def route_swapi(mock_requests_get, mock_swapi_response):
+    """Route mocked SWAPI calls by URL.
+
+    `route_swapi({url: payload})` or `route_swapi(lambda url, params: payload)`;
+    URLs without a payload answer 404. `on_request(url)` runs before each call.
+    """
+    def _install(routes, on_request=None):
+        resolve = routes if callable(routes) else lambda url, params: routes.get(url)
+
+        def _route(url, params=None, timeout=None):
+            if on_request is not None:
+                on_request(url)
+            payload = resolve(url, params)
+            if payload is None:
+                response = mock_swapi_response({}, status_code=404)
+                response.raise_for_status.side_effect = requests.HTTPError(response=response)
+                return response
+            return mock_swapi_response(payload)
+
+        mock_requests_get.side_effect = _route
+        return mock_requests_get
+    return _install
+
+
 @pytest.fixture
 def sample_film_payload():
     """Sample film payload from SWAPI."""
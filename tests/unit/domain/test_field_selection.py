@@ -0,0 +1,22 @@
+"""Unit tests for `fields=` parsing."""
+
+from app.domain.fields.field_selection import parse_fields
+
+
+class TestFieldSelection:
+    """Test suite for sparse fieldset parsing."""
+
+    def test_missing_or_empty_selects_everything(self):
+        """Test that no selection is returned for empty values."""
+        assert parse_fields(None) is None
+        assert parse_fields(" , ") is None
+
+    def test_nested_paths_group_by_relationship(self):
+        """Test that dotted paths become nested selections."""
+        selection = parse_fields("title, characters.name,characters.url,planets")
+
+        assert selection.names == {"title", "characters", "planets"}
+        assert selection.child("characters").names == {"name", "url"}
+        assert selection.child("planets") is None
+        assert not selection.child("characters").url_only()
+        assert parse_fields("characters.url").child("characters").url_only()
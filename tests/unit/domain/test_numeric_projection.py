@@ -0,0 +1,93 @@
+"""Unit tests for the numeric projection of SWAPI string fields."""
+
+import pytest
+
+from app.domain.numeric.numeric_projection import (
+    NumericProjection,
+    parse_birth_year,
+    parse_date,
+    parse_duration_days,
+    parse_number,
+)
+
+
+class TestParsers:
+    """Test suite for the SWAPI field parsers."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("172", 172.0),
+        ("1,000,000", 1000000.0),
+        ("1000km", 1000.0),
+        ("4.0", 4.0),
+        ("1 standard", 1.0),
+        ("unknown", None),
+        ("n/a", None),
+        ("indefinite", None),
+        (None, None),
+    ])
+    def test_parse_number(self, raw, expected):
+        """Test number parsing with separators, units and unknowns."""
+        assert parse_number(raw) == expected
+
+    def test_parse_birth_year(self):
+        """Test BBY/ABY birth years relative to the Battle of Yavin."""
+        assert parse_birth_year("19BBY") == -19.0
+        assert parse_birth_year("41.9BBY") == -41.9
+        assert parse_birth_year("4ABY") == 4.0
+        assert parse_birth_year("unknown") is None
+
+    def test_parse_duration_days(self):
+        """Test consumables normalization to days."""
+        assert parse_duration_days("2 months") == 60.0
+        assert parse_duration_days("1 year") == 365.0
+        assert parse_duration_days("Live food tanks") is None
+
+    def test_parse_date_orders_dates_and_timestamps(self):
+        """Test release dates and ISO timestamps become comparable numbers."""
+        assert parse_date("1977-05-25") < parse_date("1980-05-17")
+        assert parse_date("2014-12-10T14:23:31.880000Z") > parse_date("2014-12-10")
+        assert parse_date("not a date") is None
+
+
+class TestNumericProjection:
+    """Test suite for the cached projection."""
+
+    def test_projection_is_cached_per_url_and_edit(self, sample_planet_payload):
+        """Test that a payload version is parsed once and edits invalidate it."""
+        projection = NumericProjection()
+
+        first = projection.project("planets", sample_planet_payload)
+        again = projection.project("planets", dict(sample_planet_payload))
+        edited = projection.project("planets", {**sample_planet_payload, "population": "5", "edited": "2015-01-01"})
+
+        assert first is again
+        assert first["population"] == 200000.0
+        assert edited["population"] == 5.0
+
+    def test_projection_keeps_one_bounded_entry_per_resource(self, sample_planet_payload):
+        """Test that an edit replaces the old version, payloads without `edited` are not cached and the cache is bounded."""
+        projection = NumericProjection()
+        projection.max_entries = 2
+
+        projection.project("planets", sample_planet_payload)
+        projection.project("planets", {**sample_planet_payload, "edited": "2015-01-01"})
+        assert len(projection._cache) == 1
+
+        unversioned = {key: value for key, value in sample_planet_payload.items() if key != "edited"}
+        assert projection.project("planets", unversioned) is not projection.project("planets", unversioned)
+        assert projection.project("planets", {**unversioned, "population": "7"})["population"] == 7.0
+
+        for index in range(2, 5):
+            projection.project("planets", {**sample_planet_payload, "url": f"https://swapi.dev/api/planets/{index}/"})
+        assert len(projection._cache) == 2
+
+    def test_projection_reads_objects(self, sample_starship_payload):
+        """Test that entities/DTOs can be projected via attributes."""
+        from app.application.services.starships.starships_service import StarshipsService
+
+        dto = StarshipsService()._instance_payload(sample_starship_payload)
+        projection = NumericProjection().project("starships", dto)
+
+        assert projection["cost_in_credits"] == 1e12
+        assert projection["max_atmosphering_speed"] is None
+        assert projection["consumables"] == 3 * 365.0
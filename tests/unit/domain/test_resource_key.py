@@ -0,0 +1,52 @@
+"""Unit tests for canonical `(resource, id)` keys."""
+
+from app.application.services.people.people_service import PeopleService
+from app.domain.entities.serialization import serialize
+from app.domain.keys.resource_key import ResourceKey, SwapiResource, build_url, cache_key, key_for, parse_url
+from app.infrastructure.cache.interning import intern_payload
+
+
+class TestResourceKey:
+    """Test suite for URL canonicalization."""
+
+    def test_url_variants_map_to_the_same_key(self):
+        """Test that scheme and trailing slash do not change the key."""
+        key = parse_url("https://swapi.dev/api/people/1/")
+
+        assert key == ResourceKey(SwapiResource.PEOPLE, 1)
+        assert parse_url("http://swapi.dev/api/people/1") is key
+        assert parse_url("https://swapi.dev/api/people/") is None
+        assert parse_url("not a url") is None
+
+    def test_interned_keys_are_bounded(self):
+        """Test that ids sent by clients cannot grow the intern table without limit."""
+        for item_id in range(key_for.cache_info().maxsize + 100):
+            key_for(SwapiResource.PEOPLE, item_id)
+
+        assert key_for.cache_info().currsize == key_for.cache_info().maxsize
+        assert key_for(SwapiResource.PEOPLE, 1) == ResourceKey(SwapiResource.PEOPLE, 1)
+
+    def test_key_round_trips_to_url(self):
+        """Test that the URL is rebuilt from the key."""
+        key = ResourceKey(SwapiResource.PLANETS, 3)
+
+        assert build_url(key) == "https://swapi.dev/api/planets/3/"
+        assert str(key) == build_url(key)
+
+    def test_cache_key_normalizes_list_queries(self):
+        """Test that embedded and explicit query params produce one key."""
+        embedded = cache_key("https://swapi.dev/api/people/?page=2")
+        explicit = cache_key("http://swapi.dev/api/people", {"page": 2})
+
+        assert embedded == explicit == (SwapiResource.PEOPLE, (("page", "2"),))
+        assert cache_key("https://swapi.dev/api/people/1/") == cache_key(ResourceKey(SwapiResource.PEOPLE, 1))
+
+    def test_payload_urls_become_keys_and_serialize_back(self, sample_person_payload):
+        """Test that ingestion stores keys and responses still carry URLs."""
+        payload = intern_payload(sample_person_payload)
+        dto = PeopleService()._instance_payload(payload)
+
+        assert isinstance(dto.homeworld, ResourceKey)
+        assert all(isinstance(item, ResourceKey) for item in dto.films)
+        assert serialize(dto)["homeworld"] == sample_person_payload["homeworld"]
+        assert serialize(dto)["films"] == sample_person_payload["films"]
@@ -0,0 +1,65 @@
+"""Unit tests for the shared entity/DTO serializers."""
+
+from dataclasses import asdict
+
+from app.application.services.planets.planets_service import PlanetsService
+from app.domain.entities.people.people_entity import PeopleEntity
+from app.domain.entities.serialization import serialize, serializer_for
+from app.domain.keys.resource_key import as_key, build_url
+from app.interfaces.dtos.people.people_dto import PeopleDTO
+
+
+class TestSerialization:
+    """Test suite for precompiled serializers."""
+
+    def test_dto_matches_asdict(self, sample_planet_payload):
+        """Test that DTO output equals dataclasses.asdict."""
+        dto = PlanetsService()._instance_payload(sample_planet_payload)
+
+        assert serialize(dto) == asdict(dto)
+
+    def test_dto_output_is_shallow(self, sample_planet_payload):
+        """Test that URL lists are emitted without copying."""
+        dto = PlanetsService()._instance_payload(sample_planet_payload)
+
+        assert serialize(dto)["residents"] is dto.residents
+
+    def test_entity_with_nested_dtos(self, sample_planet_payload):
+        """Test that related DTOs are serialized inside entity output."""
+        homeworld = PlanetsService()._instance_payload(sample_planet_payload)
+        entity = PeopleEntity(name="Luke Skywalker", homeworld=homeworld, films=["https://swapi.dev/api/films/1/"])
+
+        data = entity.to_dict()
+
+        assert list(data) == list(PeopleEntity.__slots__)
+        assert data["homeworld"]["name"] == "Tatooine"
+        assert data["films"] == ["https://swapi.dev/api/films/1/"]
+        assert data["species"] == []
+
+    def test_serializer_is_compiled_once_per_class(self):
+        """Test that the serializer for a class is reused."""
+        assert serializer_for(PeopleEntity) is serializer_for(PeopleEntity)
+
+    def test_mixed_relation_list(self, sample_planet_payload):
+        """Test that a list mixing hydrated DTOs, resource keys and URLs serializes item by item."""
+        homeworld = PlanetsService()._instance_payload(sample_planet_payload)
+        key = as_key("https://swapi.dev/api/planets/2/")
+        entity = PeopleEntity(name="Luke Skywalker", films=["https://swapi.dev/api/films/1/", key, homeworld])
+
+        data = entity.to_dict()
+
+        assert data["films"][0] == "https://swapi.dev/api/films/1/"
+        assert data["films"][1] == build_url(key)
+        assert data["films"][2]["name"] == "Tatooine"
+
+    def test_dto_converts_only_declared_reference_fields(self):
+        """Test that DTO keys become URLs through the declared reference fields."""
+        key = as_key("https://swapi.dev/api/planets/1/")
+        dto = PeopleDTO(name="Luke Skywalker", homeworld=key, films=[key], url=key)
+
+        data = serialize(dto)
+
+        assert "homeworld" in PeopleDTO.reference_fields
+        assert data["homeworld"] == build_url(key)
+        assert data["films"] == [build_url(key)]
+        assert data["url"] == build_url(key)
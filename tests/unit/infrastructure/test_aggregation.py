@@ -0,0 +1,41 @@
+"""Unit tests for the vectorized group-by kernels."""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.columnar.aggregation import aggregate
+
+
+class TestAggregate:
+    """Test suite for aggregate()."""
+
+    def test_matches_numpy_per_group(self):
+        """Test every metric against a per-group NumPy reference."""
+        rng = np.random.default_rng(3)
+        codes = rng.integers(0, 4, size=200)
+        values = rng.normal(100, 25, size=200)
+        values[rng.random(200) < 0.2] = np.nan
+
+        result = aggregate(codes, 4, values, percentiles=(50, 90))
+
+        for group in range(4):
+            known = values[(codes == group) & ~np.isnan(values)]
+            assert result["count"][group] == known.size
+            assert result["sum"][group] == pytest.approx(known.sum())
+            assert result["mean"][group] == pytest.approx(known.mean())
+            assert result["min"][group] == known.min()
+            assert result["max"][group] == known.max()
+            assert result["p50"][group] == pytest.approx(np.percentile(known, 50))
+            assert result["p90"][group] == pytest.approx(np.percentile(known, 90))
+
+    def test_group_without_known_values(self):
+        """Test that empty groups report zero count and NaN metrics."""
+        codes = np.array([0, 0, 1])
+        values = np.array([1.0, 3.0, np.nan])
+
+        result = aggregate(codes, 2, values, percentiles=(50,))
+
+        assert result["count"].tolist() == [2, 0]
+        assert result["mean"][0] == 2.0
+        assert np.isnan(result["mean"][1])
+        assert np.isnan(result["p50"][1])
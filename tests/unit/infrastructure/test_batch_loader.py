@@ -0,0 +1,49 @@
+"""Unit tests for the per-request batch loader."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.loading.batch_loader import BatchLoader
+
+
+class TestBatchLoader:
+    """Test suite for load coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_loads_share_one_batch(self):
+        """Test that concurrent loads are batched and deduplicated."""
+        batches = []
+
+        async def _batch(keys):
+            batches.append(list(keys))
+            return [key * 10 for key in keys]
+
+        loader = BatchLoader(_batch)
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load_many([2, 3]))
+
+        assert results == [10, 20, 10, [20, 30]]
+        assert batches == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_errors_fail_only_their_key(self):
+        """Test that an exception returned for one key does not fail the others."""
+        async def _batch(keys):
+            return [ValueError("missing") if key == 2 else key for key in keys]
+
+        loader = BatchLoader(_batch)
+        first, second = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        assert first == 1
+        assert isinstance(second, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_primed_values_skip_the_batch(self):
+        """Test that primed keys never reach the batch function."""
+        async def _batch(keys):
+            raise AssertionError("should not be called")
+
+        loader = BatchLoader(_batch)
+        loader.prime("a", 1)
+
+        assert await loader.load("a") == 1
@@ -0,0 +1,61 @@
+"""Unit tests for the count-min sketch and the co-access tracker."""
+
+from app.infrastructure.cache.co_access import CoAccessTracker, CountMinSketch
+
+
+class TestCountMinSketch:
+    """Test suite for CountMinSketch."""
+
+    def test_estimates_never_under_count(self):
+        """Test that every estimate is at least the true count."""
+        sketch = CountMinSketch(width=64, depth=4)
+        for index in range(200):
+            sketch.add(("item", index % 20))
+
+        assert all(sketch.estimate(("item", index)) >= 10 for index in range(20))
+        assert sketch.estimate(("item", 3)) < 40
+
+    def test_clear_resets_counts(self):
+        """Test that clearing drops every count."""
+        sketch = CountMinSketch()
+        sketch.add("a", 5)
+        sketch.clear()
+
+        assert sketch.estimate("a") == 0
+
+
+class TestCoAccessTracker:
+    """Test suite for CoAccessTracker."""
+
+    def test_follow_up_access_raises_probability(self):
+        """Test that a target requested after being exposed counts as co-accessed."""
+        tracker = CoAccessTracker()
+        edge = ("people", "homeworld")
+        tracker.served("person-1")
+        tracker.expose("person-1", edge, "planet-1")
+        tracker.observe("planet-1")
+
+        assert tracker.probability("person-1", edge, "planet-1") == 1.0
+        assert tracker.probability("person-2", edge, "planet-2") == 0.0
+
+    def test_relation_rate_generalizes_after_min_samples(self):
+        """Test that cold keys inherit the rate learned on their relation."""
+        tracker = CoAccessTracker()
+        edge = ("people", "films")
+        for index in range(5):
+            tracker.served(("person", index))
+            tracker.expose(("person", index), edge, ("film", index))
+            if index % 2 == 0:
+                tracker.observe(("film", index))
+
+        assert tracker.probability(("person", 99), edge, ("film", 99), min_samples=5) == 0.6
+        assert tracker.probability(("person", 99), edge, ("film", 99), min_samples=10) == 0.0
+
+    def test_expired_exposure_is_not_counted(self):
+        """Test that accesses outside the window are not co-accesses."""
+        tracker = CoAccessTracker(window_seconds=-1)
+        tracker.served("person-1")
+        tracker.expose("person-1", ("people", "films"), "film-1")
+        tracker.observe("film-1")
+
+        assert tracker.probability("person-1", ("people", "films"), "film-1") == 0.0
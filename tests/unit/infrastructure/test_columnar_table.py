@@ -0,0 +1,50 @@
+"""Unit tests for the NumPy-backed columnar table."""
+
+from app.infrastructure.columnar.columnar_table import ColumnarTable, MatchFilter, RangeFilter, SortKey
+
+
+def _table():
+    return ColumnarTable(
+        5,
+        numeric={"population": [200000.0, None, 1000.0, 2e9, 1000.0]},
+        categorical={
+            "name": ["Tatooine", "Hoth", "Dagobah", "Coruscant", "Bespin"],
+            "climate": ["arid", "frozen", "murky", "temperate", "temperate, tropical"],
+        },
+    )
+
+
+class TestColumnarTable:
+    """Test suite for vectorized filter/sort/top-k."""
+
+    def test_range_filter_excludes_unknown_values(self):
+        """Test that NaN (unknown) never satisfies a range filter."""
+        indices = _table().query(filters=[RangeFilter("population", low=1000.0, high=1e6)])
+
+        assert indices.tolist() == [0, 2, 4]
+
+    def test_match_filter_matches_comma_separated_tokens(self):
+        """Test categorical matching against whole values and list items."""
+        indices = _table().query(filters=[MatchFilter("climate", "Temperate")])
+
+        assert indices.tolist() == [3, 4]
+
+    def test_multi_key_sort_with_unknowns_last(self):
+        """Test multi-key sort: population desc, then name asc; NaN last."""
+        indices = _table().query(sort=[SortKey("population", True), SortKey("name")])
+
+        assert indices.tolist() == [3, 0, 4, 2, 1]
+
+    def test_text_sort_is_case_insensitive(self):
+        """Test that dictionary codes preserve lexicographic order."""
+        indices = _table().query(sort=[SortKey("name", True)])
+
+        assert indices.tolist() == [0, 1, 2, 3, 4]
+
+    def test_top_k_matches_full_sort_including_ties(self):
+        """Test that the partitioned top-k equals a stable full sort."""
+        table = _table()
+        full = table.query(sort=[SortKey("population")])
+
+        for limit in range(1, 6):
+            assert table.query(sort=[SortKey("population")], limit=limit).tolist() == full[:limit].tolist()
@@ -0,0 +1,42 @@
+"""Unit tests for the hot-key tracker."""
+
+from app.infrastructure.cache.hot_keys import HotKeyTracker
+
+
+class TestHotKeyTracker:
+    """Test suite for HotKeyTracker."""
+
+    def test_top_orders_by_frequency(self):
+        """Test that the most recorded keys come first, with their refetch arguments."""
+        tracker = HotKeyTracker()
+        tracker.record("a", "https://swapi.dev/api/films/1/")
+        for _ in range(3):
+            tracker.record("b", "https://swapi.dev/api/planets/", {"page": 2})
+
+        assert tracker.top(2) == [
+            ("https://swapi.dev/api/planets/", {"page": 2}),
+            ("https://swapi.dev/api/films/1/", None),
+        ]
+
+    def test_decay_drops_cold_keys(self):
+        """Test that keys no longer requested leave the hot set after decaying."""
+        tracker = HotKeyTracker()
+        tracker.record("cold", "cold-url")
+        for _ in range(4):
+            tracker.record("hot", "hot-url")
+
+        tracker.decay()
+        tracker.decay()
+
+        assert tracker.top(5) == [("hot-url", None)]
+
+    def test_size_is_bounded(self):
+        """Test that the tracker prunes down to the hottest keys."""
+        tracker = HotKeyTracker(max_keys=2)
+        tracker.record("hot", "hot-url")
+        tracker.record("hot", "hot-url")
+        for index in range(10):
+            tracker.record(index, f"url-{index}")
+
+        assert len(tracker) <= 4
+        assert tracker.top(1) == [("hot-url", None)]
@@ -0,0 +1,55 @@
+"""Unit tests for payload interning and the compact DTO/entity layout."""
+
+import json
+
+import pytest
+
+from app.application.services.people.people_service import PeopleService
+from app.domain.entities.people.people_entity import PeopleEntity
+from app.infrastructure.cache.interning import MAX_INTERNED_LENGTH, intern_payload
+
+
+class TestInternPayload:
+    """Test suite for ingestion-time interning."""
+
+    def test_repeated_urls_share_one_object(self, sample_person_payload):
+        """Test that equal URLs decoded separately become the same object."""
+        first = intern_payload(json.loads(json.dumps(sample_person_payload)))
+        second = intern_payload(json.loads(json.dumps(sample_person_payload)))
+
+        assert first["homeworld"] is second["homeworld"]
+        assert first["films"][0] is second["films"][0]
+        assert first["eye_color"] is second["eye_color"]
+
+    def test_long_text_is_not_interned(self):
+        """Test that free text above the threshold is kept as-is."""
+        text = "x" * (MAX_INTERNED_LENGTH + 1)
+        payload = intern_payload({"opening_crawl": text})
+
+        assert payload["opening_crawl"] is text
+
+    def test_non_string_values_are_preserved(self):
+        """Test that numbers and nested structures survive interning."""
+        payload = intern_payload({"episode_id": 4, "results": [{"name": "Luke"}], "next": None})
+
+        assert payload == {"episode_id": 4, "results": [{"name": "Luke"}], "next": None}
+
+
+class TestCompactLayout:
+    """Test suite for slot-based DTOs and entities."""
+
+    def test_dto_has_no_instance_dict_and_is_frozen(self, sample_person_payload):
+        """Test that DTOs are slotted and immutable."""
+        dto = PeopleService()._instance_payload(sample_person_payload)
+
+        assert not hasattr(dto, "__dict__")
+        with pytest.raises(AttributeError):
+            dto.name = "Leia"
+
+    def test_entity_keeps_relationship_lists_without_copying(self):
+        """Test that entities are slotted and share the given lists."""
+        films = ["https://swapi.dev/api/films/1/"]
+        entity = PeopleEntity(name="Luke Skywalker", films=films)
+
+        assert not hasattr(entity, "__dict__")
+        assert entity.films is films
@@ -0,0 +1,87 @@
+"""Unit tests for the in-memory TTL/LRU cache."""
+
+from app.infrastructure.cache.memory_cache import MemoryCache
+
+
+class TestMemoryCache:
+    """Test suite for MemoryCache."""
+
+    def test_unbounded_by_default(self):
+        """Test that without a limit every entry is kept."""
+        cache = MemoryCache()
+        for index in range(1000):
+            cache.set(index, index)
+
+        assert len(cache) == 1000
+        assert cache.evictions == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that a bounded cache drops the entry read or written longest ago."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_overwrite_refreshes_recency(self):
+        """Test that setting an existing key makes it the most recent without growing the cache."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are dropped on read."""
+        cache = MemoryCache(ttl_seconds=-1)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+
+        cache.configure(ttl_seconds=0.000001)
+        cache.set("b", 2)
+        while cache.get("b") is not None:
+            pass
+
+        assert cache.misses == 1
+        assert cache.evictions == 1
+
+    def test_configure_trims_to_new_limit(self):
+        """Test that lowering the limit evicts the oldest entries at once and 0 removes it."""
+        cache = MemoryCache()
+        for index in range(5):
+            cache.set(index, index)
+
+        cache.configure(max_entries=3)
+
+        assert len(cache) == 3
+        assert cache.get(0) is None
+        assert cache.get(4) == 4
+        assert cache.max_entries == 3
+
+        cache.configure(max_entries=0)
+        for index in range(10, 20):
+            cache.set(index, index)
+
+        assert cache.max_entries is None
+        assert len(cache) == 13
+
+    def test_remaining_ttl(self):
+        """Test that the remaining TTL is reported only for entries that expire."""
+        cache = MemoryCache(ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert 0 < cache.remaining_ttl("a") <= 60
+        assert cache.remaining_ttl("missing") is None
+        assert MemoryCache(ttl_seconds=0).remaining_ttl("a") is None
@@ -0,0 +1,48 @@
+"""Unit tests for the Prometheus metrics registry."""
+
+import pytest
+
+from app.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_counter_and_gauge_render(self):
+        """Test the text exposition of labelled counters and callback gauges."""
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls", ("resource",))
+        registry.gauge("queue_depth", "Queued", collect=lambda: {(): 3.0})
+        counter.inc("films")
+        counter.inc("films", amount=2)
+        counter.inc('pla"nets')
+
+        text = registry.render()
+
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{resource="films"} 3' in text
+        assert 'calls_total{resource="pla\\"nets"} 1' in text
+        assert "queue_depth 3" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets, sum and count follow the Prometheus layout."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            histogram.observe(value, "/films/")
+
+        lines = registry.render().splitlines()
+
+        assert 'latency_seconds_bucket{route="/films/",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/films/",le="1"} 3' in lines
+        assert 'latency_seconds_bucket{route="/films/",le="+Inf"} 4' in lines
+        assert 'latency_seconds_sum{route="/films/"} 4.25' in lines
+        assert 'latency_seconds_count{route="/films/"} 4' in lines
+
+    def test_duplicate_names_are_rejected(self):
+        """Test that a metric name can only be registered once."""
+        registry = MetricsRegistry()
+        registry.counter("calls_total", "Calls")
+
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Calls")
@@ -0,0 +1,44 @@
+"""Unit tests for the relationship graph."""
+
+from app.domain.keys.resource_key import as_key
+from app.infrastructure.graph.relationship_graph import RelationshipGraph
+
+BASE = "https://swapi.dev/api"
+
+DATASET = {
+    "people": [
+        {"url": f"{BASE}/people/1/", "homeworld": f"{BASE}/planets/1/", "films": [f"{BASE}/films/1/"], "starships": [f"{BASE}/starships/12/"]},
+        {"url": f"{BASE}/people/2/", "homeworld": f"{BASE}/planets/1/", "films": [], "starships": []},
+        {"url": f"{BASE}/people/4/", "homeworld": f"{BASE}/planets/2/", "films": [f"{BASE}/films/1/"], "starships": [f"{BASE}/starships/12/"]},
+    ],
+    # O filme 1 também lista a pessoa 2, que não lista o filme 1: o grafo usa a união
+    "films": [{"url": f"{BASE}/films/1/", "characters": [f"{BASE}/people/1/", f"{BASE}/people/2/"]}],
+    "species": [{"url": f"{BASE}/species/1/", "homeworld": f"{BASE}/planets/2/"}],
+}
+
+
+class TestRelationshipGraph:
+    """Test suite for RelationshipGraph."""
+
+    def test_node_urls_parse_to_keys(self):
+        """Test URL parsing with and without trailing slash."""
+        assert as_key(f"{BASE}/people/12/") == ("people", 12)
+        assert as_key("http://swapi.dev/api/planets/3") == ("planets", 3)
+        assert as_key("not a url") is None
+
+    def test_both_directions_are_indexed(self):
+        """Test forward edges, inverse edges and the union of both sides."""
+        graph = RelationshipGraph.build(DATASET)
+
+        assert graph.neighbors("planets", "residents", 1).tolist() == [1, 2]
+        assert graph.neighbors("films", "characters", 1).tolist() == [1, 2, 4]
+        assert graph.neighbors("people", "films", 2).tolist() == [1]
+        assert graph.neighbors("planets", "native_species", 2).tolist() == [1]
+
+    def test_join_intersects_constraints(self):
+        """Test people from planet 1 that appear in film 1 and flew starship 12."""
+        graph = RelationshipGraph.build(DATASET)
+
+        assert graph.join("people", [("homeworld", 1), ("films", 1)]).tolist() == [1, 2]
+        assert graph.join("people", [("homeworld", 1), ("films", 1), ("starships", 12)]).tolist() == [1]
+        assert graph.join("people", [("homeworld", 3)]).tolist() == []
@@ -0,0 +1,65 @@
+"""Unit tests for the sampling profiler and the allocation snapshot."""
+
+import threading
+
+from app.infrastructure.profiling.allocation_profiler import allocation_growth
+from app.infrastructure.profiling.sampling_profiler import SamplingProfiler, StackSamples
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+class TestSamplingProfiler:
+    """Test suite for SamplingProfiler and StackSamples."""
+
+    def test_samples_other_threads_by_name(self):
+        """Test that a busy worker thread shows up under its own name."""
+        stop = threading.Event()
+        worker = threading.Thread(target=_spin, args=(stop,), name="busy-worker")
+        worker.start()
+        try:
+            samples = SamplingProfiler(interval=0.001).run(0.05)
+        finally:
+            stop.set()
+            worker.join()
+
+        busy = [stack for stack in samples.stacks if stack[0] == "busy-worker"]
+        assert busy
+        assert any("_spin (" in frame for stack in busy for frame in stack)
+        assert samples.ticks > 1
+        assert samples.duration >= 0.05
+
+    def test_collapsed_and_speedscope_formats(self):
+        """Test both exports of the same samples."""
+        samples = StackSamples(interval=0.01)
+        samples.duration = 0.03
+        samples.stacks[("MainThread", "main (app.py:1)", "handler (app.py:9)")] = 2
+        samples.stacks[("asyncio_0", "run (thread.py:3)")] = 1
+
+        assert samples.collapsed().splitlines() == [
+            "MainThread;main (app.py:1);handler (app.py:9) 2",
+            "asyncio_0;run (thread.py:3) 1",
+        ]
+
+        document = samples.speedscope()
+        names = [frame["name"] for frame in document["shared"]["frames"]]
+        profiles = {profile["name"]: profile for profile in document["profiles"]}
+        main = profiles["MainThread"]
+        assert [names[index] for index in main["samples"][0]] == ["main (app.py:1)", "handler (app.py:9)"]
+        assert main["weights"] == [0.02]
+        assert main["type"] == "sampled" and main["endValue"] == 0.03
+
+    def test_allocation_growth_reports_retained_sites(self):
+        """Test that memory kept during the window is attributed to its allocation site."""
+        retained = []
+        timer = threading.Timer(0.01, lambda: retained.append([bytearray(1024) for _ in range(200)]))
+        timer.start()
+
+        report = allocation_growth(0.1, limit=50)
+
+        timer.join()
+        assert report["top"]
+        assert report["top"][0]["size_diff"] >= 200 * 1024
+        assert any("test_sampling_profiler.py" in frame for frame in report["top"][0]["traceback"])
@@ -0,0 +1,65 @@
+"""Unit tests for the slow-request log."""
+
+import json
+import logging
+
+from app.infrastructure.profiling.slow_request_log import SlowRequestLog, normalize_params, query_shape
+from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
+
+
+class TestSlowRequestLog:
+    """Test suite for SlowRequestLog."""
+
+    def test_only_requests_over_the_threshold_are_kept(self):
+        """Test the latency threshold."""
+        log = SlowRequestLog(threshold_seconds=0.2)
+
+        assert log.observe("/people/", 0.1) is None
+        assert log.observe("/people/", 0.25) is not None
+        assert len(log) == 1
+
+    def test_ring_buffer_keeps_the_newest_entries(self):
+        """Test that the buffer is bounded and lists newest first."""
+        log = SlowRequestLog(threshold_seconds=0.0, capacity=2)
+        for route in ("/films/", "/people/", "/planets/"):
+            log.observe(route, 1.0)
+
+        assert [entry["route"] for entry in log.entries()] == ["/planets/", "/people/"]
+        assert [entry["route"] for entry in log.entries(route="/people/")] == ["/people/"]
+        assert len(log.entries(limit=1)) == 1
+
+    def test_entry_captures_shape_relations_and_cost(self):
+        """Test the recorded query shape, relationship flags and fan-out."""
+        log = SlowRequestLog(threshold_seconds=0.0)
+        params = PeopleQueryParams(id=4, films=True, homeworld=True, expand="films.characters")
+
+        entry = log.observe(
+            "/people/", 0.9, params,
+            upstream_calls=7, lookups=10, cache_hits=3, stages={"hydrate": 0.5},
+        )
+
+        assert entry["params"] == {"id": 4, "homeworld": True, "films": True, "expand": "films.characters"}
+        assert entry["shape"] == "expand=films.characters&films=true&homeworld=true&id=?"
+        assert entry["relations"] == ["homeworld", "films"]
+        assert entry["upstream_calls"] == 7
+        assert entry["cache_hit_ratio"] == 0.3
+        assert entry["stages_ms"] == {"hydrate": 500.0}
+        assert entry["duration_ms"] == 900.0
+
+    def test_same_shape_for_different_ids(self):
+        """Test that only the presence of identifying params matters."""
+        first = query_shape(normalize_params(PeopleQueryParams(id=1, films=True)))
+        second = query_shape(normalize_params(PeopleQueryParams(id=9, films=True)))
+
+        assert first == second == "films=true&id=?"
+
+    def test_structured_log_line(self, caplog):
+        """Test that entries are mirrored as JSON log lines when enabled."""
+        log = SlowRequestLog(threshold_seconds=0.0, log=True)
+
+        with caplog.at_level(logging.WARNING, logger="app.slow_requests"):
+            log.observe("/films/", 0.7, upstream_calls=2)
+
+        record = json.loads(caplog.records[-1].getMessage())
+        assert record["route"] == "/films/"
+        assert record["upstream_calls"] == 2
@@ -0,0 +1,131 @@
+"""Unit tests for the OpenTelemetry-compatible tracer."""
+
+import threading
+
+import pytest
+
+from app.infrastructure.tracing.tracer import (
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    exporter_for,
+    parse_traceparent,
+)
+
+
+@pytest.fixture
+def traced():
+    """A tracer recording into an in-memory exporter."""
+    tracer, exporter = Tracer(), InMemorySpanExporter()
+    tracer.configure(exporter)
+    return tracer, exporter
+
+
+class TestTracer:
+    """Test suite for Tracer and its exporters."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans are no-ops until an exporter is configured."""
+        tracer = Tracer()
+
+        with tracer.start_span("noop") as span:
+            span.set_attribute("ignored", True)
+
+        assert span.recording is False
+
+    def test_children_share_the_trace_and_point_to_their_parent(self, traced):
+        """Test span nesting through the context variable."""
+        tracer, exporter = traced
+
+        with tracer.start_span("root", kind=SpanKind.SERVER) as root:
+            with tracer.start_span("child") as child:
+                child.set_attribute("swapi.cache_hit", True)
+
+        finished = exporter.get_finished_spans()
+        assert [span.name for span in finished] == ["child", "root"]
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert root.parent_id is None
+        assert len(root.trace_id) == 32 and len(root.span_id) == 16
+        assert child.end_ns >= child.start_ns
+
+    def test_exception_marks_the_span_as_error(self, traced):
+        """Test that an exception leaving the block is recorded on the span."""
+        tracer, exporter = traced
+
+        with pytest.raises(RuntimeError):
+            with tracer.start_span("failing"):
+                raise RuntimeError("boom")
+
+        span = exporter.get_finished_spans()[0]
+        assert span.status == StatusCode.ERROR
+        assert span.attributes["exception.type"] == "RuntimeError"
+
+    def test_incoming_traceparent_is_continued(self, traced):
+        """Test that a W3C traceparent becomes the parent of the root span."""
+        tracer, exporter = traced
+        incoming = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        with tracer.start_span("server", traceparent=incoming) as span:
+            pass
+
+        assert span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert span.parent_id == "00f067aa0ba902b7"
+        assert span.traceparent.startswith("00-4bf92f3577b34da6a3ce929d0e0e4736-")
+
+    def test_unsampled_trace_drops_the_whole_tree(self, traced):
+        """Test that children of an unsampled root are not recorded either."""
+        tracer, exporter = traced
+        tracer.configure(exporter, sample_ratio=0.0)
+
+        with tracer.start_span("root"):
+            with tracer.start_span("child") as child:
+                pass
+
+        assert child.recording is False
+        assert exporter.get_finished_spans() == []
+
+    @pytest.mark.parametrize("value", [None, "", "garbage", "00-" + "0" * 32 + "-00f067aa0ba902b7-01"])
+    def test_invalid_traceparent_is_ignored(self, value):
+        """Test that malformed or all-zero trace contexts are rejected."""
+        assert parse_traceparent(value) is None
+
+    def test_otlp_payload_shape(self, traced):
+        """Test the OTLP/JSON encoding of spans and typed attributes."""
+        tracer, exporter = traced
+        with tracer.start_span("GET swapi", kind=SpanKind.CLIENT) as span:
+            span.set_attribute("http.response.status_code", 200)
+            span.set_attribute("swapi.cache_hit", False)
+
+        payload = OtlpHttpSpanExporter("http://collector/v1/traces").payload(exporter.get_finished_spans())
+
+        encoded = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert encoded["kind"] == 3
+        assert {"key": "http.response.status_code", "value": {"intValue": "200"}} in encoded["attributes"]
+        assert {"key": "swapi.cache_hit", "value": {"boolValue": False}} in encoded["attributes"]
+        assert "parentSpanId" not in encoded
+
+    def test_otlp_exporter_flushes_on_schedule(self, traced, monkeypatch):
+        """Test that a partial batch is sent after the schedule delay, without a shutdown."""
+        tracer, memory = traced
+        with tracer.start_span("GET swapi"):
+            pass
+        sent = threading.Event()
+        batches = []
+        exporter = OtlpHttpSpanExporter("http://collector/v1/traces", batch_size=256, schedule_delay=0.01)
+        monkeypatch.setattr(exporter, "_send", lambda spans: (batches.append(list(spans)), sent.set()))
+
+        exporter.export(memory.get_finished_spans())
+
+        assert sent.wait(timeout=5)
+        exporter.shutdown()
+        assert [len(batch) for batch in batches] == [1]
+
+    def test_exporter_for_rejects_unknown_names(self):
+        """Test exporter selection from the configuration."""
+        assert exporter_for("none") is None
+        assert isinstance(exporter_for("memory"), InMemorySpanExporter)
+        with pytest.raises(ValueError):
+            exporter_for("zipkin")
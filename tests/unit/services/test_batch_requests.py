@@ -0,0 +1,126 @@
+"""Unit tests for multi-id lookups and the /batch endpoint."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from app.application.services.people.people_service import PeopleService
+
+
+@pytest.fixture
+def routed_swapi(route_swapi, sample_film_payload, sample_person_payload):
+    """Routes SWAPI detail URLs to fixture payloads; unknown URLs answer 404."""
+    payloads = {
+        "https://swapi.dev/api/films/1/": sample_film_payload,
+        "https://swapi.dev/api/films/2/": {**sample_film_payload, "title": "The Empire Strikes Back", "url": "https://swapi.dev/api/films/2/"},
+        "https://swapi.dev/api/people/1/": sample_person_payload,
+    }
+
+    return route_swapi(payloads)
+
+
+class TestMultiIdLookups:
+    """Test suite for `ids=` on resource endpoints."""
+
+    def test_ids_keep_requested_order_and_skip_missing(self, client, routed_swapi):
+        """Test that ids resolve concurrently in order and unknown ids are omitted."""
+        response = client.get("/films/?ids=2,99,1,2&fields=title")
+
+        assert response.status_code == 200
+        assert response.json() == [{"title": "The Empire Strikes Back"}, {"title": "A New Hope"}]
+
+    def test_invalid_ids_are_rejected(self, client, routed_swapi):
+        """Test that non-numeric ids return 400."""
+        response = client.get("/films/?ids=1,abc")
+
+        assert response.status_code == 400
+
+
+class TestBatchEndpoint:
+    """Test suite for /batch."""
+
+    def test_sub_requests_share_fetches(self, client, routed_swapi):
+        """Test that sub-requests run together and reuse each other's fetches."""
+        response = client.post("/batch", json={"requests": [
+            {"id": "a", "resource": "films", "params": {"ids": [1, 2], "fields": "title"}},
+            {"id": "b", "resource": "people", "params": {"id": 1, "fields": "name"}},
+            {"id": "c", "resource": "films", "params": {"id": 1, "fields": "episode_id"}},
+        ]})
+
+        assert response.status_code == 200
+        responses = response.json()["responses"]
+        assert [item["status"] for item in responses] == [200, 200, 200]
+        assert responses[0]["body"] == [{"title": "A New Hope"}, {"title": "The Empire Strikes Back"}]
+        assert responses[1]["body"] == [{"name": "Luke Skywalker"}]
+        requested = [call.args[0] for call in routed_swapi.call_args_list]
+        assert sorted(requested) == sorted(set(requested))
+
+    def test_errors_are_reported_per_sub_request(self, client, routed_swapi):
+        """Test that invalid sub-requests fail alone."""
+        response = client.post("/batch", json={"requests": [
+            {"resource": "droids"},
+            {"resource": "films", "params": {"colour": "red"}},
+            {"resource": "films", "params": {"id": 1, "fields": "title"}},
+        ]})
+
+        assert [item["status"] for item in response.json()["responses"]] == [404, 400, 200]
+
+    def test_empty_batch_is_rejected(self, client):
+        """Test that an empty batch returns 400."""
+        assert client.post("/batch", json={"requests": []}).status_code == 400
+
+
+class TestInflightDeduplication:
+    """Test suite for concurrent fetches of the same SWAPI URL."""
+
+    def test_concurrent_callers_share_one_request(self, mock_requests_get, sample_person_payload):
+        """Test that simultaneous misses for one key trigger a single upstream call."""
+        def _slow(url, params=None, timeout=None):
+            time.sleep(0.05)
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.json.return_value = sample_person_payload
+            return response
+
+        mock_requests_get.side_effect = _slow
+        service = PeopleService()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service._resolve_payload("https://swapi.dev/api/people/1/")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_requests_get.call_count == 1
+        assert len(results) == 5 and all(result is results[0] for result in results)
+
+    @pytest.mark.parametrize("params", [{"limit": -1}, {"limit": 0}, {"limit": "abc"}, {"id": "one"}])
+    def test_params_are_validated_like_the_query_string(self, client, routed_swapi, params):
+        """Test that sub-request params follow the GET route constraints and fail with a per-item 422."""
+        response = client.post("/batch", json={"requests": [
+            {"resource": "films", "params": params},
+            {"resource": "films", "params": {"id": 1, "fields": "title"}},
+        ]})
+
+        first, second = response.json()["responses"]
+        assert response.status_code == 200
+        assert first["status"] == 422
+        assert first["body"]["detail"][0]["loc"][0] == "params"
+        assert second["status"] == 200
+
+    def test_params_are_converted_like_the_query_string(self, client, routed_swapi):
+        """Test that string numbers and booleans are converted instead of taken at face value."""
+        response = client.post("/batch", json={"requests": [
+            {"resource": "films", "params": {"ids": [1, 2], "limit": "1", "all": "false", "fields": "title"}},
+        ]})
+
+        item = response.json()["responses"][0]
+        assert item["status"] == 200
+        assert item["body"] == [{"title": "A New Hope"}]
+        requested = [call.args[0] for call in routed_swapi.call_args_list]
+        assert not any("/people/" in url for url in requested)
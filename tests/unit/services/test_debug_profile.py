@@ -0,0 +1,105 @@
+"""Unit tests for the authenticated debug endpoints."""
+
+import pytest
+
+from app.infrastructure.profiling.slow_request_log import slow_log
+from app.interfaces.controls.debug.debug_controller import controller
+
+AUTH = {"Authorization": "Bearer s3cret"}
+
+
+@pytest.fixture
+def debug_token():
+    """Enables /debug/profile with a known token."""
+    previous = controller._token
+    controller._token = "s3cret"
+    yield
+    controller._token = previous
+
+
+class TestDebugProfile:
+    """Test suite for /debug/profile."""
+
+    def test_hidden_without_configured_token(self, client):
+        """Test that the endpoint does not exist unless a token is configured."""
+        response = client.get("/debug/profile?seconds=0.01", headers=AUTH)
+
+        assert response.status_code == 404
+
+    def test_rejects_wrong_token(self, client, debug_token):
+        """Test the bearer token check."""
+        response = client.get("/debug/profile?seconds=0.01", headers={"Authorization": "Bearer nope"})
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    def test_collapsed_cpu_profile(self, client, debug_token):
+        """Test the default collapsed-stack output."""
+        response = client.get("/debug/profile?seconds=0.05&idle=true", headers=AUTH)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        line = response.text.splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+    def test_speedscope_cpu_profile(self, client, debug_token):
+        """Test the speedscope JSON output."""
+        response = client.get("/debug/profile?seconds=0.05&format=speedscope&idle=true", headers=AUTH)
+
+        assert response.status_code == 200
+        document = response.json()
+        assert document["$schema"].startswith("https://www.speedscope.app/")
+        assert document["profiles"]
+
+    def test_allocation_mode_reports_caches(self, client, debug_token):
+        """Test the tracemalloc mode and the MemoryCache entry counts."""
+        response = client.get("/debug/profile?seconds=0.05&mode=alloc", headers=AUTH)
+
+        assert response.status_code == 200
+        report = response.json()
+        assert {"traced_bytes", "traced_peak_bytes", "top"} <= set(report)
+        assert "entries_after" in report["caches"]["payloads"]
+
+    @pytest.mark.parametrize("query", ["mode=heap", "format=pprof", "seconds=0", "seconds=120"])
+    def test_rejects_invalid_parameters(self, client, debug_token, query):
+        """Test validation of mode, format and duration."""
+        response = client.get(f"/debug/profile?{query}", headers=AUTH)
+
+        assert response.status_code in {400, 422}
+
+
+@pytest.fixture
+def slow_threshold():
+    """Logs every request as slow."""
+    previous = slow_log.threshold_seconds
+    slow_log.threshold_seconds = 0.0
+    yield
+    slow_log.threshold_seconds = previous
+
+
+class TestDebugSlow:
+    """Test suite for /debug/slow."""
+
+    def test_requires_token(self, client, debug_token):
+        """Test that the slow log shares the debug authentication."""
+        assert client.get("/debug/slow").status_code == 401
+
+    def test_lists_slow_requests_with_their_cost(
+        self, client, debug_token, slow_threshold, mock_requests_get, mock_swapi_response, sample_film_payload
+    ):
+        """Test that a slow lookup is listed with its shape and fan-out."""
+        mock_requests_get.side_effect = lambda url, params=None, timeout=None: mock_swapi_response(sample_film_payload)
+        client.get("/films/?id=1")
+        client.get("/films/?id=1")
+
+        response = client.get("/debug/slow?route=/films/", headers=AUTH)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["threshold_ms"] == 0.0
+        newest, oldest = body["requests"]
+        assert newest["shape"] == oldest["shape"] == "id=?"
+        assert oldest["upstream_calls"] == 1 and oldest["cache_hit_ratio"] == 0.0
+        assert newest["upstream_calls"] == 0 and newest["cache_hit_ratio"] == 1.0
+        assert "serialize" in newest["stages_ms"]
@@ -0,0 +1,74 @@
+"""Unit tests for multi-level relationship expansion (`expand=`)."""
+
+import pytest
+
+
+@pytest.fixture
+def routed_swapi(route_swapi, sample_film_payload, sample_person_payload, sample_planet_payload):
+    """Routes SWAPI detail URLs to fixture payloads."""
+    payloads = {
+        "https://swapi.dev/api/films/1/": sample_film_payload,
+        "https://swapi.dev/api/people/1/": {**sample_person_payload, "films": ["https://swapi.dev/api/films/1/"]},
+        "https://swapi.dev/api/people/2/": {
+            **sample_person_payload,
+            "name": "C-3PO",
+            "films": ["https://swapi.dev/api/films/1/"],
+            "url": "https://swapi.dev/api/people/2/",
+        },
+        "https://swapi.dev/api/planets/1/": sample_planet_payload,
+    }
+
+    return route_swapi(payloads)
+
+
+class TestExpansionEndpoints:
+    """Test suite for `expand=` on resource endpoints."""
+
+    def test_two_level_expansion_fetches_each_node_once(self, client, routed_swapi):
+        """Test film -> characters -> homeworld with a shared homeworld."""
+        response = client.get("/films/?id=1&expand=characters.homeworld")
+
+        assert response.status_code == 200
+        characters = response.json()[0]["characters"]
+        assert [person["name"] for person in characters] == ["Luke Skywalker", "C-3PO"]
+        assert all(person["homeworld"]["name"] == "Tatooine" for person in characters)
+        assert characters[0]["films"][0] == "https://swapi.dev/api/films/1/"
+
+        requested = [call.args[0] for call in routed_swapi.call_args_list]
+        assert sorted(requested) == sorted(set(requested))
+
+    def test_expansion_combined_with_fields(self, client, routed_swapi):
+        """Test that `fields=` selects attributes inside the expanded tree instead of dropping the expansion."""
+        response = client.get(
+            "/films/?id=1&expand=characters.homeworld&fields=title,characters.name,characters.homeworld.name"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{
+            "title": "A New Hope",
+            "characters": [
+                {"name": "Luke Skywalker", "homeworld": {"name": "Tatooine"}},
+                {"name": "C-3PO", "homeworld": {"name": "Tatooine"}},
+            ],
+        }]
+
+    def test_cycle_back_to_root_stays_a_reference(self, client, routed_swapi):
+        """Test that `characters.films` does not re-expand the root film."""
+        response = client.get("/films/?id=1&expand=characters.films")
+
+        assert response.status_code == 200
+        c3po = response.json()[0]["characters"][1]
+        assert c3po["films"] == ["https://swapi.dev/api/films/1/"]
+
+    def test_depth_limit_is_rejected(self, client, routed_swapi):
+        """Test that expansions deeper than the limit return 400."""
+        response = client.get("/films/?id=1&expand=characters.homeworld.residents.films")
+
+        assert response.status_code == 400
+
+    def test_unknown_relation_is_rejected(self, client, routed_swapi):
+        """Test that unknown relation names return 400."""
+        response = client.get("/films/?id=1&expand=characters.pilots")
+
+        assert response.status_code == 400
+        assert "characters.pilots" in response.json()["detail"]
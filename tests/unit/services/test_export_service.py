@@ -0,0 +1,124 @@
+"""Unit tests for the bulk export endpoints."""
+
+import gzip
+import io
+import json
+
+import numpy as np
+import pytest
+
+from app.application.services.export.export_service import ExportService
+
+
+@pytest.fixture(autouse=True)
+def clear_artifacts():
+    ExportService._artifacts.clear()
+    yield
+    ExportService._artifacts.clear()
+
+
+@pytest.fixture
+def routed_pages(
+    route_swapi,
+    sample_film_payload,
+    sample_person_payload,
+    sample_planet_payload,
+    sample_species_payload,
+    sample_starship_payload,
+    sample_vehicle_payload,
+):
+    """Serves one single-page list per resource."""
+    samples = {
+        "films": sample_film_payload,
+        "people": sample_person_payload,
+        "planets": sample_planet_payload,
+        "species": sample_species_payload,
+        "starships": sample_starship_payload,
+        "vehicles": sample_vehicle_payload,
+    }
+
+    def _page(url, params):
+        resource = url.rstrip("/").rsplit("/", 1)[-1]
+        results = [samples[resource]]
+        if resource == "planets":
+            results.append({**sample_planet_payload, "name": "Alderaan", "population": "2000000000", "url": "https://swapi.dev/api/planets/2/"})
+        return {"count": len(results), "next": None, "results": results}
+
+    return route_swapi(_page)
+
+
+class TestExportEndpoints:
+    """Test suite for /export/{resource}."""
+
+    def test_ndjson_export_contains_every_item(self, client, routed_pages):
+        """Test the gzip NDJSON dump of one resource."""
+        response = client.get("/export/planets")
+
+        assert response.status_code == 200
+        assert response.headers["content-disposition"].endswith('swapi-planets.ndjson.gz"')
+        rows = [json.loads(line) for line in gzip.decompress(response.content).splitlines()]
+        assert [row["name"] for row in rows] == ["Tatooine", "Alderaan"]
+        assert rows[0]["url"] == "https://swapi.dev/api/planets/1/"
+
+    def test_export_all_tags_each_row(self, client, routed_pages):
+        """Test that the full dump tags rows with their resource."""
+        response = client.get("/export/all")
+
+        rows = [json.loads(line) for line in gzip.decompress(response.content).splitlines()]
+        assert {row["resource"] for row in rows} == {"films", "people", "planets", "species", "starships", "vehicles"}
+
+    def test_npz_export_is_columnar(self, client, routed_pages):
+        """Test the NumPy columnar archive."""
+        response = client.get("/export/planets?format=npz")
+
+        archive = np.load(io.BytesIO(response.content))
+        assert archive["planets.population"].tolist() == [200000.0, 2000000000.0]
+        assert archive["planets.url"].tolist()[1] == "https://swapi.dev/api/planets/2/"
+
+    def test_npz_export_keeps_text_and_relationships(self, client, routed_pages, sample_planet_payload):
+        """Test that the archive is a full dump: text, raw numeric text and relationship lists."""
+        response = client.get("/export/planets?format=npz")
+
+        archive = np.load(io.BytesIO(response.content))
+        offsets = archive["planets.residents.offsets"]
+        residents = archive["planets.residents.values"].tolist()
+        assert archive["planets.name"].tolist() == ["Tatooine", "Alderaan"]
+        assert archive["planets.climate"].tolist()[0] == sample_planet_payload["climate"]
+        assert archive["planets.population.text"].tolist() == ["200000", "2000000000"]
+        assert residents[offsets[0]:offsets[1]] == sample_planet_payload["residents"]
+
+    def test_etag_revalidation_and_reuse(self, client, routed_pages):
+        """Test 304 on a matching ETag and that the artifact is built once per version."""
+        first = client.get("/export/planets")
+        artifact = ExportService._artifacts[("planets", "ndjson")]
+
+        second = client.get("/export/planets", headers={"If-None-Match": first.headers["etag"]})
+
+        assert second.status_code == 304
+        assert ExportService._artifacts[("planets", "ndjson")] is artifact
+
+    def test_weak_etag_matches_if_none_match(self, client, routed_pages):
+        """Test that a W/ tag added by an intermediary still revalidates (weak comparison)."""
+        etag = client.get("/export/planets").headers["etag"]
+
+        response = client.get("/export/planets", headers={"If-None-Match": f'"other", W/{etag}'})
+
+        assert response.status_code == 304
+
+    def test_range_requests_resume_downloads(self, client, routed_pages):
+        """Test that byte ranges reassemble into the full file."""
+        full = client.get("/export/all").content
+        etag = client.get("/export/all").headers["etag"]
+
+        head = client.get("/export/all", headers={"Range": "bytes=0-99"})
+        tail = client.get("/export/all", headers={"Range": "bytes=100-", "If-Range": etag})
+
+        assert head.status_code == 206 and tail.status_code == 206
+        assert tail.headers["content-range"] == f"bytes 100-{len(full) - 1}/{len(full)}"
+        assert head.content + tail.content == full
+        assert client.get("/export/all", headers={"Range": f"bytes={len(full)}-"}).status_code == 416
+
+    def test_unknown_resource_and_format(self, client, routed_pages):
+        """Test 404 for unknown resources and 400 for unknown formats."""
+        assert client.get("/export/droids").status_code == 404
+        assert client.get("/export/films?format=xml").status_code == 400
@@ -232,52 +232,46 @@ class TestFilmsService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_film_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.films.films_entity import FilmEntity
-
+    def test_select_payloads_order_ascending(self, sample_film_payload):
+        """Test ordering payloads in ascending order."""
         service = FilmsService()
-        entities = [
-            FilmEntity(title="C Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
-            FilmEntity(title="A Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
-            FilmEntity(title="B Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
+        payloads = [
+            {**sample_film_payload, "title": "C Film"},
+            {**sample_film_payload, "title": "A Film"},
+            {**sample_film_payload, "title": "B Film"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
-
-        assert ordered[0].title == "A Film"
-        assert ordered[1].title == "B Film"
-        assert ordered[2].title == "C Film"
+        ordered = service._select_payloads(payloads, FilmsQueryParams(order="asc"))
 
-    def test_order_entities_descending(self, sample_film_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.films.films_entity import FilmEntity
+        assert ordered[0]["title"] == "A Film"
+        assert ordered[1]["title"] == "B Film"
+        assert ordered[2]["title"] == "C Film"
 
+    def test_select_payloads_order_descending(self, sample_film_payload):
+        """Test ordering payloads in descending order."""
         service = FilmsService()
-        entities = [
-            FilmEntity(title="A Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
-            FilmEntity(title="C Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
-            FilmEntity(title="B Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
+        payloads = [
+            {**sample_film_payload, "title": "A Film"},
+            {**sample_film_payload, "title": "C Film"},
+            {**sample_film_payload, "title": "B Film"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
-
-        assert ordered[0].title == "C Film"
-        assert ordered[1].title == "B Film"
-        assert ordered[2].title == "A Film"
+        ordered = service._select_payloads(payloads, FilmsQueryParams(order="desc"))
 
-    def test_order_entities_invalid_order(self, sample_film_payload):
-        """Test that invalid order parameter returns unordered list."""
-        from app.domain.entities.films.films_entity import FilmEntity
+        assert ordered[0]["title"] == "C Film"
+        assert ordered[1]["title"] == "B Film"
+        assert ordered[2]["title"] == "A Film"
 
+    def test_select_payloads_invalid_order(self, sample_film_payload):
+        """Test that invalid order parameter leaves payloads unordered."""
         service = FilmsService()
-        entities = [
-            FilmEntity(title="B Film", **{k: v for k, v in sample_film_payload.items() if k != 'title'}),
+        payloads = [
+            {**sample_film_payload, "title": "B Film"},
         ]
 
-        ordered = service._order_entities(entities, "invalid")
+        ordered = service._select_payloads(payloads, FilmsQueryParams(order="invalid"))
 
-        assert ordered == entities
+        assert ordered == payloads
 
     def test_instance_payload(self, sample_film_payload):
         """Test creating FilmDTO from payload."""
@@ -288,3 +282,49 @@ class TestFilmsService:
         assert dto.episode_id == 4
         assert dto.director == "George Lucas"
         assert len(dto.characters) == 2
+
+
+class TestFilmsFieldSelection:
+    """Test suite for sparse fieldsets (`fields=`)."""
+
+    @pytest.mark.parametrize("param", ["min_release_date", "max_release_date"])
+    def test_invalid_release_date_is_rejected(self, client, mock_requests_get, param):
+        """Test that an unparseable date is a 400 naming the parameter, not an open bound."""
+        response = client.get(f"/films/?{param}=garbage")
+
+        assert response.status_code == 400
+        assert param in response.json()["detail"]
+        mock_requests_get.assert_not_called()
+
+    def test_fields_restrict_top_level_output(self, client, mock_requests_get, sample_film_payload):
+        """Test that only the selected attributes are emitted."""
+        mock_requests_get.return_value.json.return_value = sample_film_payload
+
+        response = client.get("/films/?id=1&fields=title,episode_id")
+
+        assert response.status_code == 200
+        assert response.json() == [{"title": "A New Hope", "episode_id": 4}]
+
+    def test_url_only_relationship_needs_no_fetch(self, client, mock_requests_get, sample_film_payload):
+        """Test that `characters.url` is answered from the film payload alone."""
+        mock_requests_get.return_value.json.return_value = sample_film_payload
+
+        response = client.get("/films/?id=1&characters=true&fields=title,characters.url")
+
+        assert response.status_code == 200
+        assert response.json() == [{
+            "title": "A New Hope",
+            "characters": [{"url": url} for url in sample_film_payload["characters"]],
+        }]
+        assert mock_requests_get.call_count == 1
+
+    def test_nested_fields_hydrate_only_that_relationship(self, client, route_swapi, sample_film_payload, sample_person_payload):
+        """Test that `characters.name` hydrates characters and skips other relations."""
+        routed = route_swapi(lambda url, params: sample_person_payload if "/people/" in url else sample_film_payload)
+
+        response = client.get("/films/?id=1&all=true&fields=title,characters.name")
+
+        assert response.status_code == 200
+        assert response.json() == [{"title": "A New Hope", "characters": [{"name": "Luke Skywalker"}] * 2}]
+        requested = [call.args[0] for call in routed.call_args_list]
+        assert not any("/planets/" in url or "/starships/" in url for url in requested)
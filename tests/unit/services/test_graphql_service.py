@@ -0,0 +1,108 @@
+"""Unit tests for the GraphQL endpoint."""
+
+import hashlib
+
+import pytest
+from unittest.mock import patch
+
+from app.application.services.graphql.graphql_service import GraphQLService
+
+
+@pytest.fixture(autouse=True)
+def clear_documents():
+    GraphQLService._documents.clear()
+    yield
+    GraphQLService._documents.clear()
+
+
+@pytest.fixture
+def routed_swapi(route_swapi, sample_film_payload, sample_person_payload, sample_planet_payload):
+    """Routes SWAPI detail URLs to fixture payloads."""
+    payloads = {
+        "https://swapi.dev/api/films/1/": sample_film_payload,
+        "https://swapi.dev/api/people/1/": sample_person_payload,
+        "https://swapi.dev/api/people/2/": {**sample_person_payload, "name": "C-3PO", "url": "https://swapi.dev/api/people/2/"},
+        "https://swapi.dev/api/planets/1/": sample_planet_payload,
+    }
+
+    return route_swapi(payloads)
+
+
+class TestGraphQLEndpoints:
+    """Test suite for /graphql."""
+
+    def test_nested_selection_fetches_each_node_once(self, client, routed_swapi):
+        """Test film -> characters -> homeworld with batched, deduplicated loads."""
+        query = "{ film(id: 1) { id title characters { name homeworld { name } } } }"
+
+        response = client.post("/graphql", json={"query": query})
+
+        assert response.status_code == 200
+        film = response.json()["data"]["film"]
+        assert film["id"] == 1
+        assert [person["name"] for person in film["characters"]] == ["Luke Skywalker", "C-3PO"]
+        assert film["characters"][1]["homeworld"] == {"name": "Tatooine"}
+        requested = [call.args[0] for call in routed_swapi.call_args_list]
+        assert sorted(requested) == sorted(set(requested))
+
+    def test_query_over_cost_limit_is_rejected(self, client, routed_swapi):
+        """Test that deeply nested list selections are refused before execution."""
+        query = "{ allFilms { characters { films { characters { films { title } } } } } }"
+
+        response = client.post("/graphql", json={"query": query})
+
+        assert response.json()["errors"][0]["extensions"]["code"] == "QUERY_TOO_COSTLY"
+        routed_swapi.assert_not_called()
+
+    @pytest.mark.parametrize("limit", [0, -3])
+    def test_limit_below_one_is_rejected(self, client, routed_swapi, limit):
+        """Test that zero or negative limits are refused before pricing and execution."""
+        response = client.post("/graphql", json={"query": f"{{ allPeople(limit: {limit}) {{ name }} }}"})
+
+        assert response.json()["data"] is None
+        assert response.json()["errors"][0]["extensions"]["code"] == "BAD_USER_INPUT"
+        routed_swapi.assert_not_called()
+
+    def test_negative_limit_variable_cannot_offset_cost(self, client, routed_swapi):
+        """Test that a negative limit in a variable is rejected instead of lowering the query cost."""
+        query = (
+            "query ($n: Int) { allPeople(limit: $n) { name } "
+            "allFilms(limit: 1000) { characters { films { title } } } }"
+        )
+
+        response = client.post("/graphql", json={"query": query, "variables": {"n": -100000}})
+
+        assert response.json()["errors"][0]["extensions"]["code"] == "BAD_USER_INPUT"
+        routed_swapi.assert_not_called()
+
+    def test_real_limit_is_priced(self):
+        """Test that the cost uses the requested limit rather than a clamped one."""
+        from graphql import parse
+        from app.interfaces.graphql.query_cost import query_cost
+        from app.interfaces.graphql.swapi_schema import swapi_schema
+
+        assert query_cost(swapi_schema, parse("{ allPeople(limit: 7) { name } }")) == 8
+
+    def test_validation_errors_are_reported(self, client, routed_swapi):
+        """Test that unknown fields return GraphQL errors."""
+        response = client.post("/graphql", json={"query": "{ film(id: 1) { pilots { name } } }"})
+
+        assert response.status_code == 200
+        assert response.json()["data"] is None
+        assert "pilots" in response.json()["errors"][0]["message"]
+
+    def test_persisted_query_skips_parsing(self, client, routed_swapi):
+        """Test the persisted query protocol: miss, register, then hash-only hits."""
+        query = "{ film(id: 1) { title } }"
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode()).hexdigest()}}
+
+        miss = client.post("/graphql", json={"extensions": extensions})
+        assert miss.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+        registered = client.post("/graphql", json={"query": query, "extensions": extensions})
+        assert registered.json()["data"] == {"film": {"title": "A New Hope"}}
+
+        with patch("app.application.services.graphql.graphql_service.parse") as parse:
+            hit = client.get("/graphql", params={"extensions": '{"persistedQuery": {"version": 1, "sha256Hash": "%s"}}' % extensions["persistedQuery"]["sha256Hash"]})
+        assert hit.json()["data"] == {"film": {"title": "A New Hope"}}
+        parse.assert_not_called()
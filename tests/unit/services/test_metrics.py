@@ -0,0 +1,94 @@
+"""Unit tests for the /metrics endpoint and its instrumentation."""
+
+from unittest.mock import Mock
+
+from app.domain.fields.field_selection import parse_fields
+from app.infrastructure.metrics import swapi_metrics
+from app.infrastructure.metrics.swapi_metrics import REQUEST_FANOUT, expansion_label
+
+
+def _respond(payload, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.raise_for_status = Mock()
+    response.json.return_value = payload
+    return response
+
+
+class TestMetricsEndpoint:
+    """Test suite for /metrics."""
+
+    def test_metrics_use_prometheus_text_format(self, client):
+        """Test the content type and the presence of the gateway metrics."""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE swapi_request_duration_seconds histogram" in response.text
+        assert "# TYPE swapi_cache_entries gauge" in response.text
+
+    def test_request_upstream_and_cache_are_recorded(self, client, mock_requests_get, sample_planet_payload):
+        """Test that a lookup is reflected in route, upstream and cache metrics."""
+        mock_requests_get.return_value = _respond(sample_planet_payload)
+
+        client.get("/planets/?id=1")
+        client.get("/planets/?id=1")
+        text = client.get("/metrics").text
+
+        assert 'swapi_request_duration_seconds_count{route="/planets/",expand=""} 2' in text
+        assert 'swapi_upstream_requests_total{resource="planets",status="200"} 1' in text
+        assert 'swapi_upstream_request_duration_seconds_count{resource="planets"} 1' in text
+        assert 'swapi_cache_entries{cache="payloads"} 1' in text
+
+    def test_fanout_counts_lookups_and_upstream_calls_per_request(self, client, route_swapi, sample_person_payload, sample_film_payload):
+        """Test that hydration fan-out, including executor threads, is attributed to the request."""
+        route_swapi(lambda url, params: sample_film_payload if "/films/" in url else sample_person_payload)
+
+        client.get("/people/?id=1&films=true")
+
+        lookups, _, count = REQUEST_FANOUT.snapshot("/people/", "lookups")
+        upstream, _, _ = REQUEST_FANOUT.snapshot("/people/", "upstream")
+        assert count == 1
+        # 1 pessoa + 2 filmes: o bucket "2" ainda não contém a requisição, o bucket "5" contém
+        assert (lookups[2], lookups[3]) == (0, 1)
+        assert (upstream[2], upstream[3]) == (0, 1)
+
+    def test_upstream_errors_are_labelled_by_status(self, client, mock_requests_get):
+        """Test that failed SWAPI calls are counted with their status."""
+        import requests
+
+        response = _respond({}, status_code=404)
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        mock_requests_get.return_value = response
+
+        client.get("/films/?id=99")
+
+        assert 'swapi_upstream_requests_total{resource="films",status="404"} 1' in client.get("/metrics").text
+
+    def test_expansion_label_is_canonical(self):
+        """Test that equivalent expand plans share one label value."""
+        plan = parse_fields("planets, characters.homeworld, characters")
+
+        assert expansion_label(plan) == expansion_label(parse_fields("characters.homeworld,planets"))
+        assert expansion_label(plan) == "characters.homeworld,planets"
+        assert expansion_label(None) == ""
+
+    def test_rejected_expansions_share_the_invalid_label(self, client):
+        """Test that expand values rejected with 400 do not create a series each."""
+        for index in range(3):
+            assert client.get(f"/films/?expand=bogus{index}").status_code == 400
+
+        text = client.get("/metrics").text
+
+        assert 'swapi_request_duration_seconds_count{route="/films/",expand="invalid"} 3' in text
+        assert "bogus" not in text
+
+    def test_distinct_expansion_labels_are_capped(self, monkeypatch):
+        """Test that plans beyond the label limit are recorded as other."""
+        monkeypatch.setattr(swapi_metrics, "_expansion_labels", set())
+        monkeypatch.setattr(swapi_metrics, "MAX_EXPANSION_LABELS", 2)
+
+        assert expansion_label(parse_fields("planets")) == "planets"
+        assert expansion_label(parse_fields("characters")) == "characters"
+        assert expansion_label(parse_fields("species")) == "other"
+        assert expansion_label(parse_fields("planets")) == "planets"
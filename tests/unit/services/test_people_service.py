@@ -109,6 +109,30 @@ class TestPeopleEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
+    @pytest.mark.asyncio
+    async def test_get_people_without_homeworld_flag_skips_lookup(self, client, mock_requests_get, sample_person_payload):
+        """Test that a plain list costs one upstream call and keeps homeworld as a URL."""
+        mock_requests_get.return_value.json.return_value = {
+            "results": [sample_person_payload]
+        }
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        response = client.get("/people/")
+
+        assert response.status_code == 200
+        assert response.json()[0]["homeworld"] == "https://swapi.dev/api/planets/1/"
+        assert mock_requests_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_person_with_homeworld(self, client, route_swapi, sample_person_payload, sample_planet_payload):
+        """Test getting person with homeworld details."""
+        route_swapi(lambda url, params: sample_planet_payload if "/planets/" in url else sample_person_payload)
+
+        response = client.get("/people/?id=1&homeworld=true")
+
+        assert response.status_code == 200
+        assert response.json()[0]["homeworld"]["name"] == "Tatooine"
+
     @pytest.mark.asyncio
     async def test_get_people_with_order_asc(self, client, mock_requests_get, sample_person_payload):
         """Test getting people ordered ascending by name."""
@@ -255,39 +279,35 @@ class TestPeopleService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_person_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.people.people_entity import PeopleEntity
-
+    def test_select_payloads_order_ascending(self, sample_person_payload):
+        """Test ordering payloads in ascending order."""
         service = PeopleService()
-        entities = [
-            PeopleEntity(name="C Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
-            PeopleEntity(name="A Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
-            PeopleEntity(name="B Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_person_payload, "name": "C Person"},
+            {**sample_person_payload, "name": "A Person"},
+            {**sample_person_payload, "name": "B Person"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
+        ordered = service._select_payloads(payloads, PeopleQueryParams(order="asc"))
 
-        assert ordered[0].name == "A Person"
-        assert ordered[1].name == "B Person"
-        assert ordered[2].name == "C Person"
-
-    def test_order_entities_descending(self, sample_person_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.people.people_entity import PeopleEntity
+        assert ordered[0]["name"] == "A Person"
+        assert ordered[1]["name"] == "B Person"
+        assert ordered[2]["name"] == "C Person"
 
+    def test_select_payloads_order_descending(self, sample_person_payload):
+        """Test ordering payloads in descending order."""
         service = PeopleService()
-        entities = [
-            PeopleEntity(name="A Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
-            PeopleEntity(name="C Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
-            PeopleEntity(name="B Person", **{k: v for k, v in sample_person_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_person_payload, "name": "A Person"},
+            {**sample_person_payload, "name": "C Person"},
+            {**sample_person_payload, "name": "B Person"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
+        ordered = service._select_payloads(payloads, PeopleQueryParams(order="desc"))
 
-        assert ordered[0].name == "C Person"
-        assert ordered[1].name == "B Person"
-        assert ordered[2].name == "A Person"
+        assert ordered[0]["name"] == "C Person"
+        assert ordered[1]["name"] == "B Person"
+        assert ordered[2]["name"] == "A Person"
 
     def test_instance_payload(self, sample_person_payload):
         """Test creating PersonDTO from payload."""
@@ -299,3 +319,66 @@ class TestPeopleService:
         assert dto.mass == "77"
         assert dto.gender == "male"
         assert len(dto.films) == 2
+
+
+class TestPeopleJoinFilters:
+    """Test suite for graph-backed join filters on /people/."""
+
+    @pytest.fixture
+    def swapi_dataset(self, route_swapi, sample_person_payload, sample_film_payload, sample_planet_payload):
+        base = "https://swapi.dev/api"
+        pages = {
+            "people": [
+                sample_person_payload,
+                {**sample_person_payload, "name": "Owen Lars", "url": f"{base}/people/6/", "films": [f"{base}/films/2/"]},
+                {**sample_person_payload, "name": "Leia Organa", "url": f"{base}/people/5/", "homeworld": f"{base}/planets/2/"},
+            ],
+            "films": [sample_film_payload],
+            "planets": [sample_planet_payload],
+        }
+
+        def _resolve(url, params):
+            path = url.split("/api/", 1)[1].strip("/").split("/")
+            results = pages.get(path[0], [])
+            if len(path) > 1:
+                return next((item for item in results if item["url"] == url), None)
+            return {"count": len(results), "next": None, "results": results}
+
+        return route_swapi(_resolve)
+
+    def test_homeworld_and_film_join(self, client, swapi_dataset):
+        """Test people whose homeworld is planet 1 and who appear in film 1."""
+        response = client.get("/people/?homeworld_id=1&film_id=1")
+
+        assert response.status_code == 200
+        assert [person["name"] for person in response.json()] == ["Luke Skywalker"]
+
+    def test_graph_is_rebuilt_only_when_the_dataset_changes(self, client, swapi_dataset, sample_planet_payload, monkeypatch):
+        """Test that cached or refetched-but-equal pages reuse the graph and an upstream edit rebuilds it."""
+        from app.application.services.base_service import BaseSwapiService
+        from app.application.services.dataset.dataset_service import DatasetService
+        from app.infrastructure.graph.relationship_graph import RelationshipGraph
+
+        builds, fingerprints = [], []
+        build, version_of = RelationshipGraph.build.__func__, DatasetService.version_of
+        monkeypatch.setattr(RelationshipGraph, "build", classmethod(lambda cls, dataset: builds.append(1) or build(cls, dataset)))
+        monkeypatch.setattr(DatasetService, "version_of", staticmethod(lambda payloads: fingerprints.append(1) or version_of(payloads)))
+
+        client.get("/people/?homeworld_id=1")
+        fingerprinted = len(fingerprints)
+        client.get("/people/?homeworld_id=1&film_id=1")
+        assert len(fingerprints) == fingerprinted
+        BaseSwapiService._cache.clear()
+        client.get("/people/?homeworld_id=1")
+        assert len(builds) == 1
+
+        BaseSwapiService._cache.clear()
+        sample_planet_payload["edited"] = "2015-01-01T00:00:00Z"
+        client.get("/people/?homeworld_id=1")
+        assert len(builds) == 2
+
+    def test_join_combined_with_name_search(self, client, swapi_dataset):
+        """Test that the search term is applied to graph results."""
+        response = client.get("/people/?homeworld_id=1&name=owen")
+
+        assert [person["name"] for person in response.json()] == ["Owen Lars"]
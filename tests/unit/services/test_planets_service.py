@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock
 from app.application.services.planets.planets_service import PlanetsService
+from app.domain.keys.resource_key import api_root, set_api_root
 from app.interfaces.query_params.planets.planets_query_params import PlanetsQueryParams
 
 
@@ -35,6 +36,20 @@ class TestPlanetsEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
+    def test_api_root_is_read_per_request(self, client, mock_requests_get, sample_planet_payload):
+        """Test that set_api_root also redirects the controller lookups."""
+        mock_requests_get.return_value.json.return_value = sample_planet_payload
+        mock_requests_get.return_value.raise_for_status = Mock()
+        previous = api_root()
+        set_api_root("http://mirror.local/api")
+        try:
+            response = client.get("/planets/?id=1")
+        finally:
+            set_api_root(previous)
+
+        assert response.status_code == 200
+        assert mock_requests_get.call_args.args[0] == "http://mirror.local/api/planets/1/"
+
     @pytest.mark.asyncio
     async def test_get_planet_by_name_search(self, client, mock_requests_get, sample_planet_payload):
         """Test searching planets by name."""
@@ -231,39 +246,35 @@ class TestPlanetsService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_planet_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.planets.planets_entity import PlanetEntity
-
+    def test_select_payloads_order_ascending(self, sample_planet_payload):
+        """Test ordering payloads in ascending order."""
         service = PlanetsService()
-        entities = [
-            PlanetEntity(name="C Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
-            PlanetEntity(name="A Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
-            PlanetEntity(name="B Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_planet_payload, "name": "C Planet"},
+            {**sample_planet_payload, "name": "A Planet"},
+            {**sample_planet_payload, "name": "B Planet"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
+        ordered = service._select_payloads(payloads, PlanetsQueryParams(order="asc"))
 
-        assert ordered[0].name == "A Planet"
-        assert ordered[1].name == "B Planet"
-        assert ordered[2].name == "C Planet"
-
-    def test_order_entities_descending(self, sample_planet_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.planets.planets_entity import PlanetEntity
+        assert ordered[0]["name"] == "A Planet"
+        assert ordered[1]["name"] == "B Planet"
+        assert ordered[2]["name"] == "C Planet"
 
+    def test_select_payloads_order_descending(self, sample_planet_payload):
+        """Test ordering payloads in descending order."""
         service = PlanetsService()
-        entities = [
-            PlanetEntity(name="A Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
-            PlanetEntity(name="C Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
-            PlanetEntity(name="B Planet", **{k: v for k, v in sample_planet_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_planet_payload, "name": "A Planet"},
+            {**sample_planet_payload, "name": "C Planet"},
+            {**sample_planet_payload, "name": "B Planet"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
+        ordered = service._select_payloads(payloads, PlanetsQueryParams(order="desc"))
 
-        assert ordered[0].name == "C Planet"
-        assert ordered[1].name == "B Planet"
-        assert ordered[2].name == "A Planet"
+        assert ordered[0]["name"] == "C Planet"
+        assert ordered[1]["name"] == "B Planet"
+        assert ordered[2]["name"] == "A Planet"
 
     def test_instance_payload(self, sample_planet_payload):
         """Test creating PlanetDTO from payload."""
@@ -275,3 +286,85 @@ class TestPlanetsService:
         assert dto.terrain == "desert"
         assert dto.population == "200000"
         assert len(dto.residents) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_entities_filters_and_orders_by_population(self, mock_requests_get, sample_planet_payload):
+        """Test numeric range filters and order_by on parsed population."""
+        planets = [
+            {**sample_planet_payload, "name": "Small", "population": "1,000", "url": "https://swapi.dev/api/planets/2/"},
+            {**sample_planet_payload, "name": "Unknown", "population": "unknown", "url": "https://swapi.dev/api/planets/3/"},
+            {**sample_planet_payload, "name": "Big", "population": "2000000000", "url": "https://swapi.dev/api/planets/4/"},
+            {**sample_planet_payload, "name": "Medium", "population": "200000", "url": "https://swapi.dev/api/planets/5/"},
+        ]
+        mock_requests_get.return_value.json.return_value = {"results": planets}
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        service = PlanetsService()
+        query_params = PlanetsQueryParams(order_by="population", order="desc", min_population=1000, max_population=1e9)
+
+        entities = await service.create_entities("https://swapi.dev/api/planets/", query_params)
+
+        assert [planet.name for planet in entities] == ["Medium", "Small"]
+
+    @pytest.mark.asyncio
+    async def test_table_cached_only_for_cached_pages(self, mock_requests_get, sample_planet_payload):
+        """Test that ordered page lists reuse their table while single-id lists build a throwaway one."""
+        from app.application.services.base_service import BaseSwapiService
+
+        mock_requests_get.return_value.json.return_value = {"results": [sample_planet_payload]}
+        mock_requests_get.return_value.raise_for_status = Mock()
+        service = PlanetsService()
+        hits = BaseSwapiService._table_cache.hits
+
+        await service.create_entities("https://swapi.dev/api/planets/", PlanetsQueryParams(order_by="name"))
+        await service.create_entities("https://swapi.dev/api/planets/", PlanetsQueryParams(order_by="name"))
+
+        assert len(BaseSwapiService._table_cache) == 1
+        assert BaseSwapiService._table_cache.hits == hits + 1
+
+        mock_requests_get.return_value.json.return_value = sample_planet_payload
+        for _ in range(3):
+            await service.create_entities("https://swapi.dev/api/planets/1/", PlanetsQueryParams(order_by="name"))
+
+        assert len(BaseSwapiService._table_cache) == 1
+
+    def test_order_by_field_puts_unknown_values_last(self, sample_planet_payload):
+        """Test that unparseable values sort after known ones in both directions."""
+        service = PlanetsService()
+        payloads = [
+            {**sample_planet_payload, "name": "A", "diameter": "unknown", "url": "https://swapi.dev/api/planets/11/"},
+            {**sample_planet_payload, "name": "B", "diameter": "12,500", "url": "https://swapi.dev/api/planets/12/"},
+            {**sample_planet_payload, "name": "C", "diameter": "4900", "url": "https://swapi.dev/api/planets/13/"},
+        ]
+
+        ascending = service._select_payloads(payloads, PlanetsQueryParams(order="asc", order_by="diameter"))
+        descending = service._select_payloads(payloads, PlanetsQueryParams(order="desc", order_by="diameter"))
+
+        assert [planet["name"] for planet in ascending] == ["C", "B", "A"]
+        assert [planet["name"] for planet in descending] == ["B", "C", "A"]
+
+    def test_order_by_unknown_field_keeps_order(self, sample_planet_payload):
+        """Test that an unsupported order_by field leaves payloads untouched."""
+        service = PlanetsService()
+        payloads = [sample_planet_payload]
+
+        assert service._select_payloads(payloads, PlanetsQueryParams(order="asc", order_by="not_a_field")) == payloads
+
+    @pytest.mark.asyncio
+    async def test_create_entities_top_k_hydrates_only_selected(self, mock_requests_get, sample_planet_payload):
+        """Test climate match, multi-key order and limit before hydration."""
+        planets = [
+            {**sample_planet_payload, "name": "Alpha", "climate": "arid", "diameter": "10", "url": "https://swapi.dev/api/planets/2/"},
+            {**sample_planet_payload, "name": "Beta", "climate": "temperate", "diameter": "30", "url": "https://swapi.dev/api/planets/3/"},
+            {**sample_planet_payload, "name": "Gamma", "climate": "arid, temperate", "diameter": "30", "url": "https://swapi.dev/api/planets/4/"},
+            {**sample_planet_payload, "name": "Delta", "climate": "arid", "diameter": "20", "url": "https://swapi.dev/api/planets/5/"},
+        ]
+        mock_requests_get.return_value.json.return_value = {"results": planets}
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        service = PlanetsService()
+        query_params = PlanetsQueryParams(climate="arid", order_by="-diameter,name", limit=2)
+
+        entities = await service.create_entities("https://swapi.dev/api/planets/", query_params)
+
+        assert [planet.name for planet in entities] == ["Gamma", "Delta"]
@@ -0,0 +1,71 @@
+"""Unit tests for the predictive prefetch of related resources."""
+
+import pytest
+
+from app.application.services.films.films_service import FilmsService
+
+
+@pytest.fixture
+def routed_details(route_swapi, sample_person_payload, sample_film_payload, sample_planet_payload):
+    """Serves detail payloads for a few people, films and one planet."""
+    base = "https://swapi.dev/api"
+    details = {
+        f"{base}/people/1/": sample_person_payload,
+        f"{base}/people/2/": {**sample_person_payload, "name": "C-3PO", "url": f"{base}/people/2/", "films": [f"{base}/films/3/"]},
+        f"{base}/planets/1/": sample_planet_payload,
+    }
+    for film_id in (1, 2, 3):
+        details[f"{base}/films/{film_id}/"] = {**sample_film_payload, "episode_id": film_id, "url": f"{base}/films/{film_id}/"}
+
+    return route_swapi(details)
+
+
+class TestPredictivePrefetch:
+    """Test suite for co-access driven prefetch after responses."""
+
+    def test_no_prefetch_without_history(self, client, routed_details):
+        """Test that nothing is prefetched before any co-access is observed."""
+        client.get("/people/?id=1")
+
+        requested = [call.args[0] for call in routed_details.call_args_list]
+        assert "https://swapi.dev/api/films/1/" not in requested
+
+    def test_learned_relation_is_prefetched_after_response(self, client, routed_details):
+        """Test that films follow-ups are learned and prefetched for the next person."""
+        for _ in range(3):
+            client.get("/people/?id=1")
+            client.get("/films/?id=1")
+            client.get("/films/?id=2")
+
+        response = client.get("/people/?id=2")
+        assert response.status_code == 200
+        requested = [call.args[0] for call in routed_details.call_args_list]
+        assert requested[-1] == "https://swapi.dev/api/films/3/"
+
+        routed_details.reset_mock()
+        film = client.get("/films/?id=3")
+
+        assert film.status_code == 200
+        assert film.json()[0]["episode_id"] == 3
+        routed_details.assert_not_called()
+
+    def test_unlikely_relations_are_not_prefetched(self, client, routed_details):
+        """Test that relations that are never followed stay cold."""
+        for _ in range(3):
+            client.get("/people/?id=1")
+            client.get("/films/?id=1")
+
+        requested = [call.args[0] for call in routed_details.call_args_list]
+        assert not any("/vehicles/" in url or "/starships/" in url for url in requested)
+
+    def test_internal_resolutions_are_not_co_accesses(self, client, routed_details):
+        """Test that only client lookups, not hydration or warm-up resolutions, teach the prefetch."""
+        for _ in range(3):
+            client.get("/people/?id=1")
+            FilmsService().resolve_url("https://swapi.dev/api/films/1/")
+            FilmsService().resolve_url("https://swapi.dev/api/films/2/")
+
+        client.get("/people/?id=2")
+
+        requested = [call.args[0] for call in routed_details.call_args_list]
+        assert "https://swapi.dev/api/films/3/" not in requested
@@ -0,0 +1,64 @@
+"""Unit tests for the Server-Timing header and the request profile."""
+
+import json
+
+import pytest
+
+from app.infrastructure.profiling.request_profile import RequestProfile
+
+
+@pytest.fixture
+def routed_film(route_swapi, sample_film_payload, sample_person_payload):
+    """Serves one film and any person it links to."""
+    return route_swapi(lambda url, params: sample_film_payload if "/films/" in url else sample_person_payload)
+
+
+class TestServerTiming:
+    """Test suite for the profiling middleware."""
+
+    def test_headers_are_opt_in(self, client, routed_film):
+        """Test that responses carry no profile unless asked."""
+        response = client.get("/films/?id=1")
+
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+        assert "x-request-profile" not in response.headers
+
+    def test_profile_reports_upstream_cache_and_stages(self, client, routed_film):
+        """Test the breakdown of a hydrated lookup from a cold cache."""
+        response = client.get("/films/?id=1&characters=true", headers={"X-Debug-Profile": "1"})
+
+        assert response.status_code == 200
+        timing = response.headers["server-timing"]
+        assert 'upstream;dur=' in timing and 'desc="3 calls"' in timing
+        assert 'cache;desc="hits=0 misses=3"' in timing
+        assert "total;dur=" in timing
+
+        profile = json.loads(response.headers["x-request-profile"])
+        assert profile["upstream"]["calls"] == 3
+        assert profile["cache"] == {"lookups": 3, "hits": 0, "misses": 3}
+        assert set(profile["stages_ms"]) == {"build", "hydrate", "serialize"}
+
+    def test_warm_request_is_served_from_cache(self, client, routed_film):
+        """Test that a repeated lookup reports only cache hits."""
+        client.get("/films/?id=1&characters=true")
+
+        response = client.get("/films/?id=1&characters=true", headers={"X-Debug-Profile": "true"})
+
+        profile = json.loads(response.headers["x-request-profile"])
+        assert profile["upstream"]["calls"] == 0
+        assert profile["cache"]["hits"] == 3
+        assert profile["cache"]["misses"] == 0
+
+    def test_server_timing_format(self):
+        """Test the header syntax: comma-separated metrics with dur/desc parameters."""
+        profile = RequestProfile()
+        profile.upstream_calls = 2
+        profile.upstream_seconds = 0.25
+        profile.stages["hydrate"] = 0.1
+
+        entries = [entry.strip() for entry in profile.server_timing().split(",")]
+
+        assert entries[0] == 'upstream;dur=250.0;desc="2 calls"'
+        assert entries[2] == "hydrate;dur=100.0"
+        assert entries[-1].startswith("total;dur=")
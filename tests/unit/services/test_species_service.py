@@ -85,6 +85,30 @@ class TestSpeciesEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
+    @pytest.mark.asyncio
+    async def test_get_species_without_homeworld_flag_skips_lookup(self, client, mock_requests_get, sample_species_payload):
+        """Test that a plain list costs one upstream call and keeps homeworld as a URL."""
+        mock_requests_get.return_value.json.return_value = {
+            "results": [sample_species_payload]
+        }
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        response = client.get("/species/")
+
+        assert response.status_code == 200
+        assert response.json()[0]["homeworld"] == "https://swapi.dev/api/planets/9/"
+        assert mock_requests_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_species_with_homeworld(self, client, route_swapi, sample_species_payload, sample_planet_payload):
+        """Test getting species with homeworld details."""
+        route_swapi(lambda url, params: sample_planet_payload if "/planets/" in url else sample_species_payload)
+
+        response = client.get("/species/?id=1&homeworld=true")
+
+        assert response.status_code == 200
+        assert response.json()[0]["homeworld"]["name"] == "Tatooine"
+
     @pytest.mark.asyncio
     async def test_get_species_with_order_asc(self, client, mock_requests_get, sample_species_payload):
         """Test getting species ordered ascending by name."""
@@ -231,39 +255,35 @@ class TestSpeciesService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_species_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.species.species_entity import SpeciesEntity
-
+    def test_select_payloads_order_ascending(self, sample_species_payload):
+        """Test ordering payloads in ascending order."""
         service = SpeciesService()
-        entities = [
-            SpeciesEntity(name="C Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
-            SpeciesEntity(name="A Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
-            SpeciesEntity(name="B Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_species_payload, "name": "C Species"},
+            {**sample_species_payload, "name": "A Species"},
+            {**sample_species_payload, "name": "B Species"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
-
-        assert ordered[0].name == "A Species"
-        assert ordered[1].name == "B Species"
-        assert ordered[2].name == "C Species"
+        ordered = service._select_payloads(payloads, SpeciesQueryParams(order="asc"))
 
-    def test_order_entities_descending(self, sample_species_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.species.species_entity import SpeciesEntity
+        assert ordered[0]["name"] == "A Species"
+        assert ordered[1]["name"] == "B Species"
+        assert ordered[2]["name"] == "C Species"
 
+    def test_select_payloads_order_descending(self, sample_species_payload):
+        """Test ordering payloads in descending order."""
         service = SpeciesService()
-        entities = [
-            SpeciesEntity(name="A Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
-            SpeciesEntity(name="C Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
-            SpeciesEntity(name="B Species", **{k: v for k, v in sample_species_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_species_payload, "name": "A Species"},
+            {**sample_species_payload, "name": "C Species"},
+            {**sample_species_payload, "name": "B Species"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
+        ordered = service._select_payloads(payloads, SpeciesQueryParams(order="desc"))
 
-        assert ordered[0].name == "C Species"
-        assert ordered[1].name == "B Species"
-        assert ordered[2].name == "A Species"
+        assert ordered[0]["name"] == "C Species"
+        assert ordered[1]["name"] == "B Species"
+        assert ordered[2]["name"] == "A Species"
 
     def test_instance_payload(self, sample_species_payload):
         """Test creating SpeciesDTO from payload."""
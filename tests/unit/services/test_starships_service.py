@@ -254,39 +254,35 @@ class TestStarshipsService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_starship_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.starships.starships_entity import StarshipEntity
-
+    def test_select_payloads_order_ascending(self, sample_starship_payload):
+        """Test ordering payloads in ascending order."""
         service = StarshipsService()
-        entities = [
-            StarshipEntity(name="C Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
-            StarshipEntity(name="A Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
-            StarshipEntity(name="B Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_starship_payload, "name": "C Starship"},
+            {**sample_starship_payload, "name": "A Starship"},
+            {**sample_starship_payload, "name": "B Starship"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
-
-        assert ordered[0].name == "A Starship"
-        assert ordered[1].name == "B Starship"
-        assert ordered[2].name == "C Starship"
+        ordered = service._select_payloads(payloads, StarshipsQueryParams(order="asc"))
 
-    def test_order_entities_descending(self, sample_starship_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.starships.starships_entity import StarshipEntity
+        assert ordered[0]["name"] == "A Starship"
+        assert ordered[1]["name"] == "B Starship"
+        assert ordered[2]["name"] == "C Starship"
 
+    def test_select_payloads_order_descending(self, sample_starship_payload):
+        """Test ordering payloads in descending order."""
         service = StarshipsService()
-        entities = [
-            StarshipEntity(name="A Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
-            StarshipEntity(name="C Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
-            StarshipEntity(name="B Starship", **{k: v for k, v in sample_starship_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_starship_payload, "name": "A Starship"},
+            {**sample_starship_payload, "name": "C Starship"},
+            {**sample_starship_payload, "name": "B Starship"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
+        ordered = service._select_payloads(payloads, StarshipsQueryParams(order="desc"))
 
-        assert ordered[0].name == "C Starship"
-        assert ordered[1].name == "B Starship"
-        assert ordered[2].name == "A Starship"
+        assert ordered[0]["name"] == "C Starship"
+        assert ordered[1]["name"] == "B Starship"
+        assert ordered[2]["name"] == "A Starship"
 
     def test_instance_payload(self, sample_starship_payload):
         """Test creating StarshipDTO from payload."""
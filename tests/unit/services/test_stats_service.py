@@ -0,0 +1,78 @@
+"""Unit tests for Stats endpoints."""
+
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture
+def planets_page(sample_planet_payload):
+    return {
+        "count": 4,
+        "next": None,
+        "results": [
+            {**sample_planet_payload, "name": "A", "climate": "arid", "population": "100", "url": "https://swapi.dev/api/planets/1/"},
+            {**sample_planet_payload, "name": "B", "climate": "arid", "population": "300", "url": "https://swapi.dev/api/planets/2/"},
+            {**sample_planet_payload, "name": "C", "climate": "frozen", "population": "unknown", "url": "https://swapi.dev/api/planets/3/"},
+            {**sample_planet_payload, "name": "D", "climate": "temperate", "population": "1,000", "url": "https://swapi.dev/api/planets/4/"},
+        ],
+    }
+
+
+class TestStatsEndpoints:
+    """Test suite for /stats/{resource}."""
+
+    def test_group_by_climate(self, client, mock_requests_get, planets_page):
+        """Test population aggregated by climate."""
+        mock_requests_get.return_value.json.return_value = planets_page
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        response = client.get("/stats/planets?fields=population&group_by=climate&percentiles=50")
+
+        assert response.status_code == 200
+        groups = {group["key"]: group for group in response.json()["groups"]}
+        assert groups["arid"]["rows"] == 2
+        assert groups["arid"]["fields"]["population"] == {
+            "count": 2, "sum": 400, "mean": 200, "min": 100, "max": 300, "p50": 200,
+        }
+        assert groups["frozen"]["fields"]["population"]["count"] == 0
+        assert groups["frozen"]["fields"]["population"]["mean"] is None
+
+    def test_results_follow_data_version(self, client, mock_requests_get, planets_page):
+        """Test that cached results are replaced when the data changes."""
+        mock_requests_get.return_value.json.return_value = planets_page
+        mock_requests_get.return_value.raise_for_status = Mock()
+        first = client.get("/stats/planets?fields=population&metrics=sum").json()
+
+        from app.application.services.base_service import BaseSwapiService
+        BaseSwapiService._cache.clear()
+        planets_page["results"][0] = {**planets_page["results"][0], "population": "900", "edited": "2015-01-01"}
+        second = client.get("/stats/planets?fields=population&metrics=sum").json()
+
+        assert first["groups"][0]["fields"]["population"]["sum"] == 1400
+        assert second["groups"][0]["fields"]["population"]["sum"] == 2200
+        assert first["version"] != second["version"]
+
+    def test_cached_results_are_bounded(self, client, mock_requests_get, planets_page, monkeypatch):
+        """Test that arbitrary percentile combinations do not grow the result cache without limit."""
+        from app.application.services.stats.stats_service import StatsService
+        mock_requests_get.return_value.json.return_value = planets_page
+        mock_requests_get.return_value.raise_for_status = Mock()
+        monkeypatch.setattr(StatsService, "_snapshots", {})
+        monkeypatch.setattr(StatsService, "max_cached_results", 3)
+
+        for percentile in range(1, 11):
+            assert client.get(f"/stats/planets?fields=population&percentiles={percentile}").status_code == 200
+
+        assert len(StatsService._snapshots["planets"][2]) == 3
+
+    def test_unknown_resource_returns_404(self, client):
+        """Test that only SWAPI resources are accepted."""
+        assert client.get("/stats/droids").status_code == 404
+
+    def test_invalid_field_returns_400(self, client, mock_requests_get, planets_page):
+        """Test validation of numeric fields and group_by."""
+        mock_requests_get.return_value.json.return_value = planets_page
+        mock_requests_get.return_value.raise_for_status = Mock()
+
+        assert client.get("/stats/planets?fields=name").status_code == 400
+        assert client.get("/stats/planets?group_by=population").status_code == 400
@@ -0,0 +1,94 @@
+"""Tests for the local SWAPI emulator and the services running against it over HTTP."""
+
+import pytest
+import requests
+
+from app.application.services.dataset.dataset_service import DatasetService
+from app.application.services.people.people_service import PeopleService
+from app.domain.keys.resource_key import DEFAULT_SWAPI_API_ROOT, api_root, set_api_root
+from app.interfaces.query_params.people.people_query_params import PeopleQueryParams
+from benchmarks.swapi_stub import StubConfig, SwapiStub
+
+
+@pytest.fixture
+def stub():
+    """A running stub with SWAPI URLs pointed at it."""
+    previous = api_root()
+    with SwapiStub() as server:
+        set_api_root(server.base_url)
+        yield server
+    set_api_root(previous or DEFAULT_SWAPI_API_ROOT)
+
+
+class TestSwapiStub:
+    """Test suite for the SWAPI stub server."""
+
+    def test_pagination_follows_swapi(self, stub):
+        """Test page size, next/previous links and out-of-range pages."""
+        first = requests.get(f"{stub.base_url}people/", timeout=5).json()
+        last = requests.get(f"{stub.base_url}people/", params={"page": 9}, timeout=5).json()
+
+        assert first["count"] == 82 and len(first["results"]) == 10
+        assert first["next"] == f"{stub.base_url}people/?page=2" and first["previous"] is None
+        assert len(last["results"]) == 2 and last["next"] is None
+        assert requests.get(f"{stub.base_url}people/", params={"page": 10}, timeout=5).status_code == 404
+
+    def test_search_and_detail(self, stub):
+        """Test case-insensitive search and detail lookups with links back to the stub."""
+        found = requests.get(f"{stub.base_url}films/", params={"search": "FILM 3"}, timeout=5).json()
+        detail = requests.get(f"{stub.base_url}planets/4/", timeout=5).json()
+
+        assert [film["title"] for film in found["results"]] == ["Film 3"]
+        assert detail["url"] == f"{stub.base_url}planets/4/"
+        assert all(link.startswith(stub.base_url) for link in detail["residents"])
+        assert requests.get(f"{stub.base_url}planets/61/", timeout=5).status_code == 404
+
+    def test_faults_are_deterministic(self):
+        """Test that the same seed throttles and fails the same requests."""
+        config = StubConfig(seed=7, error_rate=0.2, throttle_rate=0.2)
+
+        def _statuses():
+            with SwapiStub(config) as server:
+                responses = [requests.get(f"{server.base_url}films/1/", timeout=5) for _ in range(30)]
+                return [response.status_code for response in responses], server.stats()
+
+        statuses, stats = _statuses()
+        assert statuses == _statuses()[0]
+        assert {200, 429, 500} <= set(statuses)
+        assert stats["requests"] == 30
+        assert stats["by_status"]["429"] == statuses.count(429)
+
+    def test_throttled_response_has_retry_after(self):
+        """Test the 429 shape."""
+        with SwapiStub(StubConfig(throttle_rate=1.0, retry_after_seconds=3)) as server:
+            response = requests.get(f"{server.base_url}people/1/", timeout=5)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "3"
+
+    def test_runtime_configuration(self, stub):
+        """Test the control endpoints."""
+        response = requests.post(f"{stub.base_url.replace('/api/', '/_stub/config')}", json={"error_rate": 1.0}, timeout=5)
+
+        assert response.status_code == 200
+        assert requests.get(f"{stub.base_url}films/1/", timeout=5).status_code == 500
+        assert requests.post(stub.base_url.replace("/api/", "/_stub/config"), json={"bogus": 1}, timeout=5).status_code == 400
+
+
+class TestServicesAgainstStub:
+    """The gateway services over real sockets and threads."""
+
+    async def test_collect_all_reads_every_page(self, stub):
+        """Test that the parallel page fetch returns the whole resource once."""
+        people = await DatasetService().collect_all("people")
+
+        assert len(people) == 82
+        assert stub.stats()["requests"] == 9
+
+    async def test_hydration_resolves_links_through_the_stub(self, stub):
+        """Test a hydrated lookup whose relation URLs point at the stub."""
+        entities = await PeopleService().create_entities(f"{stub.base_url}people/1/", PeopleQueryParams(films=True))
+
+        assert entities[0].name == "Person 1"
+        assert all(film.title.startswith("Film ") for film in entities[0].films)
+        assert stub.stats()["requests"] == 1 + len(entities[0].films)
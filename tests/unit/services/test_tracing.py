@@ -0,0 +1,89 @@
+"""Unit tests for the spans emitted while serving requests."""
+
+import pytest
+
+from app.infrastructure.tracing.tracer import InMemorySpanExporter, SpanKind, tracer
+
+
+@pytest.fixture
+def spans():
+    """Enables tracing into an in-memory exporter for one test."""
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(None)
+
+
+@pytest.fixture
+def routed_film(route_swapi, sample_film_payload, sample_person_payload):
+    """Serves one film and any person it links to."""
+    return route_swapi(lambda url, params: sample_film_payload if "/films/" in url else sample_person_payload)
+
+
+def _by_name(finished, name):
+    return [span for span in finished if span.name == name]
+
+
+class TestRequestTracing:
+    """Test suite for request, hydration and payload spans."""
+
+    def test_no_traceparent_when_tracing_is_off(self, client, routed_film):
+        """Test that untraced responses are left untouched."""
+        response = client.get("/films/?id=1")
+
+        assert response.status_code == 200
+        assert "traceparent" not in response.headers
+
+    def test_request_produces_a_waterfall(self, client, routed_film, spans):
+        """Test the span tree of a hydrated lookup from a cold cache."""
+        response = client.get("/films/?id=1&characters=true")
+
+        assert response.status_code == 200
+        finished = spans.get_finished_spans()
+        server = _by_name(finished, "GET /films/")[0]
+        assert server.kind == SpanKind.SERVER
+        assert server.attributes["http.response.status_code"] == 200
+        assert response.headers["traceparent"] == server.traceparent
+
+        create = _by_name(finished, "FilmsService.create_entities")[0]
+        assert create.parent_id == server.span_id
+        assert create.attributes["swapi.resource"] == "films"
+
+        hydrate = _by_name(finished, "FilmsService._hydrate_film_entity")[0]
+        group = _by_name(finished, "hydrate characters")[0]
+        assert group.parent_id == hydrate.span_id
+        assert group.attributes["swapi.related_count"] == 2
+
+        # As buscas dos personagens rodam em threads do executor, mas continuam no mesmo trace
+        lookups = [span for span in _by_name(finished, "swapi.resolve_payload") if span.parent_id == group.span_id]
+        assert len(lookups) == 2
+        assert all(span.trace_id == server.trace_id for span in finished)
+        assert all(span.attributes["swapi.source"] == "upstream" for span in lookups)
+
+        fetches = _by_name(finished, "GET swapi")
+        assert len(fetches) == 3
+        assert {span.parent_id for span in fetches} <= {span.span_id for span in _by_name(finished, "swapi.resolve_payload")}
+        assert all(span.attributes["http.response.status_code"] == 200 for span in fetches)
+
+    def test_cached_lookups_are_marked_as_hits(self, client, routed_film, spans):
+        """Test that a warm request records cache hits and no upstream spans."""
+        client.get("/films/?id=1&characters=true")
+        spans.clear()
+
+        client.get("/films/?id=1&characters=true")
+
+        finished = spans.get_finished_spans()
+        lookups = _by_name(finished, "swapi.resolve_payload")
+        assert len(lookups) == 3
+        assert all(span.attributes["swapi.cache_hit"] is True for span in lookups)
+        assert _by_name(finished, "GET swapi") == []
+
+    def test_incoming_trace_is_continued(self, client, routed_film, spans):
+        """Test that the server span joins the caller's trace."""
+        incoming = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        client.get("/films/?id=1", headers={"traceparent": incoming})
+
+        server = _by_name(spans.get_finished_spans(), "GET /films/")[0]
+        assert server.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert server.parent_id == "00f067aa0ba902b7"
@@ -254,39 +254,35 @@ class TestVehiclesService:
 
         assert params is None
 
-    def test_order_entities_ascending(self, sample_vehicle_payload):
-        """Test ordering entities in ascending order."""
-        from app.domain.entities.vehicles.vehicles_entity import VehicleEntity
-
+    def test_select_payloads_order_ascending(self, sample_vehicle_payload):
+        """Test ordering payloads in ascending order."""
         service = VehiclesService()
-        entities = [
-            VehicleEntity(name="C Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
-            VehicleEntity(name="A Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
-            VehicleEntity(name="B Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_vehicle_payload, "name": "C Vehicle"},
+            {**sample_vehicle_payload, "name": "A Vehicle"},
+            {**sample_vehicle_payload, "name": "B Vehicle"},
         ]
 
-        ordered = service._order_entities(entities, "asc")
-
-        assert ordered[0].name == "A Vehicle"
-        assert ordered[1].name == "B Vehicle"
-        assert ordered[2].name == "C Vehicle"
+        ordered = service._select_payloads(payloads, VehiclesQueryParams(order="asc"))
 
-    def test_order_entities_descending(self, sample_vehicle_payload):
-        """Test ordering entities in descending order."""
-        from app.domain.entities.vehicles.vehicles_entity import VehicleEntity
+        assert ordered[0]["name"] == "A Vehicle"
+        assert ordered[1]["name"] == "B Vehicle"
+        assert ordered[2]["name"] == "C Vehicle"
 
+    def test_select_payloads_order_descending(self, sample_vehicle_payload):
+        """Test ordering payloads in descending order."""
         service = VehiclesService()
-        entities = [
-            VehicleEntity(name="A Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
-            VehicleEntity(name="C Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
-            VehicleEntity(name="B Vehicle", **{k: v for k, v in sample_vehicle_payload.items() if k != 'name'}),
+        payloads = [
+            {**sample_vehicle_payload, "name": "A Vehicle"},
+            {**sample_vehicle_payload, "name": "C Vehicle"},
+            {**sample_vehicle_payload, "name": "B Vehicle"},
         ]
 
-        ordered = service._order_entities(entities, "desc")
+        ordered = service._select_payloads(payloads, VehiclesQueryParams(order="desc"))
 
-        assert ordered[0].name == "C Vehicle"
-        assert ordered[1].name == "B Vehicle"
-        assert ordered[2].name == "A Vehicle"
+        assert ordered[0]["name"] == "C Vehicle"
+        assert ordered[1]["name"] == "B Vehicle"
+        assert ordered[2]["name"] == "A Vehicle"
 
     def test_instance_payload(self, sample_vehicle_payload):
         """Test creating VehicleDTO from payload."""
@@ -0,0 +1,177 @@
+"""Unit tests for the startup cache warm-up and the hot-key re-warm."""
+
+import asyncio
+import threading
+import time
+
+
+import pytest
+
+from app.application.services.warmup.warmup_service import WarmupService
+from app.config.configuration import load_configuration
+
+
+@pytest.fixture
+def routed_swapi(route_swapi, sample_planet_payload, sample_person_payload, sample_film_payload):
+    """Serves the planets list and the details its relations point to, tracking concurrency."""
+    state = {"active": 0, "peak": 0, "delay": 0.0}
+    lock = threading.Lock()
+    routes = {
+        "https://swapi.dev/api/planets/": {"count": 1, "next": None, "results": [sample_planet_payload]},
+        "https://swapi.dev/api/films/": {"count": 1, "next": None, "results": [sample_film_payload]},
+        "https://swapi.dev/api/people/1/": sample_person_payload,
+        "https://swapi.dev/api/people/2/": {**sample_person_payload, "name": "C-3PO", "url": "https://swapi.dev/api/people/2/"},
+        "https://swapi.dev/api/films/1/": sample_film_payload,
+        "https://swapi.dev/api/planets/1/": sample_planet_payload,
+    }
+
+    def _track(url):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(state["delay"])
+        with lock:
+            state["active"] -= 1
+
+    routed = route_swapi(routes, on_request=_track)
+    routed.state = state
+    return routed
+
+
+def _requested(mock_get):
+    return [call.args[0] for call in mock_get.call_args_list]
+
+
+class TestWarmupService:
+    """Test suite for WarmupService."""
+
+    def test_warm_seeds_items_and_fetches_relationship_closure(self, client, routed_swapi):
+        """Test that list items are cached without detail calls and related items are prefetched."""
+        count = asyncio.run(WarmupService().warm(["planets"], include_relations=True, concurrency=2))
+
+        assert count == 4
+        assert sorted(_requested(routed_swapi)) == [
+            "https://swapi.dev/api/films/1/",
+            "https://swapi.dev/api/people/1/",
+            "https://swapi.dev/api/people/2/",
+            "https://swapi.dev/api/planets/",
+        ]
+
+        routed_swapi.reset_mock()
+        response = client.get("/planets/?id=1&residents=true")
+
+        assert response.status_code == 200
+        assert response.json()[0]["name"] == "Tatooine"
+        routed_swapi.assert_not_called()
+
+    def test_warm_without_relations_skips_closure(self, routed_swapi):
+        """Test that relationship closures are only fetched when enabled."""
+        asyncio.run(WarmupService().warm(["planets"], include_relations=False))
+
+        assert _requested(routed_swapi) == ["https://swapi.dev/api/planets/"]
+
+    def test_warm_respects_concurrency_limit(self, routed_swapi):
+        """Test that at most `concurrency` upstream requests run at once."""
+        routed_swapi.state["delay"] = 0.02
+
+        asyncio.run(WarmupService().warm(["planets"], concurrency=1))
+
+        assert routed_swapi.state["peak"] == 1
+
+    def test_warm_limits_page_fetches_too(self, routed_swapi):
+        """Test that list pages of several resources share the same concurrency limit."""
+        routed_swapi.state["delay"] = 0.02
+
+        asyncio.run(WarmupService().warm(["planets", "films"], include_relations=False, concurrency=1))
+
+        assert sorted(_requested(routed_swapi)) == ["https://swapi.dev/api/films/", "https://swapi.dev/api/planets/"]
+        assert routed_swapi.state["peak"] == 1
+
+    def test_warm_survives_upstream_failures(self, mock_requests_get):
+        """Test that a failing resource is skipped instead of aborting the warm-up."""
+        mock_requests_get.side_effect = RuntimeError("SWAPI indisponível")
+
+        assert asyncio.run(WarmupService().warm(["planets"])) == 0
+
+    def test_rewarm_refreshes_hottest_keys(self, client, routed_swapi):
+        """Test that the most requested keys are refetched before they expire."""
+        for _ in range(3):
+            client.get("/planets/?id=1")
+        client.get("/people/?id=2")
+        routed_swapi.reset_mock()
+
+        refreshed = asyncio.run(WarmupService().rewarm(limit=1, horizon_seconds=3600))
+
+        assert refreshed == 1
+        assert _requested(routed_swapi) == ["https://swapi.dev/api/planets/1/"]
+
+    def test_rewarm_skips_keys_far_from_expiry(self, client, routed_swapi):
+        """Test that hot keys with plenty of TTL left are not refetched."""
+        client.get("/planets/?id=1")
+        routed_swapi.reset_mock()
+
+        refreshed = asyncio.run(WarmupService().rewarm(limit=10, horizon_seconds=1))
+
+        assert refreshed == 0
+        routed_swapi.assert_not_called()
+
+    def test_rewarm_leaves_expired_keys_to_clients(self, client, routed_swapi):
+        """Test that hot keys already gone from the cache are not refetched in the background."""
+        client.get("/planets/?id=1")
+        WarmupService._cache.clear()
+        routed_swapi.reset_mock()
+
+        assert asyncio.run(WarmupService().rewarm(limit=10, horizon_seconds=3600)) == 0
+        routed_swapi.assert_not_called()
+
+    def test_wait_ready_stops_at_budget(self, routed_swapi):
+        """Test that readiness does not wait for a warm-up slower than the budget."""
+        routed_swapi.state["delay"] = 0.3
+
+        async def _start():
+            service = WarmupService()
+            tasks = service.start({
+                "warmup_enabled": True,
+                "warmup_resources": ("planets",),
+                "rewarm_interval_seconds": 0,
+            })
+            started = time.perf_counter()
+            ready = await service.wait_ready(tasks[0], 0.05)
+            elapsed = time.perf_counter() - started
+            await tasks[0]
+            return ready, elapsed, len(tasks)
+
+        ready, elapsed, task_count = asyncio.run(_start())
+
+        assert ready is False
+        assert elapsed < 0.25
+        assert task_count == 1
+
+    def test_disabled_warmup_schedules_nothing(self):
+        """Test that no background task is created when warm-up is disabled."""
+        assert WarmupService().start({"warmup_enabled": False}) == []
+
+
+class TestWarmupConfiguration:
+    """Test suite for the warm-up settings."""
+
+    def test_warmup_is_opt_in(self, monkeypatch):
+        """Test that warm-up (and with it the re-warm) is off unless enabled."""
+        monkeypatch.delenv("SWAPI_WARMUP_ENABLED", raising=False)
+
+        assert load_configuration()["warmup_enabled"] is False
+
+    def test_configuration_reads_environment(self, monkeypatch):
+        """Test that warm-up settings come from environment variables."""
+        monkeypatch.setenv("SWAPI_WARMUP_ENABLED", "false")
+        monkeypatch.setenv("SWAPI_WARMUP_RESOURCES", "films, planets")
+        monkeypatch.setenv("SWAPI_WARMUP_CONCURRENCY", "0")
+        monkeypatch.setenv("SWAPI_WARMUP_BUDGET_SECONDS", "1.5")
+
+        configuration = load_configuration()
+
+        assert configuration["warmup_enabled"] is False
+        assert configuration["warmup_resources"] == ("films", "planets")
+        assert configuration["warmup_concurrency"] == 1
+        assert configuration["warmup_budget_seconds"] == 1.5
+        assert configuration["rewarm_interval_seconds"] < 300